@@ -4,22 +4,56 @@ Maia: Distributed algorithms and manipulations over CGNS meshes
 
 __version__ = '1.3'
 
-import Pypdm.Pypdm as PDM
-
-pdm_has_parmetis = PDM.pdm_has_parmetis
-pdm_has_ptscotch = PDM.pdm_has_ptscotch
-npy_pdm_gnum_dtype = PDM.npy_pdm_gnum_dtype
-pdma_enabled = PDM.pdm_has_pdma
-
-from maia import algo
-from maia import factory
-from maia import io
-from maia import pytree
-from maia import transfer
-from maia import utils
+import sys
+import importlib
 
 # Change the default Python handling of uncaught exceptions
 # By default, if one proc raises an uncaught exception, it may lead to deadlocks
-# With `enable_mpi_excepthook`, if one proc raises an uncaught exception, MPI_Abort(1) is called
-from maia.utils.parallel import excepthook
-excepthook.enable_mpi_excepthook()
+# With this hook, if one proc raises an uncaught exception, MPI_Abort(1) is called
+# (see maia.excepthook to disable it). MPI is not loaded by the hook : programs which
+# did not initialize MPI keep the default behaviour
+_sys_excepthook = sys.excepthook
+def _mpi_excepthook(type, value, traceback):
+  MPI = sys.modules.get('mpi4py.MPI')
+  if MPI is None or not MPI.Is_initialized() or MPI.Is_finalized():
+    return _sys_excepthook(type, value, traceback)
+
+  rank = MPI.COMM_WORLD.Get_rank()
+  err_mssg = f"Your application aborted because of an uncaught exception on rank {rank}:\n\n"
+
+  sys.stderr.write(err_mssg)
+  _sys_excepthook(type, value, traceback)
+  sys.stderr.write('\n')
+  sys.stdout.flush()
+  sys.stderr.flush()
+
+  MPI.COMM_WORLD.Abort(1)
+
+sys.excepthook = _mpi_excepthook
+
+# Subpackages and ParaDiGM related attributes are loaded at first access (PEP 562),
+# so that importing a lightweight part of maia (eg. maia.pytree) does not
+# import ParaDiGM, MPI and all the algorithms
+_submodules = ['algo', 'factory', 'io', 'pytree', 'transfer', 'utils']
+
+_pdm_attributes = {
+  'pdm_has_parmetis'   : 'pdm_has_parmetis',
+  'pdm_has_ptscotch'   : 'pdm_has_ptscotch',
+  'npy_pdm_gnum_dtype' : 'npy_pdm_gnum_dtype',
+  'pdma_enabled'       : 'pdm_has_pdma',
+}
+
+def __getattr__(name):
+  if name in _submodules:
+    return importlib.import_module(f'{__name__}.{name}')
+  if name == 'excepthook':
+    return importlib.import_module(f'{__name__}.utils.parallel.excepthook')
+  if name in _pdm_attributes:
+    import Pypdm.Pypdm as PDM
+    value = getattr(PDM, _pdm_attributes[name])
+    globals()[name] = value
+    return value
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+  return sorted(set(globals()) | set(_submodules) | set(_pdm_attributes) | {'excepthook'})
@@ -1,12 +1,18 @@
+import os
 import time
+import shutil
+import tempfile
 import subprocess
 from pathlib import Path
+from contextlib import contextmanager
+
+import mpi4py.MPI as MPI
 
 import maia
 import maia.pytree        as PT
 import maia.utils.logging as mlog
 
-from maia.io.meshb_converter import cgns_to_meshb, meshb_to_cgns, get_tree_info
+import maia.io.meshb_converter as MBC
 from maia.algo.dist.matching_jns_tools import add_joins_donor_name, get_matching_jns
 from maia.algo.dist.adaptation_utils import convert_vtx_gcs_as_face_bcs,\
                                             deplace_periodic_patch,\
@@ -14,32 +20,52 @@ from maia.algo.dist.adaptation_utils import convert_vtx_gcs_as_face_bcs,\
                                             rm_feflo_added_elt
 
 
-# TMP directory
-tmp_repo   = Path('TMP_adapt_repo')
-
-# INPUT files
-in_file_meshb = tmp_repo / 'mesh.mesh'
-in_file_solb  = tmp_repo / 'metric.sol'
-in_file_fldb  = tmp_repo / 'field.sol'
-in_files = {'mesh': in_file_meshb,
-            'sol' : in_file_solb ,
-            'fld' : in_file_fldb }
-
-mesh_back_file = tmp_repo / 'mesh_back.mesh'
-
-# OUTPUT files
-out_file_meshb = tmp_repo / 'mesh.o.mesh'
-out_file_solb  = tmp_repo / 'mesh.o.sol'
-out_file_fldb  = tmp_repo / 'field.itp.sol'
-out_files = {'mesh': out_file_meshb,
-             'sol' : out_file_solb ,
-             'fld' : out_file_fldb }
-
-# Feflo files arguments
-feflo_args    = { 'isotrop'  : f"-iso               ".split(),
-                  'from_fld' : f"-sol {in_file_solb}".split(),
-                  'from_hess': f"-met {in_file_solb}".split()
-}
+def _default_scratch_root(comm):
+  """
+  Return the default root of the scratch directories : the node-local tmpfs if all the
+  ranks of comm share the same node (since the files are read by all the ranks),
+  and the current directory otherwise.
+  """
+  node_comm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+  is_single_node = node_comm.Get_size() == comm.Get_size()
+  node_comm.Free()
+  shm = Path('/dev/shm')
+  if is_single_node and shm.is_dir() and os.access(shm, os.W_OK):
+    return shm
+  return Path('.')
+
+@contextmanager
+def _scratch_files(comm, scratch_dir=None):
+  """
+  Context manager creating a unique scratch directory for one adaptation call,
+  and removing it at the exit. Yields the input and output meshb files.
+  """
+  root = _default_scratch_root(comm) if scratch_dir is None else Path(scratch_dir)
+  if comm.Get_rank() == 0:
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_repo = tempfile.mkdtemp(prefix='maia_adapt_', dir=root)
+  else:
+    tmp_repo = None
+  tmp_repo = Path(comm.bcast(tmp_repo, root=0))
+
+  in_files  = {'mesh': tmp_repo / 'mesh.meshb',
+               'sol' : tmp_repo / 'metric.solb',
+               'fld' : tmp_repo / 'field.solb'}
+  out_files = {'mesh': tmp_repo / 'mesh.o.meshb',
+               'sol' : tmp_repo / 'mesh.o.solb',
+               'fld' : tmp_repo / 'field.itp.solb'}
+  try:
+    yield in_files, out_files
+  except BaseException:
+    # Other ranks may never reach this point : do not synchronize. The directory
+    # is owned by rank 0, which removes it only if it fails itself ; on the other
+    # ranks, the files are left to rank 0
+    if comm.Get_rank() == 0:
+      shutil.rmtree(tmp_repo, ignore_errors=True)
+    raise
+  comm.barrier()
+  if comm.Get_rank() == 0:
+    shutil.rmtree(tmp_repo, ignore_errors=True)
 
 
 def unpack_metric(dist_tree, metric_paths):
@@ -79,44 +105,48 @@ def unpack_metric(dist_tree, metric_paths):
   return metric_nodes
 
 
-def _adapt_mesh_with_feflo(dist_tree, metric, comm, container_names, constraints, feflo_opts):
-  tmp_repo.mkdir(exist_ok=True)
+def _adapt_mesh_with_feflo(dist_tree, metric, comm, container_names, constraints, feflo_opts, scratch_dir=None):
 
   # > Get metric nodes
   metric_nodes = unpack_metric(dist_tree, metric)
   metric_type = {0: 'isotrop', 1: 'from_fld', 6: 'from_hess'}[len(metric_nodes)]
 
   # > Get tree structure and names
-  tree_info = get_tree_info(dist_tree, container_names)
+  tree_info = MBC.get_tree_info(dist_tree, container_names)
   tree_info = comm.bcast(tree_info, root=0)
   input_base = PT.get_child_from_label(dist_tree, 'CGNSBase_t')
   input_zone = PT.get_child_from_label(input_base, 'Zone_t')
 
+  with _scratch_files(comm, scratch_dir) as (in_files, out_files):
 
-  # > CGNS to meshb conversion
-  if comm.Get_rank()==0:
-    constraint_tags = cgns_to_meshb(dist_tree, in_files, metric_nodes, container_names, constraints)
+    # > CGNS to meshb conversion
+    constraint_tags = MBC.cgns_to_meshb(dist_tree, in_files, metric_nodes, container_names, constraints, comm)
 
-    # Adapt with feflo
-    feflo_itp_args = f'-itp {in_file_fldb}'.split() if len(container_names)!=0 else []
-    feflo_command  = ['feflo.a', '-in', str(in_files['mesh'])] + feflo_args[metric_type] + feflo_itp_args + feflo_opts.split()        
-    if len(constraint_tags['FaceCenter'])!=0:
-      feflo_command  = feflo_command + ['-adap-surf-ids'] + [','.join(constraint_tags['FaceCenter'])]#[str(tag) for tag in constraint_tags['FaceCenter']]
-    if len(constraint_tags['EdgeCenter'])!=0:
-      feflo_command  = feflo_command + ['-adap-line-ids'] + [','.join(constraint_tags['EdgeCenter'])]#[str(tag) for tag in constraint_tags['EdgeCenter']]
-    feflo_command  = ' '.join(feflo_command) # Split + join to remove useless spaces
+    if comm.Get_rank()==0:
+      # Adapt with feflo
+      feflo_args     = { 'isotrop'  : "-iso".split(),
+                         'from_fld' : f"-sol {in_files['sol']}".split(),
+                         'from_hess': f"-met {in_files['sol']}".split()
+      }
+      feflo_itp_args = f"-itp {in_files['fld']}".split() if len(container_names)!=0 else []
+      feflo_command  = ['feflo.a', '-in', str(in_files['mesh'])] + feflo_args[metric_type] + feflo_itp_args + feflo_opts.split()        
+      if len(constraint_tags['FaceCenter'])!=0:
+        feflo_command  = feflo_command + ['-adap-surf-ids'] + [','.join(constraint_tags['FaceCenter'])]#[str(tag) for tag in constraint_tags['FaceCenter']]
+      if len(constraint_tags['EdgeCenter'])!=0:
+        feflo_command  = feflo_command + ['-adap-line-ids'] + [','.join(constraint_tags['EdgeCenter'])]#[str(tag) for tag in constraint_tags['EdgeCenter']]
+      feflo_command  = ' '.join(feflo_command) # Split + join to remove useless spaces
 
-    mlog.info(f"Start mesh adaptation using Feflo...")
-    start = time.time()
-    
-    subprocess.run(feflo_command, shell=True)
+      mlog.info(f"Start mesh adaptation using Feflo...")
+      start = time.time()
+      
+      subprocess.run(feflo_command, shell=True)
 
-    end = time.time()
-    mlog.info(f"Feflo mesh adaptation completed ({end-start:.2f} s)")
+      end = time.time()
+      mlog.info(f"Feflo mesh adaptation completed ({end-start:.2f} s)")
 
 
-  # > Get adapted dist_tree
-  adapted_dist_tree = meshb_to_cgns(out_files, tree_info, comm)
+    # > Get adapted dist_tree
+    adapted_dist_tree = MBC.meshb_to_cgns(out_files, tree_info, comm)
 
   # > Set names and copy base data
   adapted_base = PT.get_child_from_label(adapted_dist_tree, 'CGNSBase_t')
@@ -140,7 +170,7 @@ def _adapt_mesh_with_feflo(dist_tree, metric, comm, container_names, constraints
 
   return adapted_dist_tree
 
-def _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo_opts):
+def _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo_opts, scratch_dir=None):
   '''
   Assume that : 
     - Only one Element node for each dimension
@@ -202,8 +232,7 @@ def _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo
 
 
   mlog.info(f"[Periodic adaptation] Step #2: First adaptation constraining periodic patches boundaries...")
-  maia.algo.dist.redistribute_tree(tree, 'gather.0', comm)
-  tree = _adapt_mesh_with_feflo(tree, metric, comm, container_names, bcs_to_constrain, feflo_opts)
+  tree = _adapt_mesh_with_feflo(tree, metric, comm, container_names, bcs_to_constrain, feflo_opts, scratch_dir)
 
 
   mlog.info(f"[Periodic adaptation] #3: Removing initial domain...")
@@ -218,8 +247,7 @@ def _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo
 
   mlog.info(f"[Periodic adaptation] #4: Perform last adaptation constraining periodicities...")
   gc_constraints = [PT.path_tail(gc_path) for pair in perio_jns_pairs for gc_path in pair]
-  maia.algo.dist.redistribute_tree(tree, 'gather.0', comm)
-  tree = _adapt_mesh_with_feflo(tree, metric, comm, container_names, gc_constraints, feflo_opts)
+  tree = _adapt_mesh_with_feflo(tree, metric, comm, container_names, gc_constraints, feflo_opts, scratch_dir)
 
 
   # > Retrieve periodicities + cleaning file
@@ -255,7 +283,8 @@ def _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo
 
 
 
-def adapt_mesh_with_feflo(dist_tree, metric, comm, container_names=[], constraints=None, periodic=False, feflo_opts=""):
+def adapt_mesh_with_feflo(dist_tree, metric, comm, container_names=[], constraints=None, periodic=False, feflo_opts="",
+                          scratch_dir=None):
   """Run a mesh adaptation step using *Feflo.a* software.
 
   Important:
@@ -298,6 +327,14 @@ def adapt_mesh_with_feflo(dist_tree, metric, comm, container_names=[], constrain
   Periodic mesh adaptation is available by activating the ``periodic`` argument. Information from 
   periodic 1to1 GridConnectivity_t nodes in dist_tree will be used to perform mesh adaptation.
 
+  **Intermediate files**
+
+  Meshb files exchanged with Feflo are written in a unique directory created for each call
+  under ``scratch_dir``, and removed at the end of the call. By default, the node-local
+  tmpfs (``/dev/shm``) is used if all the processes of ``comm`` run on the same node, and
+  the current directory otherwise. Since the adapted mesh is read by all the processes,
+  ``scratch_dir`` must be reachable from each of them.
+
   Args:
     dist_tree      (CGNSTree)    : Distributed tree to be adapted. Only U-Elements
       single zone trees are managed.
@@ -307,12 +344,14 @@ def adapt_mesh_with_feflo(dist_tree, metric, comm, container_names=[], constrain
     constraints    (list of str) : BC names of entities that must not be adapted (default to None)
     periodic       (boolean)     : perform periodic mesh adaptation
     feflo_opts (str)             : Additional arguments passed to Feflo
+    scratch_dir    (str)         : Directory in which the intermediate meshb files are written (see above)
   Returns:
     CGNSTree: Adapted mesh (distributed)
 
   Warning:
     Although this function interface is parallel, keep in mind that Feflo.a is a sequential tool.
-    Input tree is thus internally gathered to a single process, which can cause memory issues on large cases.
+    Input tree is not gathered : each process writes its distributed data in the binary meshb
+    files. The adapted mesh is then read in parallel.
 
   Example:
       .. literalinclude:: snippets/test_algo.py
@@ -322,15 +361,9 @@ def adapt_mesh_with_feflo(dist_tree, metric, comm, container_names=[], constrain
   """
 
   if periodic:
-    adapted_dist_tree = _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo_opts)
+    adapted_dist_tree = _adapt_mesh_with_feflo_perio(dist_tree, metric, comm, container_names, feflo_opts, scratch_dir)
   else:
-    # > Gathering dist_tree on proc 0
-    maia.algo.dist.redistribute_tree(dist_tree, 'gather.0', comm) # Modifie le dist_tree
-
-    adapted_dist_tree = _adapt_mesh_with_feflo(dist_tree, metric, comm, container_names, constraints, feflo_opts)
+    adapted_dist_tree = _adapt_mesh_with_feflo(dist_tree, metric, comm, container_names, constraints, feflo_opts, scratch_dir)
     PT.rm_nodes_from_name_and_label(adapted_dist_tree, 'maia_topo','FlowSolution_t')
 
-    # > Recover original dist_tree
-    maia.algo.dist.redistribute_tree(dist_tree, 'uniform', comm)
-
   return adapted_dist_tree
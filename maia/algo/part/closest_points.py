@@ -5,7 +5,7 @@ import Pypdm.Pypdm as PDM
 import maia.pytree        as PT
 
 from maia.utils                  import py_utils, np_utils
-from maia.factory.dist_from_part import get_parts_per_blocks
+import maia.factory.dist_from_part as DFP
 
 from .point_cloud_utils import get_shifted_point_clouds
 
@@ -94,9 +94,9 @@ def find_closest_points(src_tree, tgt_tree, location, comm):
         :end-before: #find_closest_points@end
         :dedent: 2
   """
-  _src_parts_per_dom = get_parts_per_blocks(src_tree, comm)
+  _src_parts_per_dom = DFP.get_parts_per_blocks(src_tree, comm)
   src_parts_per_dom = list(_src_parts_per_dom.values())
-  tgt_parts_per_dom = list(get_parts_per_blocks(tgt_tree, comm).values())
+  tgt_parts_per_dom = list(DFP.get_parts_per_blocks(tgt_tree, comm).values())
 
   closest_data = _find_closest_points(src_parts_per_dom, tgt_parts_per_dom, location, location, comm)
 
@@ -9,7 +9,7 @@ import maia.pytree.maia   as MT
 from maia.utils                  import py_utils, np_utils
 from maia.utils                  import logging as mlog
 from maia.transfer               import utils as te_utils
-from maia.factory.dist_from_part import get_parts_per_blocks
+import maia.factory.dist_from_part as DFP
 
 from .import point_cloud_utils as PCU
 from .import multidom_gnum     as MDG
@@ -265,8 +265,8 @@ def interpolate_from_part_trees(src_tree, tgt_tree, comm, containers_name, locat
         :end-before: #interpolate_from_part_trees@end
         :dedent: 2
   """
-  src_parts_per_dom = list(get_parts_per_blocks(src_tree, comm).values())
-  tgt_parts_per_dom = list(get_parts_per_blocks(tgt_tree, comm).values())
+  src_parts_per_dom = list(DFP.get_parts_per_blocks(src_tree, comm).values())
+  tgt_parts_per_dom = list(DFP.get_parts_per_blocks(tgt_tree, comm).values())
 
   interpolate_from_parts_per_dom(src_parts_per_dom, tgt_parts_per_dom, comm, containers_name, location, **options)
 
@@ -276,8 +276,8 @@ def create_interpolator_from_part_trees(src_tree, tgt_tree, comm, src_location,
   of doing interpolations. Interpolator can be called multiple time to exchange
   fields without recomputing the src_to_tgt indirection (geometry must remain the same).
   """
-  src_parts_per_dom = list(get_parts_per_blocks(src_tree, comm).values())
-  tgt_parts_per_dom = list(get_parts_per_blocks(tgt_tree, comm).values())
+  src_parts_per_dom = list(DFP.get_parts_per_blocks(src_tree, comm).values())
+  tgt_parts_per_dom = list(DFP.get_parts_per_blocks(tgt_tree, comm).values())
 
   src_to_tgt = create_src_to_tgt(src_parts_per_dom, tgt_parts_per_dom, comm, src_location, location, **options)
   return Interpolator(src_parts_per_dom, tgt_parts_per_dom, src_to_tgt, src_location, location, comm)
@@ -8,7 +8,7 @@ import maia.pytree.maia   as MT
 from maia                        import npy_pdm_gnum_dtype as pdm_gnum_dtype
 from maia.utils                  import py_utils, np_utils, par_utils
 from maia.transfer               import utils as te_utils
-from maia.factory.dist_from_part import get_parts_per_blocks
+import maia.factory.dist_from_part as DFP
 
 from .point_cloud_utils import get_shifted_point_clouds
 
@@ -165,9 +165,9 @@ def localize_points(src_tree, tgt_tree, location, comm, **options):
         :end-before: #localize_points@end
         :dedent: 2
   """
-  _src_parts_per_dom = get_parts_per_blocks(src_tree, comm)
+  _src_parts_per_dom = DFP.get_parts_per_blocks(src_tree, comm)
   src_parts_per_dom = list(_src_parts_per_dom.values())
-  tgt_parts_per_dom = list(get_parts_per_blocks(tgt_tree, comm).values())
+  tgt_parts_per_dom = list(DFP.get_parts_per_blocks(tgt_tree, comm).values())
 
   located_data = _localize_points(src_parts_per_dom, tgt_parts_per_dom, location, comm, **options)
 
@@ -3,7 +3,7 @@ import numpy as np
 import maia
 import maia.pytree as PT
 
-from maia.factory.dist_from_part import get_parts_per_blocks
+import maia.factory.dist_from_part as DFP
 
 from . import multidom_gnum
 from . import connectivity_utils
@@ -20,7 +20,7 @@ class CenterToNode:
     self.vtx_cell     = []
     self.vtx_cell_idx = []
 
-    parts_per_dom = get_parts_per_blocks(tree, comm)
+    parts_per_dom = DFP.get_parts_per_blocks(tree, comm)
     vtx_gnum_shifted = multidom_gnum.get_mdom_gnum_vtx(parts_per_dom, comm, cross_domain)
 
     gnum_list   = []
@@ -7,11 +7,11 @@ import Pypdm.Pypdm as PDM
 
 import maia.pytree        as PT
 import maia.pytree.maia   as MT
+import maia.factory.dist_from_part as DFP
 
 from maia.utils                      import np_utils
 from maia.utils                      import logging as mlog
 from maia                            import transfer as TE
-from maia.factory.dist_from_part     import discover_nodes_from_matching
 
 from .point_cloud_utils              import get_point_cloud
 from maia.algo.part.extract_boundary import extract_surf_from_bc
@@ -266,13 +266,14 @@ class WallDistance:
 
     #Get a skeleton tree including only Base, Zones
     skeleton_tree = PT.new_CGNSTree()
-    discover_nodes_from_matching(skeleton_tree, [self.part_tree], 'CGNSBase_t/Zone_t', self.mpi_comm,
+    DFP.discover_nodes_from_matching(skeleton_tree, [self.part_tree], 'CGNSBase_t/Zone_t', self.mpi_comm,
         merge_rule = lambda path: MT.conv.get_part_prefix(path))
 
     # Group partitions by original dist domain
+    parts_per_block = tr_utils.get_partitioned_zones_per_block(self.part_tree)
     parts_per_dom = list()
     for zone_path in PT.predicates_to_paths(skeleton_tree, 'CGNSBase_t/Zone_t'):
-      parts_per_dom.append(TE.utils.get_partitioned_zones(self.part_tree, zone_path))
+      parts_per_dom.append(parts_per_block.get(zone_path, []))
     assert len(parts_per_dom) >= 1
     
         
@@ -284,8 +285,8 @@ class WallDistance:
       # Recover existing periodicities
       for dist_zone_path in PT.predicates_to_paths(skeleton_tree, 'CGNSBase_t/Zone_t'):
         dist_zone = PT.get_node_from_path(skeleton_tree, dist_zone_path)
-        part_zones = tr_utils.get_partitioned_zones(self.part_tree, dist_zone_path)
-        discover_nodes_from_matching(dist_zone, part_zones, gc_predicate, self.mpi_comm,
+        part_zones = parts_per_block.get(dist_zone_path, [])
+        DFP.discover_nodes_from_matching(dist_zone, part_zones, gc_predicate, self.mpi_comm,
           child_list=['GridConnectivityProperty_t', 'GridConnectivityType_t'],
           merge_rule=lambda path: MT.conv.get_split_prefix(path), get_value='leaf')
 
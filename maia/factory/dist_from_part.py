@@ -74,9 +74,10 @@ def get_parts_per_blocks(part_tree, comm):
   dist_doms = PT.new_CGNSTree()
   discover_nodes_from_matching(dist_doms, [part_tree], 'CGNSBase_t/Zone_t', comm,
                                     merge_rule=lambda zpath : MT.conv.get_part_prefix(zpath))
+  local_parts_per_dom = tr_utils.get_partitioned_zones_per_block(part_tree)
   parts_per_dom = dict()
   for zone_path in PT.predicates_to_paths(dist_doms, 'CGNSBase_t/Zone_t'):
-    parts_per_dom[zone_path] = tr_utils.get_partitioned_zones(part_tree, zone_path)
+    parts_per_dom[zone_path] = local_parts_per_dom.get(zone_path, [])
   return parts_per_dom
 
 def _get_joins_dist_tree(parts_per_dom, comm):
@@ -303,10 +304,11 @@ def recover_dist_tree(part_tree, comm):
 
   _recover_base_iterative_data(dist_tree, part_tree, comm)
 
+  parts_per_block = tr_utils.get_partitioned_zones_per_block(part_tree)
   for dist_zone_path in PT.predicates_to_paths(dist_tree, 'CGNSBase_t/Zone_t'):
     dist_zone = PT.get_node_from_path(dist_tree, dist_zone_path)
 
-    part_zones = tr_utils.get_partitioned_zones(part_tree, dist_zone_path)
+    part_zones = parts_per_block.get(dist_zone_path, [])
 
     discover_nodes_from_matching(dist_zone, part_zones, "ZoneIterativeData_t/*", 
                                  comm, get_value="all")
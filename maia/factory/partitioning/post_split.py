@@ -241,10 +241,11 @@ def post_partitioning(dist_tree, part_tree, comm):
   dist_zones     = PT.get_all_Zone_t(dist_tree)
   all_part_zones = PT.get_all_Zone_t(part_tree)
   parts_prefix    = [MT.conv.get_part_prefix(PT.get_name(zone)) for zone in all_part_zones]
+  parts_per_block = maia.transfer.utils.get_partitioned_zones_per_block(part_tree)
   for dist_zone_path in PT.predicates_to_paths(dist_tree, 'CGNSBase_t/Zone_t'):
     # Recover matching zones
     dist_zone  = PT.get_node_from_path(dist_tree, dist_zone_path)
-    part_zones = maia.transfer.utils.get_partitioned_zones(part_tree, dist_zone_path)
+    part_zones = parts_per_block.get(dist_zone_path, [])
 
     # Create point list
     pl_paths = ['ZoneBC_t/BC_t', 'ZoneBC_t/BC_t/BCDataSet_t', 'ZoneSubRegion_t', 
@@ -267,7 +268,7 @@ def post_partitioning(dist_tree, part_tree, comm):
   split_original_joins(part_tree)
   for dist_zone_path in PT.predicates_to_paths(dist_tree, 'CGNSBase_t/Zone_t'):
     dist_zone  = PT.get_node_from_path(dist_tree, dist_zone_path)
-    part_zones = maia.transfer.utils.get_partitioned_zones(part_tree, dist_zone_path)
+    part_zones = parts_per_block.get(dist_zone_path, [])
     for part_zone in part_zones:
       generate_related_zsr(dist_zone, part_zone) # Make BC_ZSR and GC_ZSR
   update_gc_donor_name(part_tree, comm)
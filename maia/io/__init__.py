@@ -1,7 +1,10 @@
 from .cgns_io_tree import file_to_dist_tree, \
                           dist_tree_to_file, \
+                          dist_tree_to_file_async, \
+                          fill_dist_tree, \
                           read_tree, \
                           read_links, \
+                          load_lazy_arrays, release_lazy_arrays, close_lazy_reader, \
                           write_tree, write_trees
 
 from .part_tree import save_part_tree as part_tree_to_file
@@ -1,11 +1,18 @@
+import os
+import time
+import itertools
+import numpy as np
 from mpi4py import MPI
 from h5py   import h5p, h5f, h5fd
 
 import maia.pytree as PT
+import maia.utils.logging as mlog
+from maia.utils import par_utils
 
-from .hdf._hdf_cgns import open_from_path,\
-                           load_tree_partial, write_tree_partial,\
+from .hdf._hdf_cgns import HDF5PathCache,\
+                           load_tree_partial, load_nodes_partial, write_tree_partial, append_tree_partial,\
                            load_data_partial, write_data_partial,\
+                           create_data, slab_chunk_dims, fill_data_partial, find_compression,\
                            load_tree_links, write_link
 from .fix_tree      import fix_point_ranges, corr_index_range_names,\
                            ensure_symmetric_gc1to1, rm_legacy_nodes,\
@@ -29,10 +36,66 @@ def load_data(names, labels):
       return False
   return True
 
+def _create_mpi_info(hints):
+  """ Create a MPI.Info object from a dict of MPI-IO hints (such as
+  romio_cb_read or cb_nodes). Return MPI.INFO_NULL if hints is empty """
+  if not hints:
+    return MPI.INFO_NULL
+  info = MPI.Info.Create()
+  for key, value in hints.items():
+    info.Set(str(key), str(value))
+  return info
+
+def open_mpio(filename, mode, comm, hints=None):
+  """ Open an existing file with the MPIO driver. Aggregation hints
+  are forwarded to the MPI-IO layer """
+  fapl = h5p.create(h5p.FILE_ACCESS)
+  fapl.set_driver(h5fd.MPIO)
+  fapl.set_fapl_mpio(comm, _create_mpi_info(hints))
+  return h5f.open(bytes(filename, 'utf-8'), mode, fapl)
+
+def create_xfer_plist(collective):
+  """ Create a dataset transfer property list using collective or
+  independent MPI-IO transfers """
+  xfer_plist = h5p.create(h5p.DATASET_XFER)
+  if collective:
+    xfer_plist.set_dxpl_mpio(h5fd.MPIO_COLLECTIVE)
+  else:
+    xfer_plist.set_dxpl_mpio(h5fd.MPIO_INDEPENDENT)
+  return xfer_plist
+
 def load_size_tree(filename, comm):
+  """ Load on all ranks the size tree (see load_tree_partial).
+  Rank 0 reads the top of the skeleton (zones excepted) and broadcasts the
+  paths of the zones, which are distributed over the ranks; each rank reads the
+  skeleton of its zones independently. Zones are then gathered on rank 0, which
+  applies the fix_tree passes on the merged tree and broadcasts it.
+  The links met during the walk are stored in the :CGNS#Links node of the size tree
+  (see add_links_info).  """
+  start = time.time()
+
+  links = []
+  if comm.Get_rank() == 0:
+    explore_predicate = lambda names, labels: labels[-1] != 'Zone_t'
+    size_tree = load_tree_partial(filename, load_data, explore_predicate, links=links)
+    zone_paths = PT.predicates_to_paths(size_tree, 'CGNSBase_t/Zone_t')
+  else:
+    zone_paths = None
+  zone_paths = comm.bcast(zone_paths, root=0)
+
+  distri = par_utils.uniform_distribution(len(zone_paths), comm)
+  my_zone_paths = zone_paths[distri[0]:distri[1]]
+  if len(my_zone_paths) > 0:
+    my_zones = load_nodes_partial(filename, my_zone_paths, load_data, links)
+  else:
+    my_zones = []
+  all_zones_links = comm.gather((my_zones, links), root=0)
 
   if comm.Get_rank() == 0:
-    size_tree = load_tree_partial(filename, load_data)
+    all_zones = itertools.chain.from_iterable(zones for zones, _ in all_zones_links)
+    for zone_path, zone in zip(zone_paths, all_zones):
+      PT.get_node_from_path(size_tree, zone_path)[2] = PT.get_children(zone)
+
     rm_legacy_nodes(size_tree)
     corr_index_range_names(size_tree)
     check_datasize(size_tree)
@@ -41,60 +104,234 @@ def load_size_tree(filename, comm):
     if PT.get_node_from_predicates(size_tree, pred_1to1) is not None:
       ensure_symmetric_gc1to1(size_tree)
     add_missing_pr_in_bcdataset(size_tree)
+    add_links_info(size_tree, itertools.chain.from_iterable(links for _, links in all_zones_links))
   else:
     size_tree = None
 
   size_tree = comm.bcast(size_tree, root=0)
 
+  end = time.time()
+  mlog.stat(f"[load_size_tree] Skeleton of {len(zone_paths)} zones loaded on {comm.Get_size()} ranks "
+            f"({end-start:.2f} s, {len(my_zone_paths)} zones read by current rank)")
+
   return size_tree
 
-def load_partial(filename, dist_tree, hdf_filter):
-  fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDONLY)
+def add_links_info(tree, links):
+  """ Register in a :CGNS#Links node of tree the links of the file it has been read
+  from, so that they do not need to be searched again in the file (see get_links_info).
+  Duplicated links and links found below another link (which are resolved
+  from the linked file) are skipped.  """
+  links = {link[3] : link for link in links}
+  is_nested = lambda path: any(path.startswith(other + '/') for other in links)
+  PT.rm_children_from_name(tree, ':CGNS#Links')
+  links_node = PT.new_node(':CGNS#Links', 'UserDefinedData_t', parent=tree)
+  for i, path in enumerate(sorted(path for path in links if not is_nested(path))):
+    PT.new_node(f'Link.{i}', 'DataArray_t', links[path], parent=links_node)
 
-  for path, filter in hdf_filter.items():
-    if isinstance(filter, (list, tuple)):
+def get_links_info(tree):
+  """ Return the links registered in tree by add_links_info, or None if tree
+  has no :CGNS#Links node.  """
+  links_node = PT.get_child_from_name(tree, ':CGNS#Links')
+  if links_node is None:
+    return None
+  return [PT.get_value(link) for link in PT.get_children(links_node)]
+
+def _link_file_path(filename, target_dir, target_file):
+  """ Return the path of the target file of a link found in filename. As HDF5 does,
+  relative paths are first searched from the directory of filename, then from the
+  current directory """
+  if os.path.isabs(target_file):
+    return target_file
+  candidate = os.path.normpath(os.path.join(os.path.dirname(filename), target_dir, target_file))
+  return candidate if os.path.exists(candidate) else target_file
+
+def resolve_links(filename, paths, links):
+  """ Find, for each of the given paths of the file filename, the file and the path
+  where the node is actually stored, using the links description returned by load_tree_links.
+  Targets are returned grouped by file : {file : {path : target_path}}.
+  Only the links of filename are resolved; links embedded in linked files are
+  followed by HDF5 when opening the nodes.  """
+  links = sorted(links, key=lambda link: len(link[3]), reverse=True) # Deepest links first
+  targets = {}
+  for path in paths:
+    target_file, target_path = filename, path
+    for target_dir, link_file, link_path, local_path in links:
+      if path == local_path or path.startswith(local_path + '/'):
+        target_file = _link_file_path(filename, target_dir, link_file)
+        target_path = link_path.strip('/') + path[len(local_path):]
+        break
+    targets.setdefault(target_file, {})[path] = target_path
+  return targets
+
+def load_partial(filename, dist_tree, hdf_filter, comm=None, hints=None, links=None):
+  """ Load the arrays described by hdf_filter in dist_tree.
+  If comm is None, each rank opens the file with the default driver and reads
+  its slabs independently. Otherwise, the file is opened with the MPIO driver
+  on comm and the reads are collective (two-phase IO); in this case, all the ranks
+  of comm must call this function with the same hdf_filter keys.
+  If the links of the file are provided (see load_tree_links), arrays stored in
+  linked files are read directly from these files : each file is opened once, and
+  all the reads targeting it are done together.  """
+  paths = [path for path, filter in hdf_filter.items() if isinstance(filter, (list, tuple))]
+  if links:
+    targets_per_file = resolve_links(filename, paths, links)
+  else:
+    targets_per_file = {filename : {path : path for path in paths}}
+
+  for target_file, targets in targets_per_file.items():
+    if comm is None:
+      fid = h5f.open(bytes(target_file, 'utf-8'), h5f.ACC_RDONLY)
+      xfer_plist = None
+    else:
+      fid = open_mpio(target_file, h5f.ACC_RDONLY, comm, hints)
+      xfer_plist = create_xfer_plist(collective=True)
+
+    nodes_cache = HDF5PathCache(fid)
+    for path, target_path in targets.items():
       node = PT.get_node_from_path(dist_tree, path) 
-      gid = open_from_path(fid, path)
-      node[1] = load_data_partial(gid, filter)
+      gid = nodes_cache.open(target_path)
+      node[1] = load_data_partial(gid, hdf_filter[path], xfer_plist)
+      gid.close()
 
-def write_partial(filename, dist_tree, hdf_filter, comm):
+    nodes_cache.close()
+    fid.close()
 
-  if comm.Get_rank() == 0:
-    write_tree_partial(dist_tree, filename, load_data)
-  comm.barrier()
+def _get_path_labels(tree, path):
+  """ Return the labels of the nodes found along the given path """
+  node, labels = tree, []
+  for name in path.split('/'):
+    node = PT.get_child_from_name(node, name)
+    labels.append(PT.get_label(node))
+  return labels
 
-  fapl = h5p.create(h5p.FILE_ACCESS)
-  fapl.set_driver(h5fd.MPIO)
-  fapl.set_fapl_mpio(comm, MPI.Info())
-  fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR, fapl)
+def _common_slab_dims(hdf_filter, comm):
+  """ Return, for each array of hdf_filter, the (C ordered) periods of the boundaries
+  of the slabs of all the ranks of comm (see slab_chunk_dims). Chunking the datasets
+  with these dimensions (or divisors of them) ensures that each chunk is written by a
+  single rank; note that uneven distributions lead to small chunks """
+  paths = sorted(hdf_filter)
+  rank_slab_dims = [slab_chunk_dims(hdf_filter[path]) for path in paths]
+  flat_dims = np.array([dim for dims in rank_slab_dims for dim in dims], dtype=np.int64)
+  all_flat_dims = np.empty((comm.Get_size(), flat_dims.size), dtype=np.int64)
+  comm.Allgather(flat_dims, all_flat_dims)
+  flat_dims = np.gcd.reduce(all_flat_dims, axis=0)
+  offsets = np.cumsum([0] + [len(dims) for dims in rank_slab_dims])
+  return {path: [int(dim) for dim in flat_dims[start:end]] \
+      for path, start, end in zip(paths, offsets[:-1], offsets[1:])}
+
+def _create_datasets(filename, dist_tree, hdf_filter, compression=None, chunk_slab_dims=None):
+  """ Sequentially create (without filling them) the datasets described by
+  hdf_filter in an existing file. If provided, chunk_slab_dims gives for each
+  path the dimensions of the slab used to chunk compressed datasets """
+  fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR)
+  nodes_cache = HDF5PathCache(fid)
+  for path, filter in hdf_filter.items():
+    array = PT.get_node_from_path(dist_tree, path)[1]
+    options = find_compression(compression, path.split('/'), _get_path_labels(dist_tree, path))
+    gid = nodes_cache.open(path)
+    slab = chunk_slab_dims[path] if chunk_slab_dims is not None else None
+    create_data(gid, array.dtype, filter, options, slab)
+    gid.close()
+  nodes_cache.close()
+  fid.close()
+
+def _write_datasets(filename, dist_tree, hdf_filter, comm, collective, hints=None):
+  """ Write the slabs of the arrays described by hdf_filter in an existing
+  file, where datasets are already created if collective is True """
+  fid = open_mpio(filename, h5f.ACC_RDWR, comm, hints)
+  if collective:
+    xfer_plist = create_xfer_plist(collective=True)
+    write_data_func = fill_data_partial
+  else:
+    xfer_plist = create_xfer_plist(collective=False)
+    write_data_func = write_data_partial
 
+  nodes_cache = HDF5PathCache(fid)
   for path, filter in hdf_filter.items():
     array = PT.get_node_from_path(dist_tree, path)[1]
-    gid = open_from_path(fid, path)
-    write_data_partial(gid, array, filter)
+    gid = nodes_cache.open(path)
+    write_data_func(gid, array, filter, xfer_plist)
     gid.close()
   
+  nodes_cache.close()
   fid.close()
 
-def read_full(filename):
-  return load_tree_partial(filename, lambda X,Y: True)
+def write_partial(filename, dist_tree, hdf_filter, comm, collective=False, hints=None, compression=None):
+  """ Write the arrays of dist_tree described by hdf_filter in a new file.
+  Rank 0 first writes the skeleton of the tree. Then:
+  - if collective is False, all the datasets are created by all the ranks, and
+    each rank independently writes its slabs;
+  - if collective is True, rank 0 also creates all the datasets when writing the
+    skeleton; then, data are written using collective (two-phase) MPI-IO transfers.
+  In both cases, MPI-IO hints (eg. cb_nodes to control the number of aggregators
+  in collective mode) are forwarded to the MPIO driver.
+  Since parallel hdf5 only supports collective writes for filtered datasets,
+  collective mode is always used if compression is requested.
+  """
+  collective = collective or bool(compression)
+  # Chunks must be the same for all ranks : compute them from the slabs of all the ranks
+  chunk_slab_dims = _common_slab_dims(hdf_filter, comm) if compression else None
+  if comm.Get_rank() == 0:
+    write_tree_partial(dist_tree, filename, load_data)
+    if collective:
+      _create_datasets(filename, dist_tree, hdf_filter, compression, chunk_slab_dims)
+  comm.barrier()
+
+  _write_datasets(filename, dist_tree, hdf_filter, comm, collective, hints)
+
+def _missing_paths(filename, paths):
+  """ Return the paths which are not in the file filename, following the
+  links of the file to search the linked nodes in their target file """
+  targets = resolve_links(filename, paths, load_tree_links(filename))
+  missing = set()
+  for target_file, file_targets in targets.items():
+    fid = h5f.open(bytes(target_file, 'utf-8'), h5f.ACC_RDONLY)
+    missing.update(path for path, target_path in file_targets.items() if target_path.encode() not in fid)
+    fid.close()
+  return [path for path in paths if path in missing]
+
+def append_partial(filename, dist_tree, hdf_filter, comm, hints=None, compression=None):
+  """ Write the arrays of dist_tree described by hdf_filter in an existing file.
+  Rank 0 first adds to the file the nodes of the tree which do not exist yet,
+  and creates their datasets. Then, the data of these new datasets are written using
+  collective MPI-IO transfers. Nodes already present in the file are not modified.
+  """
+  chunk_slab_dims = _common_slab_dims(hdf_filter, comm) if compression else None
+  if comm.Get_rank() == 0:
+    new_paths = _missing_paths(filename, list(hdf_filter))
+    append_tree_partial(dist_tree, filename, load_data, compression)
+    _create_datasets(filename, dist_tree, {path: hdf_filter[path] for path in new_paths}, compression, chunk_slab_dims)
+  else:
+    new_paths = None
+  new_paths = comm.bcast(new_paths, root=0)
+
+  new_hdf_filter = {path: hdf_filter[path] for path in new_paths}
+  _write_datasets(filename, dist_tree, new_hdf_filter, comm, True, hints)
+
+def read_full(filename, lazy=False, mmap=False):
+  if lazy:
+    return load_tree_partial(filename, lambda X,Y: False, lazy=True, mmap=mmap)
+  return load_tree_partial(filename, lambda X,Y: True, mmap=mmap)
 
 def read_links(filename):
   return load_tree_links(filename)
 
-def write_full(filename, dist_tree, links=[]):
+def write_full(filename, dist_tree, links=[], compression=None):
   _dist_tree = PT.shallow_copy(dist_tree)
   for link in links: # Links override data, so delete data
     PT.rm_node_from_path(_dist_tree, link[3])
-  write_tree_partial(_dist_tree, filename, lambda X,Y: True)
+  write_tree_partial(_dist_tree, filename, lambda X,Y: True, compression)
 
   # Add links if any
   fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR)
+  nodes_cache = HDF5PathCache(fid)
   for link in links:
     target_dir, target_file, target_node, local_node = link
     parent_node_path = PT.path_head(local_node)
     local_node_name  = PT.path_tail(local_node)
-    gid = open_from_path(fid, parent_node_path)
+    gid = nodes_cache.open(parent_node_path)
     write_link(gid, local_node_name, target_file, target_node)
+    gid.close()
+  nodes_cache.close()
   fid.close()
 
@@ -1,5 +1,6 @@
 import os
 import time
+import threading
 import mpi4py.MPI as MPI
 
 import maia.pytree        as PT
@@ -7,10 +8,9 @@ import maia.pytree.maia   as MT
 import maia.utils.logging as mlog
 
 from .distribution_tree         import add_distribution_info, clean_distribution_info
-from .hdf.tree                  import create_tree_hdf_filter
+from .hdf.tree                  import create_tree_hdf_filter, select_hdf_filter
 from .fix_tree                  import ensure_PE_global_indexing, ensure_signed_nface_connectivity, _enforce_pdm_dtype
 
-from maia.factory     import full_to_dist
 from maia.pytree.yaml import parse_yaml_cgns
 
 def load_size_tree(filename, comm, legacy=False):
@@ -20,28 +20,42 @@ def load_size_tree(filename, comm, legacy=False):
     from ._hdf_io_h5py import load_size_tree
   return load_size_tree(filename, comm)
 
-def load_partial(filename, dist_tree, hdf_filter, comm, legacy):
+def load_partial(filename, dist_tree, hdf_filter, comm, legacy, collective=False, hints=None, links=None):
   if legacy:
+    if collective:
+      raise NotImplementedError("collective read is only available with legacy=False")
     from ._hdf_io_cass import load_partial
     load_partial(filename, dist_tree, hdf_filter, comm)
   else:
     from ._hdf_io_h5py import load_partial
-    load_partial(filename, dist_tree, hdf_filter)
+    if collective:
+      load_partial(filename, dist_tree, hdf_filter, comm, hints, links=links)
+    else:
+      load_partial(filename, dist_tree, hdf_filter, links=links)
 
-def write_partial(filename, dist_tree, hdf_filter, comm, legacy):
+def write_partial(filename, dist_tree, hdf_filter, comm, legacy, collective=False, hints=None, compression=None,
+                  append=False):
   if legacy:
+    if collective or compression or append:
+      raise NotImplementedError("collective, compressed and append writes are only available with legacy=False")
     from ._hdf_io_cass import write_partial
+    write_partial(filename, dist_tree, hdf_filter, comm)
+  elif append:
+    from ._hdf_io_h5py import append_partial
+    append_partial(filename, dist_tree, hdf_filter, comm, hints, compression)
   else:
     from ._hdf_io_h5py import write_partial
-  write_partial(filename, dist_tree, hdf_filter, comm)
+    write_partial(filename, dist_tree, hdf_filter, comm, collective, hints, compression)
 
-def write_tree(tree, filename, links=[], legacy=False):
+def write_tree(tree, filename, links=[], legacy=False, compression=None):
   """Sequential write to a CGNS file.
 
   Args:
     tree (CGNSTree) : Tree to write
     filename (str) : Path of the file
     links   (list) : List of links to create (see SIDS-to-Python guide)
+    compression (dict, optional) : Chunking and compression of the arrays
+      (see :ref:`user_man_compression`). Defaults to None.
 
   Example:
       .. literalinclude:: snippets/test_io.py
@@ -49,17 +63,38 @@ def write_tree(tree, filename, links=[], legacy=False):
         :end-before: #write_tree@end
         :dedent: 2
   """
-  if legacy:
+  if os.path.splitext(filename)[1] == '.npz':
+    if links:
+      raise NotImplementedError("links can not be written in a .npz file")
+    PT.to_npz(tree, filename, compressed=bool(compression))
+  elif legacy:
+    if compression:
+      raise NotImplementedError("compressed write is only available with legacy=False")
     from ._hdf_io_cass import write_full
+    write_full(filename, tree, links=links)
   else:
     from ._hdf_io_h5py import write_full
-  write_full(filename, tree, links=links)
+    write_full(filename, tree, links=links, compression=compression)
 
-def read_tree(filename, legacy=False):
+def read_tree(filename, legacy=False, lazy=False, mmap=False):
   """Sequential load of a CGNS file. 
 
+  If ``lazy`` is True, the data of the largest arrays are not read: the
+  value of their nodes is a placeholder exposing the shape and the dtype of the
+  array, which reads the data and replaces itself by the numpy array when
+  the array is used. The file is opened at the first read, and remains open
+  until all the arrays are loaded. See :func:`load_lazy_arrays`,
+  :func:`release_lazy_arrays` and :func:`close_lazy_reader` to
+  explicitly manage the data of the tree and the file.
+
+  If ``mmap`` is True, the data of the DataArray_t nodes stored contiguously in
+  the file (ie. not chunked nor compressed) are not copied in memory: the
+  value of these nodes is a read-only ``numpy.memmap`` on the file.
+
   Args:
     filename (str) : Path of the file
+    lazy (bool, optional) : Defer the read of the arrays. Defaults to False.
+    mmap (bool, optional) : Map the contiguous arrays instead of reading them. Defaults to False.
   Returns:
     CGNSTree: Full (not distributed) CGNS tree
   """
@@ -67,12 +102,70 @@ def read_tree(filename, legacy=False):
     with open(filename, 'r') as f:
       tree = parse_yaml_cgns.to_cgns_tree(f)
     return tree
+  elif os.path.splitext(filename)[1] == '.npz':
+    return PT.from_npz(filename)
   else:
     if legacy:
+      if lazy or mmap:
+        raise NotImplementedError("lazy or mmap read is only available with legacy=False")
       from ._hdf_io_cass import read_full
+      return read_full(filename)
     else:
       from ._hdf_io_h5py import read_full
-    return read_full(filename)
+      return read_full(filename, lazy, mmap)
+
+def load_lazy_arrays(tree):
+  """Read the data of the arrays not yet loaded in a lazily read tree.
+
+  Lazy arrays found in the input tree (which can be any node of a tree
+  read with ``read_tree(..., lazy=True)``) are replaced by their data.
+
+  Args:
+    tree (CGNSTree) : Tree or subtree to load
+  """
+  from .hdf._hdf_cgns import HDF5LazyArray
+  is_lazy = lambda n: isinstance(n[1], HDF5LazyArray)
+  for node in PT.iter_nodes_from_predicate(tree, is_lazy, explore='deep'):
+    node[1].materialize()
+
+def release_lazy_arrays(tree):
+  """Release the data of the arrays loaded in a lazily read tree.
+
+  Arrays of the input tree (which can be any node of a tree read with
+  ``read_tree(..., lazy=True)``) which have been read from the file are replaced
+  by lazy arrays, so their memory can be freed. Arrays that have been
+  replaced in the tree since their read are kept.
+
+  Args:
+    tree (CGNSTree) : Tree or subtree to release
+  """
+  from .hdf._hdf_cgns import HDF5LazyReader
+  node_ids = {id(node) for node in PT.iter_nodes_from_predicate(tree, lambda n: True, explore='deep')}
+  for reader in list(HDF5LazyReader.instances):
+    for node_id in node_ids & reader.loaded.keys():
+      node, lazy_array = reader.loaded[node_id]
+      if node[1] is lazy_array._array:
+        lazy_array.release()
+      else:
+        reader.loaded.pop(node_id)
+
+def close_lazy_reader(tree):
+  """Close the file used to read the arrays not yet loaded in a lazily read tree.
+
+  The file is otherwise kept open until all the arrays of the tree are loaded.
+  Arrays of the input tree (which can be any node of a tree read with
+  ``read_tree(..., lazy=True)``) remain usable: the file is reopened if one of
+  them is read.
+
+  Args:
+    tree (CGNSTree) : Tree or subtree whose file must be closed
+  """
+  from .hdf._hdf_cgns import HDF5LazyArray
+  is_lazy = lambda n: isinstance(n[1], HDF5LazyArray)
+  readers = {id(node[1].reader) : node[1].reader for node in \
+      PT.iter_nodes_from_predicate(tree, is_lazy, explore='deep')}
+  for reader in readers.values():
+    reader.close()
 
 def read_links(filename, legacy=False):
   """Detect the links embedded in a CGNS file. 
@@ -91,13 +184,23 @@ def read_links(filename, legacy=False):
     from ._hdf_io_h5py import read_links
   return read_links(filename)
 
-def load_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy):
+def load_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy, collective=False, hints=None):
   """
   """
+  # > Links are registered in the tree when it comes from load_size_tree; otherwise
+  #   they are searched once, by the first rank
+  links = None
+  if not legacy:
+    from ._hdf_io_h5py import get_links_info
+    links = get_links_info(dist_tree)
+    if links is None:
+      links = read_links(filename) if comm.Get_rank() == 0 else None
+      links = comm.bcast(links, root=0)
+
   hdf_filter_with_dim  = {key: value for (key, value) in hdf_filter.items() \
       if isinstance(value, (list, tuple))}
 
-  load_partial(filename, dist_tree, hdf_filter_with_dim, comm, legacy)
+  load_partial(filename, dist_tree, hdf_filter_with_dim, comm, legacy, collective, hints, links)
 
   # > Match with callable
   hdf_filter_with_func = {key: value for (key, value) in hdf_filter.items() \
@@ -114,7 +217,7 @@ def load_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy):
       except RuntimeError: # Not ready yet
         pass
 
-    load_partial(filename, dist_tree, next_hdf_filter, comm, legacy)
+    load_partial(filename, dist_tree, next_hdf_filter, comm, legacy, collective, hints, links)
 
     hdf_filter_with_func = {key: value for (key, value) in next_hdf_filter.items() \
         if not isinstance(value, (list, tuple))}
@@ -129,7 +232,8 @@ def load_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy):
   if n_shifted > 0 and comm.Get_rank() == 0:
     mlog.warning(f"Some NFace/ElementConnectivity have been updated to be CGNS compliant")
 
-def save_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy):
+def save_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy, collective=False, hints=None, compression=None,
+                          append=False):
   """
   """
   hdf_filter_with_dim  = {key: value for (key, value) in hdf_filter.items() if isinstance(value, list)}
@@ -139,46 +243,95 @@ def save_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy):
   for key, f in hdf_filter_with_func.items():
     f(hdf_filter_with_dim)
 
-  #Dont save distribution info, but work on a copy to keep it for further use
+  #Dont save distribution and links info, but work on a copy to keep it for further use
   saving_dist_tree = PT.shallow_copy(dist_tree)
   clean_distribution_info(saving_dist_tree)
+  PT.rm_children_from_name(saving_dist_tree, ':CGNS#Links')
 
-  write_partial(filename, saving_dist_tree, hdf_filter_with_dim, comm, legacy)
+  write_partial(filename, saving_dist_tree, hdf_filter_with_dim, comm, legacy, collective, hints, compression, append)
 
-def fill_size_tree(tree, filename, comm, legacy=False):
+def fill_size_tree(tree, filename, comm, legacy=False, collective=False, hints=None, include=None, exclude=None):
   add_distribution_info(tree, comm)
-  hdf_filter = create_tree_hdf_filter(tree)
-  # Coords#Size appears in dict -> remove it
-  hdf_filter = {key:val for key,val in hdf_filter.items() if not key.endswith('#Size')}
+  fill_dist_tree(tree, filename, comm, include, exclude, legacy, collective, hints)
 
-  load_tree_from_filter(filename, tree, comm, hdf_filter, legacy)
-  PT.rm_nodes_from_name(tree, '*#Size')
+def fill_dist_tree(dist_tree, filename, comm, include=None, exclude=None, legacy=False, collective=False, hints=None):
+  """Distributed load of the arrays skipped by a previous selective read.
 
+  Arrays of the distributed tree whose data has not been read by a call to
+  :func:`file_to_dist_tree` using ``include`` or ``exclude`` queries are loaded
+  from the file, if they are selected by the new queries.
 
-def file_to_dist_tree(filename, comm, legacy=False):
+  Args:
+    dist_tree (CGNSTree) : Distributed tree, read from the file by :func:`file_to_dist_tree`
+    filename (str) : Path of the file
+    comm     (MPIComm) : MPI communicator
+    include (list of str, optional) : Queries selecting the arrays to load. Defaults to None (all arrays).
+    exclude (list of str, optional) : Queries selecting the arrays to skip. Defaults to None.
+    collective (bool, optional) : Use collective MPI-IO reads. Defaults to False.
+    hints (dict, optional) : MPI-IO hints used to open the file in collective mode.
+      Defaults to None.
+  """
+  filename = str(filename)
+  hdf_filter = create_tree_hdf_filter(dist_tree)
+  # Coords#Size appears in dict -> remove it. Also skip arrays already loaded
+  hdf_filter = {key:val for key,val in hdf_filter.items() if not key.endswith('#Size') \
+      and PT.get_value(PT.get_node_from_path(dist_tree, key)) is None}
+  hdf_filter, skipped_filter = select_hdf_filter(dist_tree, hdf_filter, include, exclude)
+
+  load_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy, collective, hints)
+
+  # Keep the #Size nodes of the skipped arrays, which are needed to load them later
+  skipped_size_nodes = []
+  for path in skipped_filter:
+    size_node = PT.get_node_from_path(dist_tree, f'{path}#Size')
+    if size_node is not None:
+      skipped_size_nodes.append((path.rsplit('/', 1)[0], size_node))
+  PT.rm_nodes_from_name(dist_tree, '*#Size')
+  for parent_path, size_node in skipped_size_nodes:
+    PT.add_child(PT.get_node_from_path(dist_tree, parent_path), size_node)
+  # Links are also kept as long as some arrays are to be loaded
+  if not skipped_size_nodes:
+    PT.rm_children_from_name(dist_tree, ':CGNS#Links')
+
+
+def file_to_dist_tree(filename, comm, legacy=False, collective=False, hints=None, include=None, exclude=None):
   """Distributed load of a CGNS file.
 
+  By default, each process opens the file and reads its data independently.
+  With ``collective=True``, the file is opened with the MPIO driver and
+  the data are read using collective (two-phase) MPI-IO transfers, which
+  reduces the pressure on parallel filesystems when many processes are used.
+
+  The arrays to read can be selected with ``include`` and ``exclude`` queries
+  (see :ref:`user_man_selective_read`). The nodes of the skipped arrays have
+  no value, and can be loaded afterward using :func:`fill_dist_tree`.
+
   Args:
     filename (str) : Path of the file
     comm     (MPIComm) : MPI communicator
+    collective (bool, optional) : Use collective MPI-IO reads. Defaults to False.
+    hints (dict, optional) : MPI-IO hints (eg. ``{'romio_cb_read' : 'enable', 'cb_nodes' : 16}``)
+      used to open the file in collective mode. Defaults to None.
+    include (list of str, optional) : Queries selecting the arrays to load. Defaults to None (all arrays).
+    exclude (list of str, optional) : Queries selecting the arrays to skip. Defaults to None.
   Returns:
     CGNSTree: Distributed CGNS tree
   """
   mlog.info(f"Distributed read of file {filename}...")
   start = time.time()
   filename = str(filename)
-  if os.path.splitext(filename)[1] == '.yaml':
+  if os.path.splitext(filename)[1] in ['.yaml', '.npz']:
+    from maia.factory import full_to_dist # Cyclic import
     if comm.Get_rank() == 0:
-      with open(filename, 'r') as f:
-        tree = parse_yaml_cgns.to_cgns_tree(f)
-        _enforce_pdm_dtype(tree)  
+      tree = read_tree(filename)
+      _enforce_pdm_dtype(tree)  
     else:
       tree = None
     dist_tree = full_to_dist.full_to_dist_tree(tree, comm, owner=0)
 
   else:
     dist_tree = load_size_tree(filename, comm, legacy)
-    fill_size_tree(dist_tree, filename, comm, legacy)
+    fill_size_tree(dist_tree, filename, comm, legacy, collective, hints, include, exclude)
 
   end = time.time()
   dt_size     = sum(MT.metrics.dtree_nbytes(dist_tree))
@@ -188,13 +341,34 @@ def file_to_dist_tree(filename, comm, legacy=False):
             f" (Σ={mlog.bsize_to_str(all_dt_size)})")
   return dist_tree
 
-def dist_tree_to_file(dist_tree, filename, comm, legacy=False):
+def dist_tree_to_file(dist_tree, filename, comm, legacy=False, collective=False, hints=None, n_aggregators=None,
+                      compression=None, append=False):
   """Distributed write to a CGNS file.
 
+  By default, each process writes its data independently.
+  With ``collective=True``, all the datasets are created at once with the
+  skeleton of the tree, and the data are written using collective (two-phase)
+  MPI-IO transfers. In this mode, the number of processes gathering the data
+  before writing them to the filesystem can be set with ``n_aggregators``.
+
+  With ``append=True``, the tree is added to an existing file: only the
+  nodes which are not already in the file are created, and the data of the new
+  arrays are written collectively. Existing nodes are left unchanged, which
+  allows for example to add a new FlowSolution to a file without rewriting the mesh.
+
   Args:
     dist_tree (CGNSTree) : Distributed tree to write
     filename (str) : Path of the file
     comm     (MPIComm) : MPI communicator
+    collective (bool, optional) : Use collective MPI-IO writes. Defaults to False.
+    hints (dict, optional) : MPI-IO hints used to open the file. Defaults to None.
+    n_aggregators (int, optional) : Number of aggregator processes used in collective mode
+      (shortcut for the ``cb_nodes`` hint). Ignored, with a warning, if the write is
+      not collective. Defaults to None (MPI-IO default).
+    compression (dict, optional) : Chunking and compression of the arrays
+      (see :ref:`user_man_compression`). Implies collective mode. Defaults to None.
+    append (bool, optional) : Add the missing nodes to an existing file instead of
+      creating a new file. Implies collective mode. Defaults to False.
   """
   dt_size     = sum(MT.metrics.dtree_nbytes(dist_tree))
   all_dt_size = comm.allreduce(dt_size, MPI.SUM)
@@ -203,10 +377,84 @@ def dist_tree_to_file(dist_tree, filename, comm, legacy=False):
   start = time.time()
   filename = str(filename)
   hdf_filter = create_tree_hdf_filter(dist_tree)
-  save_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy)
+  if n_aggregators is not None:
+    if not (collective or compression or append) and comm.Get_rank() == 0:
+      mlog.warning(f"n_aggregators is only used by collective writes and has no effect "
+                   f"when writing {filename} with collective=False")
+    hints = {**(hints or {}), 'romio_cb_write' : 'enable', 'cb_nodes' : n_aggregators}
+  save_tree_from_filter(filename, dist_tree, comm, hdf_filter, legacy, collective, hints, compression, append)
   end = time.time()
   mlog.info(f"Write completed [{filename}] ({end-start:.2f} s)")
 
+class WriteRequest:
+  """Handle on a write started by :func:`dist_tree_to_file_async`.
+
+  The write is performed by a background thread, using a duplicate of the
+  communicator. Exceptions raised during the write are re-raised by :meth:`wait`.
+  """
+  def __init__(self, dist_tree, filename, comm, **kwargs):
+    self._error = None
+    if MPI.Query_thread() < MPI.THREAD_MULTIPLE:
+      if comm.Get_rank() == 0:
+        mlog.warning(f"MPI library is not initialized with MPI_THREAD_MULTIPLE support: "
+                     f"file {filename} is written synchronously")
+      self._comm = None
+      self._thread = None
+      dist_tree_to_file(dist_tree, filename, comm, **kwargs)
+    else:
+      self._comm = comm.Dup()
+      self._thread = threading.Thread(target=self._run, args=(dist_tree, filename, self._comm), kwargs=kwargs)
+      self._thread.start()
+
+  def _run(self, dist_tree, filename, comm, **kwargs):
+    try:
+      dist_tree_to_file(dist_tree, filename, comm, **kwargs)
+    except Exception as e:
+      self._error = e
+
+  def test(self):
+    """Return True if the write is completed on the current process."""
+    return self._thread is None or not self._thread.is_alive()
+
+  def wait(self):
+    """Block until the write is completed."""
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+    if self._comm is not None:
+      self._comm.Free()
+      self._comm = None
+    if self._error is not None:
+      error, self._error = self._error, None
+      raise error
+
+def dist_tree_to_file_async(dist_tree, filename, comm, copy=True, **kwargs):
+  """Non blocking distributed write to a CGNS file.
+
+  The write is performed in background, and the function returns a
+  :class:`WriteRequest`, whose method ``wait()`` must be called (by all the processes)
+  to complete the write. The method ``test()`` can be used to check if the write is over.
+
+  The structure of the tree is copied before the function returns, so nodes
+  can be added or removed from the tree during the write. If ``copy`` is
+  True, the arrays are also copied. Otherwise, the caller must not modify the
+  arrays of the tree until the write is completed.
+
+  Background writes require an MPI library supporting ``MPI_THREAD_MULTIPLE``;
+  otherwise, the write is performed before the function returns.
+
+  Args:
+    dist_tree (CGNSTree) : Distributed tree to write
+    filename (str) : Path of the file
+    comm     (MPIComm) : MPI communicator
+    copy (bool, optional) : Copy the arrays of the tree before writing them. Defaults to True.
+    **kwargs : Additional options forwarded to :func:`dist_tree_to_file`
+  Returns:
+    WriteRequest: Handle on the ongoing write
+  """
+  snapshot = PT.deep_copy(dist_tree) if copy else PT.shallow_copy(dist_tree)
+  return WriteRequest(snapshot, str(filename), comm, **kwargs)
+
 def write_trees(tree, filename, comm, legacy=False):
   """Sequential write to CGNS files.
 
@@ -5,7 +5,6 @@ import maia.pytree        as PT
 
 import maia
 from maia.utils            import np_utils, as_pdm_gnum, logging
-from maia.algo.dist import matching_jns_tools as MJT
 
 def check_datasize(tree):
   """
@@ -35,6 +34,7 @@ def fix_point_ranges(size_tree):
   a. be consistent with the transform node
   b. keep the symmetry PR|a->b = PRDonor|b->a
   """
+  from maia.algo.dist import matching_jns_tools as MJT # Cyclic import
   permuted = False
   gc_t_path = 'CGNSBase_t/Zone_t/ZoneGridConnectivity_t/GridConnectivity1to1_t'
   for base, zone, zgc, gc in PT.iter_children_from_predicates(size_tree, gc_t_path, ancestors=True):
@@ -76,6 +76,7 @@ def ensure_symmetric_gc1to1(tree):
   but we should correct theses to not rely anymore on this assumption (TODO).
 
   """
+  from maia.algo.dist import matching_jns_tools as MJT # Cyclic import
   some_switched = False
   
   # To be less expansive (in jn matching process) we work on a shallow copy having only 1to1 GC_t
@@ -177,7 +178,7 @@ def ensure_PE_global_indexing(dist_tree):
 
     ngon_n = ngon_nodes[0]
     ngon_pe_n = PT.get_child_from_name(ngon_n, 'ParentElements')
-    if ngon_pe_n:
+    if ngon_pe_n and ngon_pe_n[1] is not None: # PE can be skipped by a selective read
       n_faces = PT.Element.Size(ngon_n)
       ngon_pe = ngon_pe_n[1]
       if PT.Element.Range(ngon_n)[0] == 1 and ngon_pe.shape[0] > 0 and ngon_pe[0].max() <= n_faces:
@@ -196,6 +197,8 @@ def ensure_signed_nface_connectivity(dist_tree, comm):
     if PT.Zone.has_nface_elements(zone):
       nface = PT.Zone.NFaceNode(zone)
       nface_ec = PT.get_child_from_name(nface, 'ElementConnectivity')[1]
+      if nface_ec is None: # Connectivity can be skipped by a selective read
+        continue
       is_signed = nface_ec.size == 0 or np.any(nface_ec < 0)
       if PT.Element.Size(nface) > 1 and not comm.allreduce(is_signed, MPI.LAND):
         PT.rm_child(zone, nface)
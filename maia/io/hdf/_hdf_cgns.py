@@ -1,6 +1,10 @@
+import fnmatch
+import math
+import weakref
 import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
 import h5py
-from h5py import h5, h5a, h5d, h5f, h5g, h5p, h5s, h5t, h5o
+from h5py import h5, h5a, h5d, h5f, h5fd, h5g, h5i, h5p, h5s, h5t, h5o, h5z
 
 from maia.pytree.graph import algo
 from maia.pytree.graph.utils import list_iterator
@@ -17,6 +21,9 @@ DTYPE_TO_CGNSTYPE = {'int8'    : 'B1',
                      'float64' : 'R8',
                      'bytes8'  : 'C1'}
 
+LAZY_MIN_SIZE   = 1000  # Smaller arrays are always loaded when lazy loading is requested
+MAX_CHUNK_BYTES = 2**28 # Chunks can not exceed 4GiB, and too large chunks slow down partial reads
+
 class AttributeRW:
   """ A singleton class usefull to read & write hdf attribute w/ allocating buffers """
 
@@ -129,6 +136,223 @@ def open_from_path(fid, path, follow_links=True):
       gid = h5g.open(gid, b' link')
   return gid
 
+class HDF5PathCache:
+  """ A cache of the hdf nodes opened in the file fid, indexed by their path.
+  Opening a node reuses its already opened ancestors, and links are resolved only
+  once. Cached nodes stay open until close() is called, which must be done before
+  closing the file.  """
+  def __init__(self, fid, follow_links=True):
+    self.follow_links = follow_links
+    self.attr_reader = AttributeRW()
+    self.gids = {'' : h5g.open(fid, b'/')}
+
+  def _open_child(self, parent_id, name):
+    gid = h5g.open(parent_id, name.encode())
+    if self.follow_links and self.attr_reader.read_bytes_3(gid, b'type') == b'LK': #Follow link
+      gid = h5g.open(gid, b' link')
+    return gid
+
+  def _open_cached(self, path):
+    try:
+      return self.gids[path]
+    except KeyError:
+      parent_path, _, name = path.rpartition('/')
+      gid = self._open_child(self._open_cached(parent_path), name)
+      self.gids[path] = gid
+      return gid
+
+  def open(self, path):
+    """ Return the hdf node registred at the specified path (equivalent
+    to open_from_path). Ancestors of the node are cached, but not the node itself.  """
+    parent_path, _, name = path.rpartition('/')
+    return self._open_child(self._open_cached(parent_path), name)
+
+  def close(self):
+    """ Close all the cached nodes.  """
+    for gid in self.gids.values():
+      gid.close()
+    self.gids.clear()
+
+class HDF5LazyReader:
+  """ A read access to a file shared by the lazy arrays loaded from it.
+  The file is opened at the first read and is closed when all the lazy arrays
+  have been materialized, or when close() is called.
+  The reader also tracks the nodes whose lazy array have been materialized.  """
+  instances = weakref.WeakSet()
+
+  def __init__(self, filename, mmap=False):
+    self.filename = filename
+    self.mmap = mmap
+    self.fid = None
+    self.nodes_cache = None
+    self.n_arrays = 0 # Number of lazy arrays using this reader
+    self.loaded = {} # id(node) -> (node, lazy_array)
+    HDF5LazyReader.instances.add(self)
+
+  def read(self, path, kind):
+    """ Read and return the data of the node registred at path  """
+    if self.fid is None:
+      self.fid = h5f.open(bytes(self.filename, 'utf-8'), h5f.ACC_RDONLY)
+      self.nodes_cache = HDF5PathCache(self.fid)
+    gid = self.nodes_cache.open(path)
+    array = load_data(gid, self.mmap)
+    if kind == b'C1':
+      array.dtype = 'S1'
+    gid.close()
+    return array
+
+  def close(self):
+    """ Close the file. It will be reopened if another array is read.  """
+    if self.fid is not None:
+      self.nodes_cache.close()
+      self.fid.close()
+      self.fid = None
+
+class HDF5LazyArray(NDArrayOperatorsMixin):
+  """ A placeholder for the value of a node, whose data stay in the file until
+  they are needed. Shape and dtype are available without reading the file.
+  Any other access reads the data, and replaces the lazy array with the numpy
+  array in the node holding it.  """
+  def __init__(self, reader, path, kind, shape, dtype, node):
+    self.reader = reader
+    self.path   = path
+    self.kind   = kind
+    self.shape  = shape
+    self.dtype  = np.dtype('S1') if kind == b'C1' else dtype
+    self.node   = node
+    self._array = None
+    reader.n_arrays += 1
+
+  ndim   = property(lambda self: len(self.shape))
+  size   = property(lambda self: int(np.prod(self.shape)))
+  nbytes = property(lambda self: self.size * self.dtype.itemsize)
+
+  def materialize(self):
+    """ Return the numpy array, reading it if needed, and register it
+    in the node holding this lazy array.  """
+    if self._array is None:
+      self._array = self.reader.read(self.path, self.kind)
+    if self.node[1] is self:
+      self.node[1] = self._array
+      self.reader.loaded[id(self.node)] = (self.node, self)
+      if len(self.reader.loaded) == self.reader.n_arrays:
+        self.reader.close() # Nothing more to read
+    return self._array
+
+  def release(self):
+    """ Put back this lazy array in its node and forget the numpy array.  """
+    self.node[1] = self
+    self._array = None
+    self.reader.loaded.pop(id(self.node), None)
+
+  def __array__(self, dtype=None, copy=None):
+    array = self.materialize()
+    return array if dtype is None else array.astype(dtype)
+
+  def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+    inputs = tuple(x.materialize() if isinstance(x, HDF5LazyArray) else x for x in inputs)
+    return getattr(ufunc, method)(*inputs, **kwargs)
+
+  def __getitem__(self, key):
+    return self.materialize()[key]
+  def __setitem__(self, key, value):
+    self.materialize()[key] = value
+  def __len__(self):
+    return self.shape[0]
+  def __iter__(self):
+    return iter(self.materialize())
+
+  def __getattr__(self, name):
+    # Only called for attributes not defined above : forward to the numpy array
+    if name.startswith('__') or name in ['reader', 'node', '_array']:
+      raise AttributeError(name)
+    return getattr(self.materialize(), name)
+
+  def __repr__(self):
+    return f"HDF5LazyArray(shape={self.shape}, dtype={self.dtype}, path='{self.path}')"
+
+def find_compression(compression, names, labels):
+  """ Return the compression options to use for the node described by the
+  name and label of its ancestors, or None if no compression is requested.
+  Keys of the compression dict are either CGNS labels, which match if they appear
+  in the ancestors of the node, or path patterns (wildcards allowed) matching the
+  path of the node. Only DataArray_t and IndexArray_t nodes are compressed.  """
+  if not compression or labels[-1] not in ['DataArray_t', 'IndexArray_t']:
+    return None
+  path = '/'.join(names)
+  for key, options in compression.items():
+    if key in labels or fnmatch.fnmatchcase(path, key):
+      return options
+  return None
+
+def _largest_divisor(n, bound):
+  """ Return the largest divisor of n which is not greater than bound """
+  largest = 1
+  for d in range(1, math.isqrt(n) + 1):
+    if n % d == 0:
+      largest = max([largest] + [div for div in (d, n // d) if div <= bound])
+  return largest
+
+def compute_chunk_dims(glob_dims, slab_dims, itemsize):
+  """ Compute the (C ordered) dimensions of the chunks of a dataset of
+  dimensions glob_dims, such that the chunks are aligned on the slabs: slab_dims
+  gives for each dimension the period of the slab boundaries (see slab_chunk_dims),
+  0 meaning that the dimension is not bounded by the slabs.
+  Largest dimensions are split if the chunk exceeds MAX_CHUNK_BYTES; dimensions
+  bounded by the slabs are only reduced to a divisor of their period, so that
+  chunks stay aligned.
+  Return None for empty datasets, which can not be chunked.  """
+  if 0 in glob_dims:
+    return None
+  chunk_dims = [glob_dim if slab_dim == 0 else min(slab_dim, glob_dim) \
+      for slab_dim, glob_dim in zip(slab_dims, glob_dims)]
+  n_bytes = itemsize * int(np.prod(chunk_dims))
+  for axis in sorted(range(len(chunk_dims)), key=lambda axis: -chunk_dims[axis]):
+    if n_bytes <= MAX_CHUNK_BYTES:
+      break
+    other_bytes = n_bytes // chunk_dims[axis]
+    max_dim = max(1, MAX_CHUNK_BYTES // other_bytes)
+    if slab_dims[axis] == 0:
+      n_split = -(-chunk_dims[axis] // max_dim)
+      chunk_dims[axis] = -(-chunk_dims[axis] // n_split)
+    else:
+      chunk_dims[axis] = _largest_divisor(chunk_dims[axis], max_dim)
+    n_bytes = other_bytes * chunk_dims[axis]
+  return tuple(chunk_dims)
+
+def _check_filter_avail(filter_id):
+  if not h5z.filter_avail(filter_id):
+    raise ValueError(f"Filter {filter_id} is not available in the hdf5 library")
+
+def create_dc_plist(options, chunk_dims):
+  """ Create a dataset creation property list enabling chunking and the filters
+  described in the options dict. Supported keys are (filters are applied in this order):
+  - 'shuffle' (bool) : enable the shuffle filter
+  - 'gzip' (int) : enable the deflate filter with the given compression level
+  - 'szip' (str) : enable the szip filter with 'nn' or 'ec' coding
+  - 'filters' (list) : additional (filter_id, values) pairs, for any filter
+    registered in the hdf5 library.  """
+  unknown_keys = set(options.keys()) - {'shuffle', 'gzip', 'szip', 'filters'}
+  if unknown_keys:
+    raise ValueError(f"Unknown compression options {unknown_keys}")
+
+  dc_plist = h5p.create(h5p.DATASET_CREATE)
+  dc_plist.set_chunk(chunk_dims)
+  if options.get('shuffle', False):
+    _check_filter_avail(h5z.FILTER_SHUFFLE)
+    dc_plist.set_shuffle()
+  if 'gzip' in options:
+    _check_filter_avail(h5z.FILTER_DEFLATE)
+    dc_plist.set_deflate(options['gzip'])
+  if 'szip' in options:
+    _check_filter_avail(h5z.FILTER_SZIP)
+    szip_masks = {'nn' : h5z.SZIP_NN_OPTION_MASK, 'ec' : h5z.SZIP_EC_OPTION_MASK}
+    dc_plist.set_szip(szip_masks[options['szip']], 8)
+  for filter_id, values in options.get('filters', []):
+    _check_filter_avail(filter_id)
+    dc_plist.set_filter(filter_id, values=tuple(values))
+  return dc_plist
+
 def _select_file_slabs(hdf_space, filter):
   """ Performs the 'select_hyperslab' operation on a open hdf_dataset space,
   using the input filter.
@@ -153,13 +377,52 @@ def _create_mmry_slabs(filter):
   m_dspace.select_hyperslab(dst_start, dst_count, dst_stride, dst_block)
   return m_dspace
 
-def load_data(gid):
+def mmap_data(hdf_dataset, start=0, count=None):
+  """ Return a read-only numpy.memmap on count elements of the (flattened)
+  dataset, starting at start, or None if the dataset can not be mapped.
+  Only contiguous (not chunked, thus not compressed) datasets of files opened
+  with the default driver can be mapped.
+  Memmap is reshaped to F order if the full dataset is mapped.  """
+  offset = hdf_dataset.get_offset() # None if the dataset is not contiguous or not allocated
+  if offset is None:
+    return None
+  fid = h5i.get_file_id(hdf_dataset)
+  if fid.get_access_plist().get_driver() != h5fd.SEC2:
+    return None
+  if count is None:
+    shape = hdf_dataset.shape[::-1]
+  else:
+    shape = (count,)
+  if np.prod(shape) == 0: # Empty files can not be mapped
+    return None
+  dtype = hdf_dataset.dtype
+  return np.memmap(h5f.get_name(fid).decode(), dtype, mode='r', shape=shape, order='F',
+                   offset=offset + start*dtype.itemsize)
+
+def _is_mmap_slab(hdf_dataset, filter):
+  """ Check if the data selected in dataset by filter is a contiguous block
+  of the file, read in a contiguous block of memory.  """
+  if len(hdf_dataset.shape) != 1 or is_combinated(filter):
+    return False
+  dst_start, dst_stride, dst_count, dst_block = filter[0:4]
+  src_start, src_stride, src_count, src_block = filter[4:8]
+  return dst_start == [0] and dst_block == [1] and dst_count == [src_count[0] * src_block[0]] and \
+         (src_count == [1] or (src_stride == [1] and src_block == [1]))
+
+def load_data(gid, mmap=False):
   """ Create a numpy array from the dataset stored in the hdf node gid,
   reading all data (no hyperslab).
   HDFNode must have data (type != MT).
-  Numpy array is reshaped to F order **but** kind is not converted.  """
+  Numpy array is reshaped to F order **but** kind is not converted.
+  If mmap is True, a read-only memmap is returned instead of the array when
+  possible (see mmap_data).  """
   hdf_dataset = h5d.open(gid, b' data')
 
+  if mmap:
+    array = mmap_data(hdf_dataset)
+    if array is not None:
+      return array
+
   shape = hdf_dataset.shape[::-1]
 
   array = np.empty(shape, hdf_dataset.dtype, order='F')
@@ -168,13 +431,23 @@ def load_data(gid):
 
   return array
 
-def load_data_partial(gid, filter):
+def load_data_partial(gid, filter, xfer_plist=None, mmap=False):
   """ Create a numpy array from the dataset stored in the hdf node gid,
   reading partial data (using global filter object).
   HDFNode must have data (type != MT).
-  Numpy array is reshaped to F order **but** kind is not converted.  """
+  Numpy array is reshaped to F order **but** kind is not converted.
+  An optional dataset transfer property list can be provided (eg. for
+  collective MPIO reads).
+  If mmap is True and the filter selects a contiguous slab of a 1D dataset,
+  a read-only memmap is returned instead of the array when possible.  """
   hdf_dataset = h5d.open(gid, b' data')
 
+  if mmap and _is_mmap_slab(hdf_dataset, filter):
+    src_start, _, src_count, src_block = filter[4:8]
+    array = mmap_data(hdf_dataset, src_start[0], src_count[0] * src_block[0])
+    if array is not None:
+      return array
+
   # Prepare dataspaces
   hdf_space = hdf_dataset.get_space()
   _select_file_slabs(hdf_space, filter)
@@ -182,40 +455,112 @@ def load_data_partial(gid, filter):
 
   array = np.empty(m_dspace.shape[::-1], hdf_dataset.dtype, order='F')
   array_view = array.T
-  hdf_dataset.read(m_dspace, hdf_space, array_view)
+  hdf_dataset.read(m_dspace, hdf_space, array_view, dxpl=xfer_plist)
 
   return array
 
 
-def write_data(gid, array, dataset_name=b' data'):
+def write_data(gid, array, dataset_name=b' data', compression=None):
   """ Write a dataset on node gid from a numpy array,
-  dumping all data (no hyperslab).  """
+  dumping all data (no hyperslab).
+  If compression options are provided (see create_dc_plist), the dataset
+  is stored in a single chunk (up to MAX_CHUNK_BYTES).  """
   array_view = array.T
   if array_view.dtype == 'S1':
     array_view.dtype = np.int8
 
+  dc_plist = None
+  if compression is not None:
+    chunk_dims = compute_chunk_dims(array_view.shape, [0] * array_view.ndim, array_view.itemsize)
+    if chunk_dims is not None:
+      dc_plist = create_dc_plist(compression, chunk_dims)
+
   space = h5s.create_simple(array_view.shape)
-  data = h5d.create(gid, dataset_name, h5t.py_create(array_view.dtype), space)
+  data = h5d.create(gid, dataset_name, h5t.py_create(array_view.dtype), space, dcpl=dc_plist)
   data.write(h5s.ALL, h5s.ALL, array_view)
 
-def write_data_partial(gid, array, filter):
-  """ Write a dataset on node gid from a numpy array,
-  using hyperslabls (from filter object).  """
+def slab_boxes(filter):
+  """ Return the list of the non empty (C ordered) boxes (start, count) forming
+  the file slab described by a filter.  """
+  if is_combinated(filter):
+    boxes = [(src_filter[0], src_filter[2]) for src_filter in group_by(filter[4], 4)]
+  else:
+    boxes = [(filter[4], filter[6])]
+  return [(list(start[::-1]), list(count[::-1])) for start, count in boxes if 0 not in count]
+
+def slab_chunk_dims(filter):
+  """ Return, for each (C ordered) dimension, the gcd of the starts and ends of the
+  boxes of the file slab described by a filter, the end of the dataset excepted.
+  Chunks whose dimensions divide these values do not cross the boundaries of the slab.
+  0 means that the slab does not bound this dimension.  """
+  glob_dims = filter[-2][::-1]
+  chunk_dims = [0] * len(glob_dims)
+  for start, count in slab_boxes(filter):
+    for axis, glob_dim in enumerate(glob_dims):
+      end = start[axis] + count[axis]
+      chunk_dims[axis] = math.gcd(chunk_dims[axis], start[axis], end if end < glob_dim else 0)
+  return chunk_dims
+
+def create_data(gid, dtype, filter, compression=None, chunk_slab_dims=None):
+  """ Create an empty dataset on node gid, from its numpy dtype and the
+  global dimensions of the filter object.
+  If compression options are provided (see create_dc_plist), the dataset
+  is chunked on the slab boundaries given by chunk_slab_dims (see slab_chunk_dims,
+  defaults to the slab described by the filter); chunks are allocated when they
+  are written.
+  Otherwise, storage is allocated at creation time so that data can be written
+  later by other processes.  """
+  if dtype == 'S1':
+    dtype = np.dtype(np.int8)
   glob_dims = tuple(filter[-2][::-1])
 
-  # Prepare dataspaces
-  hdf_space = h5s.create_simple(glob_dims)
+  chunk_dims = None
+  if compression is not None:
+    if chunk_slab_dims is None:
+      chunk_slab_dims = slab_chunk_dims(filter)
+    chunk_dims = compute_chunk_dims(glob_dims, chunk_slab_dims, dtype.itemsize)
+  if chunk_dims is not None:
+    dc_plist = create_dc_plist(compression, chunk_dims)
+  else:
+    dc_plist = h5p.create(h5p.DATASET_CREATE)
+    dc_plist.set_fill_time(h5d.FILL_TIME_NEVER)
+    dc_plist.set_alloc_time(h5d.ALLOC_TIME_EARLY)
+
+  space = h5s.create_simple(glob_dims)
+  h5d.create(gid, b' data', h5t.py_create(dtype), space, dcpl=dc_plist)
+
+def _write_slabs(data, array, filter, xfer_plist):
+  """ Write the slabs described by the filter object from the numpy array
+  to the open dataset data.  """
+  hdf_space = data.get_space()
   _select_file_slabs(hdf_space, filter)
   m_dspace = _create_mmry_slabs(filter)
 
   array_view = array.T
   if array_view.dtype == 'S1':
     array_view.dtype = np.int8
-  data = h5d.create(gid, b' data', h5t.py_create(array_view.dtype), hdf_space)
-  xfer_plist = h5p.create(h5p.DATASET_XFER)
-  xfer_plist.set_dxpl_mpio(h5py.h5fd.MPIO_INDEPENDENT)
   data.write(m_dspace, hdf_space, array_view, dxpl=xfer_plist)
 
+def write_data_partial(gid, array, filter, xfer_plist=None):
+  """ Write a dataset on node gid from a numpy array,
+  using hyperslabls (from filter object).
+  If no dataset transfer property list is provided, MPIO independent
+  transfers are used.  """
+  glob_dims = tuple(filter[-2][::-1])
+
+  dtype = np.int8 if array.dtype == 'S1' else array.dtype
+  data = h5d.create(gid, b' data', h5t.py_create(dtype), h5s.create_simple(glob_dims))
+  if xfer_plist is None:
+    xfer_plist = h5p.create(h5p.DATASET_XFER)
+    xfer_plist.set_dxpl_mpio(h5py.h5fd.MPIO_INDEPENDENT)
+  _write_slabs(data, array, filter, xfer_plist)
+
+def fill_data_partial(gid, array, filter, xfer_plist):
+  """ Write the data of a numpy array in the existing dataset of node gid,
+  using hyperslabls (from filter object).  """
+  data = h5d.open(gid, b' data')
+  _write_slabs(data, array, filter, xfer_plist)
+
 def write_link(gid, node_name, target_file, target_node):
   """ Create a linked child named node_name under the open parent node gid
   Child links to the node target_node (absolute path) of file target_file. """
@@ -231,7 +576,8 @@ def write_link(gid, node_name, target_file, target_node):
 
   node_id.links.create_external(" link".encode(), target_file.encode(), target_node.encode())
 
-def _load_node_partial(gid, parent, load_if, ancestors_stack):
+def _load_node_partial(gid, parent, load_if, ancestors_stack, explore_if=None, lazy_reader=None, mmap=False,
+                       links=None):
   """ Internal recursive implementation for load_tree_partial.  """
 
   attr_reader = AttributeRW()
@@ -241,6 +587,8 @@ def _load_node_partial(gid, parent, load_if, ancestors_stack):
   value = None
 
   if b_kind == b'LK': #Follow link
+    if links is not None:
+      links.append(_read_link(gid, '/'.join(ancestors_stack[0] + [name])))
     gid = h5g.open(gid, b' link')
     b_kind = attr_reader.read_bytes_3(gid, b'type')
     # Label may be empty in original node and present only in linked node
@@ -249,34 +597,45 @@ def _load_node_partial(gid, parent, load_if, ancestors_stack):
   ancestors_stack[0].append(name)
   ancestors_stack[1].append(label)
 
+  pynode = [name, value, [], label]
+
   if load_if(*ancestors_stack):
     if b_kind != b'MT':
-      value = load_data(gid)
+      value = load_data(gid, mmap and label == 'DataArray_t')
       if b_kind==b'C1':
         value.dtype = 'S1'
   elif b_kind != b'MT':
     _data = h5d.open(gid, b' data')
-    size_node = [name + '#Size', 
-                 np.array(_data.shape[::-1]),
-                 [],
-                 'DataArray_t']
-    parent[2].append(size_node)
+    shape = _data.shape[::-1]
+    if lazy_reader is None:
+      size_node = [name + '#Size', 
+                   np.array(shape),
+                   [],
+                   'DataArray_t']
+      parent[2].append(size_node)
+    elif np.prod(shape) > LAZY_MIN_SIZE:
+      value = HDF5LazyArray(lazy_reader, '/'.join(ancestors_stack[0]), b_kind, shape, _data.dtype, pynode)
+    else:
+      value = load_data(gid)
+      if b_kind==b'C1':
+        value.dtype = 'S1'
 
-  pynode = [name, value, [], label]
+  pynode[1] = value
   parent[2].append(pynode)
 
-  # Define the function that will be applied to the child of the current hdf node
-  # thought iterate : we just start next recursion level if child is not a dataset
-  iter_func = lambda n : _load_node_partial(h5g.open(gid, n), pynode, load_if, ancestors_stack) \
-      if h5o.get_info(gid, n).type == h5o.TYPE_GROUP else None
+  if explore_if is None or explore_if(*ancestors_stack):
+    # Define the function that will be applied to the child of the current hdf node
+    # thought iterate : we just start next recursion level if child is not a dataset
+    iter_func = lambda n : _load_node_partial(h5g.open(gid, n), pynode, load_if, ancestors_stack, explore_if, lazy_reader, mmap, links) \
+        if h5o.get_info(gid, n).type == h5o.TYPE_GROUP else None
 
-  idx_type = h5.INDEX_CRT_ORDER if knows_crt_order(gid) else h5.INDEX_NAME
-  gid.links.iterate(iter_func, idx_type=idx_type)
+    idx_type = h5.INDEX_CRT_ORDER if knows_crt_order(gid) else h5.INDEX_NAME
+    gid.links.iterate(iter_func, idx_type=idx_type)
   ancestors_stack[0].pop()
   ancestors_stack[1].pop()
 
 
-def _write_node_partial(gid, node, write_if, ancestors_stack):
+def _write_node_partial(gid, node, write_if, ancestors_stack, compression=None):
   """ Internal recursive implementation for write_tree_partial.  """
 
   cgtype = 'MT' if node[1] is None else DTYPE_TO_CGNSTYPE[node[1].dtype.name]
@@ -296,16 +655,32 @@ def _write_node_partial(gid, node, write_if, ancestors_stack):
   attr_writter.write_flag(node_id) 
 
   if write_if(*ancestors_stack) and node[1] is not None:
-    write_data(node_id, node[1])
+    write_data(node_id, node[1], compression=find_compression(compression, *ancestors_stack))
 
   # Write children
   for child in node[2]:
-    _write_node_partial(node_id, child, write_if, ancestors_stack)
+    _write_node_partial(node_id, child, write_if, ancestors_stack, compression)
   ancestors_stack[0].pop()
   ancestors_stack[1].pop()
 
+def _append_node_partial(gid, node, write_if, ancestors_stack, compression=None):
+  """ Internal recursive implementation for append_tree_partial.  """
+  if node[0].encode() not in gid:
+    _write_node_partial(gid, node, write_if, ancestors_stack, compression)
+    return
+
+  ancestors_stack[0].append(node[0])
+  ancestors_stack[1].append(node[3])
+  node_id = h5g.open(gid, node[0].encode())
+  if AttributeRW().read_bytes_3(node_id, b'type') == b'LK': #Follow link
+    node_id = h5g.open(node_id, b' link')
+  for child in node[2]:
+    _append_node_partial(node_id, child, write_if, ancestors_stack, compression)
+  node_id.close()
+  ancestors_stack[0].pop()
+  ancestors_stack[1].pop()
 
-def load_tree_partial(filename, load_predicate):
+def load_tree_partial(filename, load_predicate, explore_predicate=None, lazy=False, mmap=False, links=None):
   """
   Create a pyCGNS tree from the (partial) read of an hdf file.
 
@@ -314,16 +689,29 @@ def load_tree_partial(filename, load_predicate):
   - if load_predicate return True, the data of the node is fully loaded
     and registered in tree
   - if load_predicate return False, the data is skipped, buts its shape is registered in
-    tree as the value of an additional node of name name Node#Size
+    tree as the value of an additional node of name name Node#Size. If lazy is True,
+    the value of the node is instead an HDF5LazyArray, which will read the data
+    when needed (data smaller than LAZY_MIN_SIZE are loaded).
+
+  If mmap is True, the data of DataArray_t nodes are, when possible, read-only
+  memmaps on the file instead of arrays (see mmap_data).
+
+  If provided, the explore_predicate is also evaluated : if it returns False,
+  the children of the node are not loaded.
+
+  If a links list is provided, the description of the encountered links
+  (see load_tree_links) is appended to it. Links found below another link
+  are also reported.
 
   Note : if load_predicate returns always True, the tree is then fully read.
   """
   tree = ['CGNSTree', None, [], 'CGNSTree_t']
+  lazy_reader = HDF5LazyReader(filename, mmap) if lazy else None
 
   fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDONLY)
   rootid = h5g.open(fid, b'/')
 
-  iter_func = lambda n : _load_node_partial(h5g.open(rootid, n), tree, load_predicate, ([],[])) \
+  iter_func = lambda n : _load_node_partial(h5g.open(rootid, n), tree, load_predicate, ([],[]), explore_predicate, lazy_reader, mmap, links) \
       if h5o.get_info(rootid, n).type == h5o.TYPE_GROUP else None
   idx_type = h5.INDEX_CRT_ORDER if knows_crt_order(rootid) else h5.INDEX_NAME
   rootid.links.iterate(iter_func, idx_type=idx_type)
@@ -331,6 +719,50 @@ def load_tree_partial(filename, load_predicate):
   fid.close()
   return tree
 
+def load_nodes_partial(filename, paths, load_predicate, links=None):
+  """
+  Create the pyCGNS subtrees rooted at each of the given paths from the
+  (partial) read of an hdf file, and return them as a list.
+  See load_tree_partial for the meaning of load_predicate, which is evaluated
+  with the full ancestors of the nodes, and of links. Links found in the
+  ancestors of the nodes are not reported.
+  """
+  attr_reader = AttributeRW()
+  fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDONLY)
+
+  nodes = []
+  for path in paths:
+    names  = path.split('/')
+    labels = []
+    gid = h5g.open(fid, b'/')
+    for name in names[:-1]:
+      gid = h5g.open(gid, name.encode())
+      if attr_reader.read_bytes_3(gid, b'type') == b'LK': #Follow link
+        gid = h5g.open(gid, b' link')
+      labels.append(attr_reader.read_str_33(gid, b'label'))
+    parent = ['Parent', None, [], 'UserDefinedData_t']
+    _load_node_partial(h5g.open(gid, names[-1].encode()), parent, load_predicate, (names[:-1], labels), links=links)
+    nodes.append(parent[2][-1]) # First child can be #Size node
+  fid.close()
+  return nodes
+
+
+def _read_link(gid, path):
+  """ Return the description of the link stored in the LK node gid, found at
+  the given path : [target directory, target file, target path, path].  """
+  #Target directory ; the CGNS norm is unclear about how a link should start, 
+  # but other libraries are also doing that
+  link = ['.']
+  for ds_name in [b' file', b' path']: #Target file, then target path
+    hdf_dataset = h5d.open(gid, ds_name)
+    shape = hdf_dataset.shape[::-1]
+    array = np.empty(shape, hdf_dataset.dtype, order='F')
+    array_view = array.T
+    hdf_dataset.read(h5s.ALL, h5s.ALL, array_view)
+    array.dtype = 'S1'
+    link.append(array.tobytes().decode().rstrip('\x00'))
+  link.append(path) #Current path
+  return link
 
 def load_tree_links(filename):
   """ Collect and return the links present in a CGNS File """
@@ -346,20 +778,8 @@ def load_tree_links(filename):
       b_kind = self.attr_reader.read_bytes_3(gid, b'type')
 
       if b_kind == b'LK':
-        #Target directory ; the CGNS norm is unclear about how a link should start, 
-        # but other libraries are also doing that
-        link = ['.']
-        for ds_name in [b' file', b' path']: #Target file, then target path
-          hdf_dataset = h5d.open(gid, ds_name)
-          shape = hdf_dataset.shape[::-1]
-          array = np.empty(shape, hdf_dataset.dtype, order='F')
-          array_view = array.T
-          hdf_dataset.read(h5s.ALL, h5s.ALL, array_view)
-          array.dtype = 'S1'
-          link.append(array.tobytes().decode().rstrip('\x00'))
         path = '/'.join([self.attr_reader.read_str_33(id, b'name') for id in node_ids[1:]])
-        link.append(path) #Current path
-        self.links.append(link)
+        self.links.append(_read_link(gid, path))
         return algo.step.over
 
   fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDONLY)
@@ -370,7 +790,7 @@ def load_tree_links(filename):
   fid.close()
   return visitor.links
 
-def write_tree_partial(tree, filename, write_predicate):
+def write_tree_partial(tree, filename, write_predicate, compression=None):
   """
   Write a (partial) hdf file from a pyCGNS tree.
 
@@ -382,6 +802,9 @@ def write_tree_partial(tree, filename, write_predicate):
     datakind is written)
 
   Note : if write_predicate returns always False, the tree is then fully writed.
+
+  Written datasets can optionally be compressed, see find_compression and
+  create_dc_plist for the description of the compression dict.
   """
 
   fc_pl = h5p.create(h5p.FILE_CREATE)
@@ -393,7 +816,20 @@ def write_tree_partial(tree, filename, write_predicate):
   # Write some attributes of root node
   add_root_attributes(rootid)
   for node in tree[2]:
-    _write_node_partial(rootid, node, write_predicate, ([],[]))
+    _write_node_partial(rootid, node, write_predicate, ([],[]), compression)
 
   fid.close()
 
+def append_tree_partial(tree, filename, write_predicate, compression=None):
+  """
+  Add to an existing hdf file the nodes of a pyCGNS tree which are not already
+  in the file. Missing nodes are written as in write_tree_partial, while existing
+  nodes (and their data) are left unchanged. Links are followed, so missing nodes
+  below a link are added in the linked file.
+  """
+  fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR)
+  rootid = h5g.open(fid, b'/')
+  for node in tree[2]:
+    _append_node_partial(rootid, node, write_predicate, ([],[]), compression)
+  rootid.close()
+  fid.close()
@@ -2,6 +2,7 @@ import pytest
 import pytest_parallel
 
 import numpy as np
+import h5py
 import shutil
 import subprocess
 from pathlib import Path
@@ -112,6 +113,22 @@ def test_open_from_path(ref_hdf_file):
   gid = HCG.open_from_path(fid, 'Base/ZoneS/ZoneType')
   gid = HCG.open_from_path(fid, 'Base')
 
+def test_hdf5_path_cache(ref_hdf_file):
+  fid = h5f.open(bytes(ref_hdf_file, 'utf-8'), h5f.ACC_RDONLY)
+  nodes_cache = HCG.HDF5PathCache(fid)
+  attr_rw = HCG.AttributeRW()
+  gid = nodes_cache.open('Base/ZoneU/GridCoordinates/CoordinateX')
+  assert attr_rw.read_str_33(gid, b'name') == 'CoordinateX'
+  gid.close()
+  assert sorted(nodes_cache.gids.keys()) == ['', 'Base', 'Base/ZoneU', 'Base/ZoneU/GridCoordinates']
+  gid = nodes_cache.open('Base/ZoneU/GridCoordinates/CoordinateY')
+  assert attr_rw.read_str_33(gid, b'name') == 'CoordinateY'
+  gid.close()
+  assert len(nodes_cache.gids) == 4
+  nodes_cache.close()
+  assert len(nodes_cache.gids) == 0
+  fid.close()
+
 def test_load_data(ref_hdf_file):
   fid = h5f.open(bytes(ref_hdf_file, 'utf-8'), h5f.ACC_RDONLY)
   gid = HCG.open_from_path(fid, 'Base/ZoneU')
@@ -141,6 +158,66 @@ def test_write_data(tmp_hdf_file):
     out[idx+1] = out[idx+1][4:] #Some hdf version include (0) before data : remote it
   assert out[idx+1] == '0, 0, 0, 1, 1, 1'
 
+def test_find_compression():
+  names  = ['Base', 'Zone', 'FS', 'Density']
+  labels = ['CGNSBase_t', 'Zone_t', 'FlowSolution_t', 'DataArray_t']
+  assert HCG.find_compression(None, names, labels) is None
+  assert HCG.find_compression({'FlowSolution_t' : {'gzip' : 4}}, names, labels) == {'gzip' : 4}
+  assert HCG.find_compression({'Base/*/FS/Dens*' : {'gzip' : 1}}, names, labels) == {'gzip' : 1}
+  assert HCG.find_compression({'GridCoordinates_t' : {'gzip' : 1}}, names, labels) is None
+  assert HCG.find_compression({'FlowSolution_t' : {'gzip' : 1}}, names[:3] + ['GridLocation'], \
+                                                                 labels[:3] + ['GridLocation_t']) is None
+
+def test_slab_chunk_dims():
+  assert HCG.slab_chunk_dims([[0], [1], [4], [1], [0], [1], [4], [1], [10], [1]]) == [4]
+  assert HCG.slab_chunk_dims([[0], [1], [3], [1], [4], [1], [3], [1], [10], [1]]) == [1]
+  assert HCG.slab_chunk_dims([[0], [1], [4], [1], [6], [1], [4], [1], [10], [1]]) == [6]
+  assert HCG.slab_chunk_dims([[0], [1], [0], [1], [0], [1], [0], [1], [10], [1]]) == [0]
+  assert HCG.slab_chunk_dims([[0,0], [1,1], [3,2], [1,1], [0,2], [1,1], [3,2], [1,1], [3,6], [1]]) == [2,0]
+  combinated = [[0], [1], [6], [1], [[0,0,1], [1,1,1], [3,2,1], [1,1,1], [0,0,2], [1,1,1], [3,2,1], [1,1,1]], [3,2,4], [0]]
+  assert HCG.slab_chunk_dims(combinated) == [1,0,0]
+
+def test_compute_chunk_dims():
+  assert HCG.compute_chunk_dims((100,), (30,), 8) == (30,)
+  assert HCG.compute_chunk_dims((2, 100), (0, 30), 8) == (2, 30)
+  assert HCG.compute_chunk_dims((100,), (0,), 8) == (100,)
+  assert HCG.compute_chunk_dims((0,), (0,), 8) is None
+  n = HCG.MAX_CHUNK_BYTES // 4
+  assert HCG.compute_chunk_dims((n,), (0,), 8) == (n // 2,)
+  # Bounded dimensions are split into divisors of the slab period
+  assert HCG.compute_chunk_dims((3*n,), (3*n,), 8) == (n // 2,)
+  assert HCG.compute_chunk_dims((n+1,), (0,), 8) == (-(-(n+1) // 3),)
+
+def test_write_data_compressed(tmp_hdf_file):
+  fid = h5f.open(bytes(tmp_hdf_file, 'utf-8'), h5f.ACC_RDWR)
+  gid = HCG.open_from_path(fid, 'Base/ZoneU/GridCoordinates')
+  gid = h5g.create(gid, 'CoordinateZ'.encode())
+  HCG.write_data(gid, np.arange(100, dtype=np.float64), compression={'shuffle' : True, 'gzip' : 4})
+  gid.close()
+  fid.close()
+
+  with h5py.File(tmp_hdf_file, 'r') as f:
+    dataset = f['Base/ZoneU/GridCoordinates/CoordinateZ/ data']
+    assert dataset.chunks == (100,) and dataset.compression == 'gzip' and dataset.shuffle
+    assert np.array_equal(dataset[()], np.arange(100))
+
+  with pytest.raises(ValueError):
+    HCG.create_dc_plist({'lzma' : 1}, (100,))
+
+@pytest.mark.parametrize('compression', [None, {'gzip' : 1}])
+def test_create_and_fill_data_partial(tmp_hdf_file, compression):
+  fid = h5f.open(bytes(tmp_hdf_file, 'utf-8'), h5f.ACC_RDWR)
+  gid = HCG.open_from_path(fid, 'Base/ZoneU/GridCoordinates')
+  gid = h5g.create(gid, 'CoordinateZ'.encode())
+  filter_0 = [[0], [1], [4], [1], [0], [1], [4], [1], [6], [1]]
+  filter_1 = [[0], [1], [2], [1], [4], [1], [2], [1], [6], [1]]
+  HCG.create_data(gid, np.dtype(np.float64), filter_0, compression)
+  HCG.fill_data_partial(gid, np.array([1., 2., 3., 4.]), filter_0, None)
+  HCG.fill_data_partial(gid, np.array([5., 6.]), filter_1, None)
+  assert np.array_equal(HCG.load_data(gid), [1., 2., 3., 4., 5., 6.])
+  gid.close()
+  fid.close()
+
 def test_write_link(tmp_hdf_file):
   fid = h5f.open(bytes(tmp_hdf_file, 'utf-8'), h5f.ACC_RDWR)
   gid = HCG.open_from_path(fid, 'Base/ZoneU/GridCoordinates')
@@ -192,6 +269,35 @@ def test_load_data_partial(ref_hdf_file):
                                      [[1,0], [1,1], [1,2], [1,1], [0,0],[1,1],[1,1],[1,1]], [2,2], [0]])
   assert np.array_equal(data, [1,3,4]) and data.dtype == np.float64
 
+def test_load_data_mmap(tmp_hdf_file):
+  fid = h5f.open(bytes(tmp_hdf_file, 'utf-8'), h5f.ACC_RDWR)
+  gid = HCG.open_from_path(fid, 'Base/ZoneU/GridCoordinates')
+  gid_z = h5g.create(gid, 'CoordinateZ'.encode())
+  HCG.write_data(gid_z, np.arange(100, dtype=np.float64))
+  gid_w = h5g.create(gid, 'CoordinateW'.encode())
+  HCG.write_data(gid_w, np.arange(100, dtype=np.float64), compression={'gzip' : 1})
+  gid_s = HCG.open_from_path(fid, 'Base/ZoneS')
+  gid_s = h5g.create(gid_s, 'Array2D'.encode())
+  HCG.write_data(gid_s, np.array([[1,2,3], [4,5,6]], order='F'))
+
+  data = HCG.load_data(gid_z, mmap=True)
+  assert isinstance(data, np.memmap) and not data.flags.writeable
+  assert np.array_equal(data, np.arange(100))
+  data = HCG.load_data(gid_s, mmap=True)
+  assert isinstance(data, np.memmap) and np.isfortran(data)
+  assert np.array_equal(data, [[1,2,3], [4,5,6]])
+  data = HCG.load_data(gid_w, mmap=True) # Compressed : not mapped
+  assert not isinstance(data, np.memmap) and np.array_equal(data, np.arange(100))
+
+  data = HCG.load_data_partial(gid_z, [[0], [1], [10], [1], [20], [1], [10], [1], [100], [0]], mmap=True)
+  assert isinstance(data, np.memmap) and np.array_equal(data, np.arange(20, 30))
+  data = HCG.load_data_partial(gid_z, [[0], [1], [10], [1], [20], [2], [10], [1], [100], [0]], mmap=True)
+  assert not isinstance(data, np.memmap) and np.array_equal(data, np.arange(20, 40, 2))
+  del data
+  for gid in [gid_z, gid_w, gid_s]:
+    gid.close()
+  fid.close()
+
 @pytest.mark.parametrize('combinated', [False, True])
 def test_write_data_partial(tmp_hdf_file, combinated):
   fid = h5f.open(bytes(tmp_hdf_file, 'utf-8'), h5f.ACC_RDWR)
@@ -299,9 +405,82 @@ def test_load_tree_partial(partial, ref_hdf_file):
     yt = sample_tree
   assert PT.is_same_tree(tree, parse_yaml_cgns.to_cgns_tree(yt))
 
+def test_load_tree_partial_explore(ref_hdf_file):
+  tree = HCG.load_tree_partial(ref_hdf_file, lambda N,L : True, lambda N,L : L[-1] != 'Zone_t')
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+    ZoneS Zone_t [[2, 1, 0], [2, 1, 0]]:
+  """
+  assert PT.is_same_tree(tree, parse_yaml_cgns.to_cgns_tree(yt))
+
+def test_load_tree_partial_lazy(ref_hdf_file, monkeypatch):
+  monkeypatch.setattr(HCG, 'LAZY_MIN_SIZE', 5)
+  tree = HCG.load_tree_partial(ref_hdf_file, lambda N,L : False, lazy=True)
+  node_u = PT.get_node_from_path(tree, 'Base/ZoneU/GridCoordinates/CoordinateX')
+  node_s = PT.get_node_from_path(tree, 'Base/ZoneS/GridCoordinates/CoordinateX')
+  assert isinstance(node_u[1], HCG.HDF5LazyArray)
+  assert node_u[1].shape == (6,) and node_u[1].dtype == np.float64
+  assert isinstance(node_s[1], np.ndarray) # Small arrays are loaded
+  assert PT.get_node_from_name(tree, 'CoordinateX#Size') is None
+
+  lazy_array = node_u[1]
+  assert lazy_array[2] == 3.
+  assert isinstance(node_u[1], np.ndarray)
+  assert (node_u[1] == [1., 2., 3., 4., 5., 6.]).all()
+  lazy_array.release()
+  assert node_u[1] is lazy_array
+  assert np.sum(node_u[1]) == 21.
+
+  # File is closed once all the lazy arrays are loaded
+  lazy_nodes = PT.get_nodes_from_predicate(tree, lambda n: isinstance(n[1], HCG.HDF5LazyArray), explore='deep')
+  reader = lazy_nodes[0][1].reader
+  assert reader.fid is not None
+  for node in lazy_nodes:
+    node[1].materialize()
+  assert reader.fid is None
+
+def test_load_nodes_partial(ref_hdf_file):
+  nodes = HCG.load_nodes_partial(ref_hdf_file, ['Base/ZoneS', 'Base/ZoneU/GridCoordinates'], \
+      lambda N,L : N[-1] != 'CoordinateY')
+  yt = """
+  ZoneS Zone_t [[2, 1, 0], [2, 1, 0]]:
+    ZoneType ZoneType_t 'Structured':
+    GridCoordinates GridCoordinates_t:
+      CoordinateX DataArray_t R8 [[1., 2.], [3., 4.]]:
+      CoordinateY DataArray_t:
+      CoordinateY#Size DataArray_t I8 [2,2]:
+  GridCoordinates GridCoordinates_t:
+    CoordinateX DataArray_t R8 [1., 2., 3., 4., 5., 6.]:
+    CoordinateY DataArray_t:
+    CoordinateY#Size DataArray_t I8 [6]:
+  """
+  expected = parse_yaml_cgns.to_nodes(yt)
+  assert len(nodes) == 2
+  for node, expected_node in zip(nodes, expected):
+    assert PT.is_same_tree(node, expected_node)
+
 def test_write_tree_partial(tmp_path, ref_hdf_file):
   tree = parse_yaml_cgns.to_cgns_tree(sample_tree)
   outfile = str(tmp_path / Path('only_coords.hdf'))
   HCG.write_tree_partial(tree, outfile, lambda N,L : True)
   cmd = ["h5diff", f"{ref_hdf_file}", f"{outfile}", "Base"] #hdf5version dataset can vary
   assert subprocess.run(cmd).returncode == 0
+
+def test_append_tree_partial(tmp_hdf_file):
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t R8 [0., 0., 0., 0., 0., 0.]:
+      FlowSol FlowSolution_t:
+        Density DataArray_t R8 [1., 1., 1., 2., 2., 2.]:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  HCG.append_tree_partial(tree, tmp_hdf_file, lambda N,L : True)
+
+  out_tree = HCG.load_tree_partial(tmp_hdf_file, lambda N,L : True)
+  expected = parse_yaml_cgns.to_cgns_tree(sample_tree)
+  zone = PT.get_node_from_path(expected, 'Base/ZoneU')
+  PT.new_FlowSolution('FlowSol', fields={'Density' : np.array([1., 1., 1., 2., 2., 2.])}, parent=zone)
+  assert PT.is_same_tree(out_tree, expected) # Existing nodes are unchanged
@@ -0,0 +1,42 @@
+import maia.pytree as PT
+from maia.pytree.yaml import parse_yaml_cgns
+
+from maia.io.hdf import tree as hdf_tree
+
+def test_select_hdf_filter():
+  yt = """
+  Base CGNSBase_t [3,3]:
+    Zone Zone_t:
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t:
+        CoordinateY DataArray_t:
+      NGon Elements_t:
+        ElementStartOffset DataArray_t:
+        ElementConnectivity DataArray_t:
+      FlowSol FlowSolution_t:
+        Density DataArray_t:
+        Pressure DataArray_t:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  hdf_filter = {'Base/Zone/GridCoordinates/CoordinateX' : [1],
+                'Base/Zone/GridCoordinates/CoordinateY' : [2],
+                'Base/Zone/NGon/ElementStartOffset'     : [3],
+                'Base/Zone/NGon/ElementConnectivity'    : lambda hdf_filter: None,
+                'Base/Zone/FlowSol/Density'             : [4],
+                'Base/Zone/FlowSol/Pressure'            : [5]}
+
+  selected, skipped = hdf_tree.select_hdf_filter(tree, hdf_filter)
+  assert selected == hdf_filter and skipped == {}
+
+  selected, skipped = hdf_tree.select_hdf_filter(tree, hdf_filter, include=['GridCoordinates_t', '*/Density'])
+  assert list(selected.keys()) == ['Base/Zone/GridCoordinates/CoordinateX', 'Base/Zone/GridCoordinates/CoordinateY',
+                                   'Base/Zone/FlowSol/Density']
+  assert len(skipped) == 3 and skipped['Base/Zone/FlowSol/Pressure'] == [5]
+
+  selected, skipped = hdf_tree.select_hdf_filter(tree, hdf_filter, include='GridCoordinates_t',
+                                                 exclude=['Base/Zone/GridCoordinates/CoordinateY'])
+  assert list(selected.keys()) == ['Base/Zone/GridCoordinates/CoordinateX']
+
+  # ElementStartOffset is needed to load ElementConnectivity
+  selected, skipped = hdf_tree.select_hdf_filter(tree, hdf_filter, include=['*/ElementConnectivity'])
+  assert sorted(selected.keys()) == ['Base/Zone/NGon/ElementConnectivity', 'Base/Zone/NGon/ElementStartOffset']
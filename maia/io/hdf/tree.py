@@ -5,12 +5,19 @@ import maia.pytree.maia   as MT
 
 from .hdf_dataspace    import create_data_array_filter
 from .cgns_elements    import create_zone_elements_filter
-from .cgns_subsets     import create_zone_subregion_filter,\
-                              create_flow_solution_filter,\
-                              create_zone_bc_filter,\
-                              create_zone_grid_connectivity_filter
+from .cgns_subsets     import _create_zone_subregion_filter,\
+                              _create_flow_solution_filter,\
+                              _create_bc_filter,\
+                              _create_gc_filter
 from .                 import utils
 
+# Nodes of the zone holding some data, retrieved in a single pass
+_ZONE_QUERIES = {'GridCoordinates_t'  : 'GridCoordinates_t',
+                 'BC_t'               : 'ZoneBC_t/BC_t',
+                 'GridConnectivity_t' : 'ZoneGridConnectivity_t/GridConnectivity_t',
+                 'FlowSolution_t'     : 'FlowSolution_t',
+                 'ZoneSubRegion_t'    : 'ZoneSubRegion_t'}
+
 def create_zone_filter(zone, zone_path, hdf_filter, mode):
   """
   Fill up the hdf filter for the following elements of the zone:
@@ -21,19 +28,25 @@ def create_zone_filter(zone, zone_path, hdf_filter, mode):
   The bounds of the filter are determined by the :CGNS#Distribution
   node and, for the structured zones, by the size of the blocks.
   """
+  nodes = PT.get_children_from_queries(zone, _ZONE_QUERIES, ancestors=True)
+  path_of = lambda nodes: '/'.join([zone_path] + [PT.get_name(n) for n in nodes])
+
   # Coords
   distrib_vtx  = PT.get_value(MT.getDistribution(zone, 'Vertex'))
   all_vtx_dataspace   = create_data_array_filter(distrib_vtx, zone[1][:,0])
-  for grid_c in PT.iter_children_from_label(zone, 'GridCoordinates_t'):
-    grid_coord_path = zone_path + "/" + PT.get_name(grid_c)
-    utils.apply_dataspace_to_arrays(grid_c, grid_coord_path, all_vtx_dataspace, hdf_filter)
+  for grid_c, in nodes['GridCoordinates_t']:
+    utils.apply_dataspace_to_arrays(grid_c, path_of([grid_c]), all_vtx_dataspace, hdf_filter)
 
   create_zone_elements_filter(zone, zone_path, hdf_filter, mode)
 
-  create_zone_bc_filter(zone, zone_path, hdf_filter)
-  create_zone_grid_connectivity_filter(zone, zone_path, hdf_filter)
-  create_flow_solution_filter(zone, zone_path, hdf_filter)
-  create_zone_subregion_filter(zone, zone_path, hdf_filter)
+  for zone_bc, bc in nodes['BC_t']:
+    _create_bc_filter(bc, path_of([zone_bc, bc]), hdf_filter)
+  for zone_gc, gc in nodes['GridConnectivity_t']:
+    _create_gc_filter(gc, path_of([zone_gc, gc]), hdf_filter)
+  for flow_solution, in nodes['FlowSolution_t']:
+    _create_flow_solution_filter(zone, flow_solution, path_of([flow_solution]), hdf_filter)
+  for zone_subregion, in nodes['ZoneSubRegion_t']:
+    _create_zone_subregion_filter(zone, zone_subregion, path_of([zone_subregion]), hdf_filter)
 
 
 def create_tree_hdf_filter(dist_tree, mode='read'):
@@ -46,3 +59,39 @@ def create_tree_hdf_filter(dist_tree, mode='read'):
     zone_path = PT.get_name(base)+"/"+PT.get_name(zone)
     create_zone_filter(zone, zone_path, hdf_filter, mode)
   return hdf_filter
+
+def select_hdf_filter(dist_tree, hdf_filter, include=None, exclude=None):
+  """
+  Split the hdf_filter into the entries selected by the include and exclude
+  queries, and the skipped ones.
+  Queries are lists of CGNS labels, which match the arrays found below a node
+  of this label, or of paths (wildcards allowed) matching the arrays themselves.
+  An entry is selected if it matches at least one include query (all entries
+  match if include is None) and no exclude query.
+  Since ElementConnectivity of NGon/NFace is read from the ElementStartOffset
+  array, the later is selected as soon as the former is.
+  """
+  include = [include] if isinstance(include, str) else include
+  exclude = [exclude] if isinstance(exclude, str) else exclude
+
+  def _match(queries, path, labels):
+    return any(query in labels or fnmatch.fnmatchcase(path, query) for query in queries)
+
+  selected, skipped = dict(), dict()
+  for path, data_space in hdf_filter.items():
+    node, labels = dist_tree, []
+    for name in path.split('/'):
+      node = PT.get_child_from_name(node, name)
+      labels.append(PT.get_label(node))
+    if (include is None or _match(include, path, labels)) and not (exclude and _match(exclude, path, labels)):
+      selected[path] = data_space
+    else:
+      skipped[path] = data_space
+
+  for path, data_space in list(selected.items()):
+    if not isinstance(data_space, (list, tuple)): # Connectivity loaded from ESO
+      eso_path = path.rsplit('/', 1)[0] + '/ElementStartOffset'
+      if eso_path in skipped:
+        selected[eso_path] = skipped.pop(eso_path)
+
+  return selected, skipped
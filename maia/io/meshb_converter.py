@@ -8,6 +8,7 @@ import maia.utils.logging as mlog
 
 from maia                         import npy_pdm_gnum_dtype as pdm_gnum_dtype
 from maia.utils                   import np_utils, par_utils
+from maia.transfer                import protocols as EP
 from maia.factory.dcube_generator import _dmesh_nodal_to_cgns_zone
 
 import numpy as np
@@ -114,16 +115,15 @@ def dmesh_nodal_to_cgns(dmesh_nodal, comm, tree_info, out_files):
   field_names = tree_info['field_names']
   n_itp_flds  = sum([len(fld_names) for fld_names in field_names.values()])
   if n_itp_flds!=0:
-    all_fields = np.empty(n_vtx*n_itp_flds, dtype=np.double)
-    PDM.read_solb(bytes(out_files['fld']), n_vtx, n_itp_flds, all_fields)
+    # Records have a fixed size : each rank only reads its own slab
+    dist_fields = _read_solb(out_files['fld'], distrib_vtx)
+    get_field = lambda i_fld: np.ascontiguousarray(dist_fields[:,i_fld])
 
     i_fld = 0
     for container_name, fld_names in field_names.items():
       fs = PT.new_FlowSolution(container_name, loc='Vertex', parent=dist_zone)
       for fld_name in fld_names:
-        # Deinterlace + select distributed section since everything has been read ...
-        data = all_fields[i_fld::n_itp_flds][distrib_vtx[0]:distrib_vtx[1]] 
-        PT.new_DataArray(fld_name, data, parent=fs) 
+        PT.new_DataArray(fld_name, get_field(i_fld), parent=fs) 
         i_fld += 1
   
   # > Add FlowSolution for vtx tag
@@ -160,22 +160,136 @@ def meshb_to_cgns(out_files, tree_info, comm):
   return dist_tree
 
 
+# Binary (.meshb, .solb) files are written in the version 3 of the libMeshb format :
+# 32 bits integers, 64 bits reals and 64 bits file positions
+_GMF_VERSION  = 3
+_GMF_KEYWORDS = {'Dimension' : 3, 'Vertices' : 4, 'Edges' : 5, 'Triangles' : 6,
+                 'Tetrahedra' : 8, 'End' : 54, 'SolAtVertices' : 62}
 
+def _write_gmf_keyword(fh, pos, keyword, header, blocks, comm):
+  """
+  Write, at the position pos of the binary file fh, a keyword followed by its header
+  (list of arrays, written by rank 0) and its records. Records are given as a list of
+  distributed arrays, written one after the other in the rank order : since
+  records have a fixed size, each rank writes its own rows at its own offset.
+  Return the position following the keyword.
+  """
+  header = b''.join([np.asarray(array).tobytes() for array in header])
+  blocks = [np.ascontiguousarray(block).reshape(-1).view(np.uint8) for block in blocks]
+  blocks_offsets = [par_utils.gather_and_shift(block.size, comm, np.int64) for block in blocks]
+  data_pos = pos + 12 + len(header) # Keyword code (32 bits) and next keyword position (64 bits)
+  next_pos = data_pos + sum([int(offsets[-1]) for offsets in blocks_offsets])
+  if comm.Get_rank() == 0:
+    next_kwd_pos = 0 if keyword == 'End' else next_pos
+    fh.Write_at(pos, np.array([_GMF_KEYWORDS[keyword]], np.int32).tobytes() \
+                   + np.array([next_kwd_pos], np.int64).tobytes() + header)
+  for block, offsets in zip(blocks, blocks_offsets):
+    fh.Write_at_all(data_pos + int(offsets[comm.Get_rank()]), block)
+    data_pos += int(offsets[-1])
+  return next_pos
+
+def _open_gmf(filename, comm):
+  """
+  Collectively create the binary file filename, and write its header.
+  Return the MPI file and the position following the header.
+  """
+  fh = MPI.File.Open(comm, str(filename), MPI.MODE_WRONLY | MPI.MODE_CREATE)
+  fh.Set_size(0)
+  if comm.Get_rank() == 0:
+    fh.Write_at(0, np.array([1, _GMF_VERSION], np.int32).tobytes())
+  return fh, _write_gmf_keyword(fh, 8, 'Dimension', [np.int32(3)], [], comm)
 
+def _close_gmf(fh, pos, comm):
+  """
+  Write the End keyword at the position pos of the binary file fh, and close it.
+  """
+  _write_gmf_keyword(fh, pos, 'End', [], [], comm)
+  fh.Close()
 
+def _write_solb(filename, fields, types, n_vtx, comm):
+  """
+  Write the distributed vertex fields in a binary .solb file. Fields are given
+  already interlaced, types are the Medit kinds (1 for scalar, 3 for symmetric matrix)
+  """
+  fh, pos = _open_gmf(filename, comm)
+  values = np.column_stack(fields).astype(np.float64, copy=False)
+  header = [np.array([n_vtx, len(types)] + list(types), np.int32)]
+  pos = _write_gmf_keyword(fh, pos, 'SolAtVertices', header, [values], comm)
+  _close_gmf(fh, pos, comm)
 
-def cgns_to_meshb(dist_tree, files, metric_nodes, container_names, constraints):
-  '''
+def _seek_gmf_keyword(f, keyword):
+  """
+  Walk the keywords of the binary file f, and stop after the keyword code and
+  next keyword position of the given keyword.
+  Return the version and the dimension of the file.
+  """
+  code, version = np.fromfile(f, np.int32, 2)
+  if code != 1:
+    raise ValueError(f"Unsupported byte order in binary file {f.name}")
+  dim = 3
+  while True:
+    kwd_code = int(np.fromfile(f, np.int32, 1)[0])
+    next_pos = int(np.fromfile(f, np.int64 if version >= 3 else np.int32, 1)[0])
+    if kwd_code == _GMF_KEYWORDS[keyword]:
+      return int(version), dim
+    if kwd_code == _GMF_KEYWORDS['Dimension']:
+      dim = int(np.fromfile(f, np.int32, 1)[0])
+    if kwd_code == _GMF_KEYWORDS['End'] or next_pos == 0:
+      raise ValueError(f"Keyword {keyword} not found in binary file {f.name}")
+    f.seek(next_pos)
+
+def _read_solb(filename, distri):
+  """
+  Read the rows distri[0]:distri[1] of the SolAtVertices section of a binary .solb file.
+  Records have a fixed size : each rank only reads its own slab.
+  Return a (distri[1]-distri[0], n_values) array.
+  """
+  with open(filename, 'rb') as f:
+    version, dim = _seek_gmf_keyword(f, 'SolAtVertices')
+    np.fromfile(f, np.int64 if version >= 4 else np.int32, 1) # Number of vertices
+    n_type = int(np.fromfile(f, np.int32, 1)[0])
+    types  = np.fromfile(f, np.int32, n_type)
+    type_size = {1 : 1, 2 : dim, 3 : dim*(dim+1)//2, 4 : dim*dim}
+    n_val = sum([type_size[t] for t in types])
+    dtype = np.dtype(np.float64 if version >= 2 else np.float32)
+    f.seek(distri[0] * n_val * dtype.itemsize, 1)
+    values = np.fromfile(f, dtype, (distri[1] - distri[0]) * n_val)
+  return values.reshape(-1, n_val).astype(np.float64, copy=False)
+
+def _compute_tags(distri, first, bc_pls, bc_tags, default, comm):
+  """
+  Compute the distributed tag array of some entities : entities appearing in the
+  i-th PointList of bc_pls receive the tag bc_tags[i], others get the default tag.
+  first is the id of the first entity, used to shift the PointLists.
+  """
+  own_ids   = np.arange(distri[0], distri[1], dtype=pdm_gnum_dtype) + 1
+  part_ids  = [own_ids]
+  part_tags = [np.full(own_ids.size, default, dtype=pdm_gnum_dtype)]
+  for pl, tag in zip(bc_pls, bc_tags):
+    in_range = (first <= pl) & (pl < first + distri[2])
+    part_ids.append(pl[in_range] - first + 1)
+    part_tags.append(np.broadcast_to(tag, pl.shape)[in_range].astype(pdm_gnum_dtype))
+  return EP.part_to_block(part_tags, distri, part_ids, comm, reduce_func=EP.reduce_max)
+
+def cgns_to_meshb(dist_tree, files, metric_nodes, container_names, constraints, comm):
+  """
   Dist_tree conversion to meshb format and writing.
+
+  This function is collective : data stay distributed, and each rank writes its
+  own records in the binary meshb files, at its own offset.
+
   Arguments :
     - dist_tree       (CGNSTree) : dist_tree to convert
     - files           (dict)     : file names for meshb files
     - metric_nodes    (str)      : CGNS metric nodes
     - container_names (str)      : container_names to be interpolated
-  '''
+    - constraints     (list)     : BC names of entities that must not be adapted
+    - comm            (MPI)      : MPI Communicator
+  """
 
-  dt_size = sum(MT.metrics.dtree_nbytes(dist_tree))
-  mlog.info(f"Sequential write of a meshb file from a {mlog.bsize_to_str(dt_size)} dist_tree...")
+  dt_size     = sum(MT.metrics.dtree_nbytes(dist_tree))
+  all_dt_size = comm.allreduce(dt_size, MPI.SUM)
+  mlog.info(f"Distributed write of a meshb file from a {mlog.bsize_to_str(all_dt_size)} dist_tree...")
   start = time.time()
 
   # > Monodomain only for now
@@ -185,108 +299,82 @@ def cgns_to_meshb(dist_tree, files, metric_nodes, container_names, constraints):
 
     # > Coordinates
     cx, cy, cz = PT.Zone.coordinates(zone)
+    n_vtx = PT.Zone.n_vtx(zone)
 
-    # > Gathering elements by dimension
-    elmt_by_dim = list()
-    for elmts in PT.Zone.get_ordered_elements_per_dim(zone):
-      elmt_ec = [np_utils.safe_int_cast(PT.get_node_from_name(elmt, "ElementConnectivity")[1], np.int32) for elmt in elmts]
-
-      if(len(elmt_ec) > 1):
-        elmt_by_dim.append(np.concatenate(elmt_ec))
-      elif len(elmt_ec) == 1:
-        elmt_by_dim.append(elmt_ec[0])
-      else:
-        elmt_by_dim.append(np.empty(0,dtype=np.int32))
-
-    n_tetra = elmt_by_dim[3].size // 4
-    n_tri   = elmt_by_dim[2].size // 3
-    n_edge  = elmt_by_dim[1].size // 2
-    n_vtx   = PT.Zone.n_vtx(zone)
+    elmts_by_dim = PT.Zone.get_ordered_elements_per_dim(zone)
+    n_elt_by_dim = [sum([PT.Element.Size(elmt) for elmt in elmts]) for elmts in elmts_by_dim]
+    n_tetra, n_tri, n_edge = n_elt_by_dim[3], n_elt_by_dim[2], n_elt_by_dim[1]
 
     constraint_tags = {'CellCenter':[],
                        'FaceCenter':[],
                        'EdgeCenter':[]}
 
-    # > PointList BC to BC tag
-    def bc_pl_to_bc_tag(list_of_bc, bc_tag, offset):
-      for n_tag, bc_n in enumerate(list_of_bc):
-        pl = PT.get_value(PT.get_node_from_name(bc_n, 'PointList'))[0]
-        bc_tag[pl-offset-1] = n_tag + 1
-        bc_name = PT.get_name(bc_n)
-        bc_loc  = PT.Subset.GridLocation(bc_n)
-        if constraints is not None and\
-           PT.get_name(bc_n) not in constraints:
-          constraint_tags[bc_loc].append(str(n_tag + 1))
-
-    def bc_pl_to_bc_tag_vtx(list_of_bc, bc_tag, offset):
-      for n_tag, bc_n in enumerate(list_of_bc):
-        pl = PT.get_value(PT.get_node_from_name(bc_n, 'PointList'))[0]
-        bc_tag[pl-offset-1] = pl
-
     zone_bc = PT.get_child_from_label(zone, 'ZoneBC_t')
-
-    tetra_tag =  np.zeros(n_tetra , dtype=np.int32)
-    tri_tag   = -np.ones (n_tri , dtype=np.int32)
-    edge_tag  = -np.ones (n_edge, dtype=np.int32)
-    vtx_tag   =  np.zeros(n_vtx , dtype=np.int32)
-    if zone_bc is not None:
-      # > Cell BC_t
-      is_cell_bc = lambda n :PT.get_label(n)=='BC_t' and PT.Subset.GridLocation(n) == "CellCenter"
-      cell_bcs   = PT.get_children_from_predicate(zone_bc, is_cell_bc)
-      n_cell_tag = bc_pl_to_bc_tag(cell_bcs, tetra_tag, 0)
-
-      # > Face BC_t
-      is_face_bc = lambda n :PT.get_label(n)=='BC_t' and PT.Subset.GridLocation(n) == "FaceCenter"
-      face_bcs   = PT.get_children_from_predicate(zone_bc, is_face_bc)
-      n_face_tag = bc_pl_to_bc_tag(face_bcs, tri_tag, n_tetra)
-
-      # > Edge BC_t
-      is_edge_bc = lambda n :PT.get_label(n)=='BC_t' and PT.Subset.GridLocation(n) == "EdgeCenter"
-      edge_bcs   = PT.get_children_from_predicate(zone_bc, is_edge_bc)
-      n_edge_tag = bc_pl_to_bc_tag(edge_bcs, edge_tag, n_tetra+n_tri)
-
-      # > Edge BC_t
-      is_vtx_bc  = lambda n :PT.get_label(n)=='BC_t' and PT.Subset.GridLocation(n) == "Vertex"
-      vtx_bcs   = PT.get_children_from_predicate(zone_bc, is_vtx_bc)
-      n_vtx_tag = bc_pl_to_bc_tag_vtx(vtx_bcs, vtx_tag, 0)
-
+    bcs_by_loc = dict()
+    for loc in ['Vertex', 'EdgeCenter', 'FaceCenter', 'CellCenter']:
+      is_loc_bc = lambda n :PT.get_label(n)=='BC_t' and PT.Subset.GridLocation(n) == loc
+      bcs_by_loc[loc] = PT.get_children_from_predicate(zone_bc, is_loc_bc) if zone_bc is not None else []
+
+    for loc in ['CellCenter', 'FaceCenter', 'EdgeCenter']:
+      for n_tag, bc_n in enumerate(bcs_by_loc[loc]):
+        if constraints is not None and PT.get_name(bc_n) not in constraints:
+          constraint_tags[loc].append(str(n_tag + 1))
+
+    # > PointList BC to BC tag, computed on the distributed element blocks
+    bc_pls = lambda bcs: [PT.get_child_from_name(bc_n, 'PointList')[1][0] for bc_n in bcs]
+    elt_tags_by_dim = [[] for dim in range(4)]
+    for dim, loc, default in [(3, 'CellCenter', 0), (2, 'FaceCenter', -1), (1, 'EdgeCenter', -1)]:
+      pls = bc_pls(bcs_by_loc[loc])
+      for elmt in elmts_by_dim[dim]:
+        distri = PT.get_value(MT.getDistribution(elmt, 'Element'))
+        first  = PT.Element.Range(elmt)[0]
+        tags   = np.arange(1, len(pls)+1)
+        elt_tags_by_dim[dim].append(_compute_tags(distri, first, pls, tags, default, comm))
+
+    vtx_distri = PT.get_value(MT.getDistribution(zone, 'Vertex'))
+    vtx_pls = bc_pls(bcs_by_loc['Vertex'])
+    vtx_tag = _compute_tags(vtx_distri, 1, vtx_pls, vtx_pls, 0, comm)
+
+    has_untagged = lambda dim: any([(tag < 0).any() for tag in elt_tags_by_dim[dim]])
     is_3d = n_tetra!=0
     is_2d = n_tri  !=0
     if is_3d: 
-      if (n_tri > 0 and (tri_tag < 0).any()) or (n_edge > 0 and (edge_tag < 0).any()):
+      if comm.allreduce(has_untagged(2) or has_untagged(1), MPI.LOR):
         raise ValueError("Some Face or Edge elements do not belong to any BC")
     elif is_2d:
-      if (n_edge > 0 and (edge_tag < 0).any()):
+      if comm.allreduce(has_untagged(1), MPI.LOR):
         raise ValueError("Some Face or Edge elements do not belong to any BC")
     else:
       raise ValueError("No tetrahedron or triangle Elements_t node could be found")
 
 
     # > Write meshb
-    xyz       = np_utils.interweave_arrays([cx,cy,cz])
-    # tetra_tag = np.zeros(n_tetra, dtype=np.int32)
-    file_name = bytes(files["mesh"], 'utf-8') if isinstance(files["mesh"], str)\
-           else bytes(files["mesh"])
-    PDM.write_meshb(file_name,
-                    n_vtx, n_tetra, n_tri, n_edge,
-                    xyz,              vtx_tag,
-                    elmt_by_dim[3], tetra_tag,
-                    elmt_by_dim[2],   tri_tag,
-                    elmt_by_dim[1],  edge_tag)
+    fh, pos = _open_gmf(files["mesh"], comm)
+    vertices = np.empty(cx.size, dtype=[('coords', np.float64, 3), ('ref', np.int32)])
+    vertices['coords'] = np.column_stack([cx, cy, cz])
+    vertices['ref']    = vtx_tag
+    pos = _write_gmf_keyword(fh, pos, 'Vertices', [np.int32(n_vtx)], [vertices], comm)
+
+    for dim, section in [(1, 'Edges'), (2, 'Triangles'), (3, 'Tetrahedra')]:
+      blocks = []
+      for elmt, tags in zip(elmts_by_dim[dim], elt_tags_by_dim[dim]):
+        ec = PT.get_child_from_name(elmt, "ElementConnectivity")[1].reshape(-1, dim+1)
+        block = np.empty(ec.shape[0], dtype=[('connectivity', np.int32, dim+1), ('ref', np.int32)])
+        block['connectivity'] = ec
+        block['ref']          = tags
+        blocks.append(block)
+      pos = _write_gmf_keyword(fh, pos, section, [np.int32(n_elt_by_dim[dim])], blocks, comm)
+
+    _close_gmf(fh, pos, comm)
 
     n_metric_fld = len(metric_nodes)
     if n_metric_fld==1:
       metric_fld = PT.get_value(metric_nodes[0])
-      PDM.write_solb(bytes(files["sol"]), n_vtx, 1, metric_fld)
+      _write_solb(files["sol"], [metric_fld], [1], n_vtx, comm)
     elif n_metric_fld==6:
-      mxx = PT.get_value(metric_nodes[0])
-      mxy = PT.get_value(metric_nodes[1])
-      mxz = PT.get_value(metric_nodes[2])
-      myy = PT.get_value(metric_nodes[3])
-      myz = PT.get_value(metric_nodes[4])
-      mzz = PT.get_value(metric_nodes[5])
-      met = np_utils.interweave_arrays([mxx,mxy,myy,mxz,myz,mzz])
-      PDM.write_matsym_solb(bytes(files["sol"]), n_vtx, met)
+      # Medit order for symmetric matrices is xx, xy, yy, xz, yz, zz
+      met = [PT.get_value(metric_nodes[i]) for i in [0,1,3,2,4,5]]
+      _write_solb(files["sol"], met, [3], n_vtx, comm)
 
 
     # > Fields to interpolate
@@ -295,13 +383,10 @@ def cgns_to_meshb(dist_tree, files, metric_nodes, container_names, constraints):
       container    = PT.get_node_from_name(zone, container_name)
       fields_list += [PT.get_value(n) for n in PT.get_children_from_label(container, 'DataArray_t')]
     if len(fields_list)>0:
-      fields_array = np_utils.interweave_arrays(fields_list)
-      PDM.write_solb(bytes(files["fld"]), n_vtx, len(fields_list), fields_array)
+      _write_solb(files["fld"], fields_list, [1]*len(fields_list), n_vtx, comm)
 
 
   end = time.time()
   mlog.info(f"Write of meshb file completed ({end-start:.2f} s)")
 
   return constraint_tags
-
-
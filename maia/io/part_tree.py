@@ -1,11 +1,11 @@
 import os
+import numpy as np
+
 import maia
 import maia.pytree        as PT
 import maia.pytree.maia   as MT
 
 import maia.utils.logging as mlog
-from maia.factory.dist_from_part import discover_nodes_from_matching
-from maia.factory.partitioning import compute_nosplit_weights
 
 from .cgns_io_tree import write_tree
 
@@ -49,7 +49,12 @@ def _read_part_from_size(tree, filename, comm):
   zones_path = PT.predicates_to_paths(tree, 'CGNSBase_t/Zone_t')
   max_proc = max([PT.maia.conv.get_part_suffix(path)[0] for path in zones_path]) + 1
   mlog.warning(f"Ignoring procs affectation when reading file {filename} written for {max_proc} procs")
-  return [path for path in compute_nosplit_weights(tree, comm)]
+  from maia.factory.partitioning import compute_nosplit_weights # Cyclic import
+  # Parts are affected to the ranks by balancing their number of cells
+  zones_to_read = [path for path in compute_nosplit_weights(tree, comm)]
+  n_cell = sum([PT.Zone.n_cell(PT.get_node_from_path(tree, path)) for path in zones_to_read])
+  mlog.stat(f"[read_part_tree] {len(zones_to_read)} parts ({n_cell} cells) affected to current rank")
+  return zones_to_read
 
 
 def read_part_tree(filename, comm, redispatch=False, legacy=False):
@@ -62,7 +67,10 @@ def read_part_tree(filename, comm, redispatch=False, legacy=False):
   appearing in partitioned zone names.
 
   If ``redispatch == True``, the CGNS zones are dispatched over the
-  available processes, and renamed to follow maia's conventions.
+  available processes, and renamed to follow maia's conventions. Zones
+  are not split, but their affectation balances the number of cells per process.
+
+  In both cases, each process only reads the data of its zones.
 
   Args:
     filename (str) : Path of the file
@@ -79,10 +87,15 @@ def read_part_tree(filename, comm, redispatch=False, legacy=False):
     import Converter.Filter as Filter
     tree = Filter.convertFile2SkeletonTree(filename, maxDepth=2)
   else:
-    from maia.io.cgns_io_tree import load_size_tree
     from h5py import h5f
-    from .hdf._hdf_cgns import open_from_path, _load_node_partial
-    tree = load_size_tree(filename, comm)
+    from .hdf._hdf_cgns import HDF5PathCache, load_tree_partial, _load_node_partial
+    from ._hdf_io_h5py import load_data
+    # Zones will be fully read after affectation : only their first level is needed
+    if comm.Get_rank() == 0:
+      tree = load_tree_partial(filename, load_data, lambda names, labels: 'Zone_t' not in labels[:-1])
+    else:
+      tree = None
+    tree = comm.bcast(tree, root=0)
 
   if redispatch:
     zones_to_read = _read_part_from_size(tree, filename, comm)
@@ -113,13 +126,15 @@ def read_part_tree(filename, comm, redispatch=False, legacy=False):
 
     # Now load full data of affected zones
     fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDONLY)
+    nodes_cache = HDF5PathCache(fid)
     for base in PT.get_children_from_label(tree, 'CGNSBase_t'):
       zone_names = [PT.get_name(n) for n in PT.get_children_from_label(base, 'Zone_t')]
       PT.rm_children_from_label(base, 'Zone_t')
       for zone_name in zone_names:
-        gid = open_from_path(fid, f'{PT.get_name(base)}/{zone_name}')
+        gid = nodes_cache.open(f'{PT.get_name(base)}/{zone_name}')
         _load_node_partial(gid, base, lambda X,Y:True, ([],[]))
         gid.close()
+    nodes_cache.close()
     fid.close()
 
   # Remove empty bases
@@ -132,12 +147,77 @@ def read_part_tree(filename, comm, redispatch=False, legacy=False):
   return tree
 
 
+def _split_skeleton(node, path, arrays_kind):
+  """Return a copy of node where the data of the DataArray_t and IndexArray_t
+  nodes are replaced by empty arrays. The shape and the dtype of the replaced
+  arrays are registered in arrays_kind.
+  """
+  value = node[1]
+  if PT.get_label(node) in ['DataArray_t', 'IndexArray_t'] and value is not None:
+    arrays_kind[path] = (value.shape, value.dtype)
+    value = np.empty(0, value.dtype)
+  children = [_split_skeleton(child, f'{path}/{PT.get_name(child)}', arrays_kind) for child in PT.get_children(node)]
+  return [PT.get_name(node), value, children, PT.get_label(node)]
+
+def _full_array_filter(shape):
+  """Return the hdf filter describing the read or write of a full array."""
+  zeros, ones = [0]*len(shape), [1]*len(shape)
+  return 2*[zeros, ones, list(shape), ones] + [list(shape), [0]]
+
+def _write_zones_parallel(part_tree, filename, comm):
+  """Write the partitioned zones of all the ranks in an existing file.
+  The skeletons of the zones are gathered on rank 0, which writes them
+  and creates the datasets; then each rank writes the data of its zones
+  concurrently using the MPIO driver.
+  """
+  from h5py import h5f
+  from .hdf._hdf_cgns import HDF5PathCache, _write_node_partial, create_data, fill_data_partial
+  from ._hdf_io_h5py import open_mpio, create_xfer_plist
+
+  zone_paths = PT.predicates_to_paths(part_tree, 'CGNSBase_t/Zone_t')
+  arrays_kind = {}
+  skeletons = [_split_skeleton(PT.get_node_from_path(part_tree, zone_path), zone_path, arrays_kind) \
+      for zone_path in zone_paths]
+
+  all_skeletons = comm.gather((zone_paths, skeletons, arrays_kind), root=0)
+  if comm.Get_rank() == 0:
+    fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR)
+    nodes_cache = HDF5PathCache(fid)
+    for _zone_paths, _skeletons, _arrays_kind in all_skeletons:
+      for zone_path, zone in zip(_zone_paths, _skeletons):
+        base_name = PT.path_head(zone_path)
+        write_if = lambda names, labels: '/'.join([base_name] + names) not in _arrays_kind
+        gid = nodes_cache.open(base_name)
+        _write_node_partial(gid, zone, write_if, ([],[]))
+        gid.close()
+      for path, (shape, dtype) in _arrays_kind.items():
+        gid = nodes_cache.open(path)
+        create_data(gid, dtype, _full_array_filter(shape))
+        gid.close()
+    nodes_cache.close()
+    fid.close()
+  comm.barrier()
+
+  fid = open_mpio(filename, h5f.ACC_RDWR, comm)
+  xfer_plist = create_xfer_plist(collective=False)
+  nodes_cache = HDF5PathCache(fid)
+  for path, (shape, dtype) in arrays_kind.items():
+    array = PT.get_node_from_path(part_tree, path)[1]
+    if array.size > 0:
+      gid = nodes_cache.open(path)
+      fill_data_partial(gid, array, _full_array_filter(shape), xfer_plist)
+      gid.close()
+  nodes_cache.close()
+  fid.close()
+
 def save_part_tree(part_tree, filename, comm, single_file=False, legacy=False):
   """Gather the partitioned zones managed by all the processes and write it in a unique
   hdf container.
 
   If ``single_file`` is True, one file named *filename* storing all the partitioned
-  zones is written.  Otherwise, hdf links are used to produce a main file *filename*
+  zones is written: the skeleton of the zones is written by the first process, then
+  all the processes write the data of their zones in parallel.
+  Otherwise, hdf links are used to produce a main file *filename*
   linking to additional subfiles.
   
   Args:
@@ -157,31 +237,25 @@ def save_part_tree(part_tree, filename, comm, single_file=False, legacy=False):
   subfilename = base_name + f'_sub_{rank}' + extension
 
   # Recover base data and families
+  from maia.factory.dist_from_part import discover_nodes_from_matching # Cyclic import
   top_tree = PT.new_CGNSTree()
   discover_nodes_from_matching(top_tree, [part_tree], 'CGNSBase_t', comm, get_value='all', child_list=['Family_t', 'ReferenceState_t'])
 
   if single_file:
-    # Sequential write seems to be faster than collective io -- see 01d84da7 for other methods
-    # Create file and write Bases
-    if rank == 0:
-      write_tree(top_tree, filename, legacy=legacy)
-    comm.barrier()
-    for i in range(comm.Get_size()):
-      if i == rank:
-        if legacy:
-          from Converter.Distributed import writeZones
-          writeZones(part_tree, filename, proc=-1)
-        else:
-          from h5py import h5f
-          from .hdf._hdf_cgns import open_from_path, _write_node_partial
-          fid = h5f.open(bytes(filename, 'utf-8'), h5f.ACC_RDWR)
-          for zone_path in maia.pytree.predicates_to_paths(part_tree, 'CGNSBase_t/Zone_t'):
-            zone = PT.get_node_from_path(part_tree, zone_path)
-            gid = open_from_path(fid, zone_path.split('/')[0])
-            _write_node_partial(gid, zone, lambda X,Y: True, ([],[]))
-            gid.close()
-          fid.close()
+    if legacy:
+      # Create file and write Bases, then write zones rank after rank
+      if rank == 0:
+        write_tree(top_tree, filename, legacy=legacy)
       comm.barrier()
+      from Converter.Distributed import writeZones
+      for i in range(comm.Get_size()):
+        if i == rank:
+          writeZones(part_tree, filename, proc=-1)
+        comm.barrier()
+    else:
+      if rank == 0:
+        write_tree(top_tree, filename, legacy=legacy)
+      _write_zones_parallel(part_tree, filename, comm)
 
   else:
     links      = []
@@ -1,6 +1,8 @@
 import pytest
 import pytest_parallel
 
+import numpy as np
+
 import maia.io
 import maia.pytree as PT
 
@@ -68,3 +70,138 @@ Base CGNSBase_t I4 [3, 3]:
     t = maia.io.cgns_io_tree.read_tree(out_file)
     assert (PT.get_value(PT.get_node_from_name(t,"CoordinateX")) == [0.,1.,2.,3.]).all()
   TU.rm_collective_dir(tmp_dir, comm)
+
+@pytest_parallel.mark.parallel(2)
+def test_file_to_dist_tree_collective(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    out_file = os.path.join(tmp_dir, 'cube.cgns')
+    maia.io.dist_tree_to_file(dist_tree, out_file, comm)
+    dist_tree_ind = maia.io.file_to_dist_tree(out_file, comm)
+    dist_tree_col = maia.io.file_to_dist_tree(out_file, comm, collective=True)
+  assert PT.is_same_tree(dist_tree_ind, dist_tree_col)
+
+@pytest_parallel.mark.parallel(3)
+def test_dist_tree_to_file_collective(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    ind_file = os.path.join(tmp_dir, 'cube_ind.cgns')
+    col_file = os.path.join(tmp_dir, 'cube_col.cgns')
+    maia.io.dist_tree_to_file(dist_tree, ind_file, comm)
+    maia.io.dist_tree_to_file(dist_tree, col_file, comm, collective=True, n_aggregators=2)
+    dist_tree_ind = maia.io.file_to_dist_tree(ind_file, comm)
+    dist_tree_col = maia.io.file_to_dist_tree(col_file, comm)
+  assert PT.is_same_tree(dist_tree_ind, dist_tree_col)
+
+@pytest_parallel.mark.parallel(2)
+def test_dist_tree_to_file_compressed(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  zone = PT.get_node_from_label(dist_tree, 'Zone_t')
+  cx = PT.get_node_from_name(zone, 'CoordinateX')[1]
+  PT.new_FlowSolution('FlowSol', loc='Vertex', fields={'Fx' : 2*cx}, parent=zone)
+  compression = {'FlowSolution_t' : {'shuffle' : True, 'gzip' : 4}}
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    out_file = os.path.join(tmp_dir, 'cube.cgns')
+    maia.io.dist_tree_to_file(dist_tree, out_file, comm, compression=compression)
+    dist_tree_bck = maia.io.file_to_dist_tree(out_file, comm)
+    if comm.Get_rank() == 0:
+      tree = maia.io.read_tree(out_file)
+      assert np.array_equal(PT.get_node_from_name(tree, 'Fx')[1], 2*PT.get_node_from_name(tree, 'CoordinateX')[1])
+  fx = PT.get_node_from_name(dist_tree_bck, 'Fx')[1]
+  assert np.array_equal(fx, 2*PT.get_node_from_name(dist_tree_bck, 'CoordinateX')[1])
+
+@pytest_parallel.mark.parallel(2)
+def test_dist_tree_to_file_append(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    out_file = os.path.join(tmp_dir, 'cube.cgns')
+    maia.io.dist_tree_to_file(dist_tree, out_file, comm)
+    zone = PT.get_node_from_label(dist_tree, 'Zone_t')
+    cx = PT.get_node_from_name(zone, 'CoordinateX')[1]
+    for i in range(2):
+      PT.new_FlowSolution(f'FlowSol{i}', loc='Vertex', fields={'Fx' : (i+1)*cx}, parent=zone)
+      maia.io.dist_tree_to_file(dist_tree, out_file, comm, append=True)
+    ref_file = os.path.join(tmp_dir, 'cube_ref.cgns')
+    maia.io.dist_tree_to_file(dist_tree, ref_file, comm)
+    dist_tree_bck = maia.io.file_to_dist_tree(out_file, comm)
+    dist_tree_ref = maia.io.file_to_dist_tree(ref_file, comm)
+  assert PT.is_same_tree(dist_tree_bck, dist_tree_ref)
+
+@pytest_parallel.mark.parallel(2)
+def test_dist_tree_to_file_async(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    ref_file = os.path.join(tmp_dir, 'cube_ref.cgns')
+    out_file = os.path.join(tmp_dir, 'cube.cgns')
+    maia.io.dist_tree_to_file(dist_tree, ref_file, comm)
+    request = maia.io.dist_tree_to_file_async(dist_tree, out_file, comm)
+    PT.get_node_from_name(dist_tree, 'CoordinateX')[1][:] = 0. # Arrays have been copied
+    request.wait()
+    assert request.test()
+    dist_tree_bck = maia.io.file_to_dist_tree(out_file, comm)
+    dist_tree_ref = maia.io.file_to_dist_tree(ref_file, comm)
+  assert PT.is_same_tree(dist_tree_bck, dist_tree_ref)
+
+@pytest_parallel.mark.parallel(2)
+def test_file_to_dist_tree_selective(comm):
+  dist_tree = maia.factory.generate_dist_block(5, "Poly", comm)
+  zone = PT.get_node_from_label(dist_tree, 'Zone_t')
+  cx = PT.get_node_from_name(zone, 'CoordinateX')[1]
+  PT.new_FlowSolution('FlowSol', loc='Vertex', fields={'Fx' : 2*cx, 'Fy' : 3*cx}, parent=zone)
+  with TU.collective_tmp_dir(comm) as tmp_dir:
+    out_file = os.path.join(tmp_dir, 'cube.cgns')
+    maia.io.dist_tree_to_file(dist_tree, out_file, comm)
+    dist_tree_full = maia.io.file_to_dist_tree(out_file, comm)
+    dist_tree_sel = maia.io.file_to_dist_tree(out_file, comm, include=['GridCoordinates_t', '*/FlowSol/Fx'],
+                                              exclude=['*/CoordinateZ'])
+    assert PT.get_node_from_name(dist_tree_sel, 'CoordinateX')[1] is not None
+    assert PT.get_node_from_name(dist_tree_sel, 'Fx')[1] is not None
+    for name in ['CoordinateZ', 'Fy', 'ElementConnectivity', 'PointList']:
+      assert PT.get_node_from_name(dist_tree_sel, name)[1] is None
+      assert PT.get_node_from_name(dist_tree_sel, f'{name}#Size') is not None
+    assert PT.get_node_from_name(dist_tree_sel, 'CoordinateX#Size') is None
+
+    maia.io.fill_dist_tree(dist_tree_sel, out_file, comm, exclude=['Fy'])
+    assert PT.get_node_from_name(dist_tree_sel, 'Fy')[1] is None
+    maia.io.fill_dist_tree(dist_tree_sel, out_file, comm)
+  assert PT.is_same_tree(dist_tree_sel, dist_tree_full)
+
+@pytest_parallel.mark.parallel(1)
+def test_read_tree_lazy(comm, tmp_path, monkeypatch):
+  from maia.io.hdf import _hdf_cgns as HCG
+  monkeypatch.setattr(HCG, 'LAZY_MIN_SIZE', 10)
+  filename = str(tmp_path / 'tree.hdf')
+  tree = maia.factory.generate_dist_block(4, 'Poly', comm)
+  maia.io.write_tree(tree, filename)
+
+  lazy_tree = maia.io.read_tree(filename, lazy=True)
+  coords = PT.get_node_from_name(lazy_tree, 'GridCoordinates')
+  assert all(isinstance(n[1], HCG.HDF5LazyArray) for n in PT.get_children(coords))
+  maia.io.load_lazy_arrays(coords)
+  assert all(isinstance(n[1], np.ndarray) for n in PT.get_children(coords))
+  maia.io.release_lazy_arrays(lazy_tree)
+  assert all(isinstance(n[1], HCG.HDF5LazyArray) for n in PT.get_children(coords))
+  reader = PT.get_child_from_name(coords, 'CoordinateX')[1].reader
+  maia.io.close_lazy_reader(lazy_tree)
+  assert reader.fid is None
+  maia.io.load_lazy_arrays(lazy_tree)
+  assert PT.is_same_tree(lazy_tree, maia.io.read_tree(filename))
+
+@pytest_parallel.mark.parallel(2)
+def test_read_write_tree_npz(comm):
+  with TU.collective_tmp_dir(comm) as tmpdir:
+    yaml_file = str(TU.mesh_dir / 'U_ATB_45.yaml')
+    hdf_file, npz_file = str(tmpdir / 'tree.hdf'), str(tmpdir / 'tree.npz')
+    if comm.Get_rank() == 0:
+      tree = maia.io.read_tree(yaml_file)
+      maia.io.write_tree(tree, npz_file)
+      npz_tree = maia.io.read_tree(npz_file)
+      assert PT.is_same_tree(npz_tree, tree)
+      # Round trip with hdf
+      maia.io.write_tree(npz_tree, hdf_file)
+      assert PT.is_same_tree(maia.io.read_tree(hdf_file), npz_tree)
+    comm.barrier()
+
+    dist_tree = maia.io.file_to_dist_tree(npz_file, comm)
+    ref_tree  = maia.io.file_to_dist_tree(yaml_file, comm)
+    assert PT.is_same_tree(dist_tree, ref_tree)
@@ -48,10 +48,37 @@ def test_load_size_tree(comm):
         CoordinateX#Size DataArray_t I8 [2,2]:
         CoordinateY DataArray_t:
         CoordinateY#Size DataArray_t I8 [2,2]:
+  :CGNS#Links UserDefinedData_t:
   """
   sizetree = IOH.load_size_tree(filename, comm)
   assert PT.is_same_tree(sizetree, parse_yaml_cgns.to_cgns_tree(yt))
 
+@pytest_parallel.mark.parallel(2)
+def test_load_size_tree_links(comm):
+  import maia.io
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+      ZoneType ZoneType_t "Unstructured":
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t [1., 2., 3., 4., 5., 6.]:
+    ZoneV Zone_t [[6, 0, 0]]:
+      ZoneType ZoneType_t "Unstructured":
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t [1., 2., 3., 4., 5., 6.]:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  links = [['.', 'zone.hdf', '/Base/ZoneU/GridCoordinates', 'Base/ZoneV/GridCoordinates'],
+           ['.', 'zone.hdf', '/Base/ZoneU', 'Base/ZoneU']]
+  with TU.collective_tmp_dir(comm) as tmpdir:
+    filename = str(Path(tmpdir) / 'master.hdf')
+    if comm.rank == 0:
+      maia.io.write_tree(tree, str(Path(tmpdir) / 'zone.hdf'))
+      maia.io.write_tree(tree, filename, links=links)
+    comm.barrier()
+    sizetree = IOH.load_size_tree(filename, comm)
+  assert IOH.get_links_info(sizetree) == sorted(links, key=lambda link: link[3])
+
 def test_load_partial():
   filename = str(TU.sample_mesh_dir / 'only_coords.hdf')
   yt = """
@@ -68,8 +95,111 @@ def test_load_partial():
   IOH.load_partial(filename, tree, hdf_filter)
   assert np.allclose(PT.get_node_from_name(tree, 'CoordinateX')[1], [5., 6.])
 
+def test_resolve_links(tmp_path):
+  (tmp_path / 'zone.hdf').touch()
+  filename = str(tmp_path / 'master.hdf')
+  links = [['.', 'zone.hdf', '/Base/ZoneU', 'Base/ZoneU'],
+           ['.', 'zone.hdf', '/Base/ZoneU/GridCoordinates/CoordinateY', 'Base/ZoneU/GridCoordinates/CoordinateZ']]
+  paths = ['Base/ZoneU/GridCoordinates/CoordinateX', 'Base/ZoneU/GridCoordinates/CoordinateZ',
+           'Base/ZoneUU/GridCoordinates/CoordinateX']
+  targets = IOH.resolve_links(filename, paths, links)
+  assert targets == {str(tmp_path / 'zone.hdf') : {
+                       'Base/ZoneU/GridCoordinates/CoordinateX' : 'Base/ZoneU/GridCoordinates/CoordinateX',
+                       'Base/ZoneU/GridCoordinates/CoordinateZ' : 'Base/ZoneU/GridCoordinates/CoordinateY'},
+                     filename : {
+                       'Base/ZoneUU/GridCoordinates/CoordinateX' : 'Base/ZoneUU/GridCoordinates/CoordinateX'}}
+
+def test_load_partial_links(tmp_path):
+  import maia.io
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+      ZoneType ZoneType_t "Unstructured":
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t [1., 2., 3., 4., 5., 6.]:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  maia.io.write_tree(tree, str(tmp_path / 'zone.hdf'))
+  filename = str(tmp_path / 'master.hdf')
+  maia.io.write_tree(tree, filename, links=[['.', 'zone.hdf', '/Base/ZoneU', 'Base/ZoneU']])
+
+  PT.set_value(PT.get_node_from_name(tree, 'CoordinateX'), None)
+  hdf_filter = {'Base/ZoneU/GridCoordinates/CoordinateX' : [[0], [1], [2], [1], [4], [1], [2], [1], [6], [1]]}
+  IOH.load_partial(filename, tree, hdf_filter, links=IOH.read_links(filename))
+  assert np.allclose(PT.get_node_from_name(tree, 'CoordinateX')[1], [5., 6.])
+
+def test_missing_paths(tmp_path):
+  import maia.io
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+      ZoneType ZoneType_t "Unstructured":
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t [1., 2., 3., 4., 5., 6.]:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  maia.io.write_tree(tree, str(tmp_path / 'zone.hdf'))
+  filename = str(tmp_path / 'master.hdf')
+  maia.io.write_tree(tree, filename, links=[['.', 'zone.hdf', '/Base/ZoneU', 'Base/ZoneU']])
+
+  paths = ['Base/ZoneU/GridCoordinates/CoordinateX', 'Base/ZoneU/GridCoordinates/CoordinateY']
+  assert IOH._missing_paths(filename, paths) == ['Base/ZoneU/GridCoordinates/CoordinateY']
+
+@pytest_parallel.mark.parallel(2)
+def test_load_partial_collective(comm):
+  filename = str(TU.sample_mesh_dir / 'only_coords.hdf')
+  yt = """
+  Base CGNSBase_t [2,2]:
+    ZoneU Zone_t [[6, 0, 0]]:
+      ZoneType ZoneType_t "Unstructured":
+      GridCoordinates GridCoordinates_t:
+        CoordinateX DataArray_t:
+        CoordinateY DataArray_t:
+  """
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  if comm.rank == 0:
+    hdf_filter = {'Base/ZoneU/GridCoordinates/CoordinateX' : [[0], [1], [4], [1], [0], [1], [4], [1], [6], [1]],
+                  'Base/ZoneU/GridCoordinates/CoordinateY' : [[0], [1], [4], [1], [0], [1], [4], [1], [6], [1]]}
+    expected_x, expected_y = [1., 2., 3., 4.], [-1., -2., -3., -4.]
+  else:
+    hdf_filter = {'Base/ZoneU/GridCoordinates/CoordinateX' : [[0], [1], [2], [1], [4], [1], [2], [1], [6], [1]],
+                  'Base/ZoneU/GridCoordinates/CoordinateY' : [[0], [1], [2], [1], [4], [1], [2], [1], [6], [1]]}
+    expected_x, expected_y = [5., 6.], [-5., -6.]
+  IOH.load_partial(filename, tree, hdf_filter, comm, hints={'romio_cb_read' : 'enable'})
+  assert np.allclose(PT.get_node_from_name(tree, 'CoordinateX')[1], expected_x)
+  assert np.allclose(PT.get_node_from_name(tree, 'CoordinateY')[1], expected_y)
+
+@pytest_parallel.mark.parallel(2)
+def test_common_slab_dims(comm):
+  if comm.rank == 0:
+    hdf_filter = {'Base/Zone/CoordinateX' : [[0], [1], [4], [1], [0], [1], [4], [1], [6], [1]],
+                  'Base/Zone/Empty'       : [[0], [1], [0], [1], [0], [1], [0], [1], [3], [1]],
+                  'Base/Zone/Tensor'      : [[0,0], [1,1], [3,3], [1,1], [0,0], [1,1], [3,3], [1,1], [3,4], [1]]}
+  else:
+    hdf_filter = {'Base/Zone/CoordinateX' : [[0], [1], [2], [1], [4], [1], [2], [1], [6], [1]],
+                  'Base/Zone/Empty'       : [[0], [1], [3], [1], [0], [1], [3], [1], [3], [1]],
+                  'Base/Zone/Tensor'      : [[0,0], [1,1], [3,1], [1,1], [0,3], [1,1], [3,1], [1,1], [3,4], [1]]}
+  assert IOH._common_slab_dims(hdf_filter, comm) == {'Base/Zone/CoordinateX' : [4],
+                                                     'Base/Zone/Empty'       : [0],
+                                                     'Base/Zone/Tensor'      : [3,0]}
+
+@pytest_parallel.mark.parallel(3)
+@pytest.mark.parametrize('dn', [[4,3,3], [6,3,3], [2,4,6]])
+def test_common_slab_dims_aligned(dn, comm):
+  from maia.io.hdf._hdf_cgns import compute_chunk_dims
+  n = sum(dn)
+  start = sum(dn[:comm.rank])
+  hdf_filter = {'Base/Zone/CoordinateX' : [[0], [1], [dn[comm.rank]], [1], [start], [1], [dn[comm.rank]], [1], [n], [1]]}
+  slab_dims = IOH._common_slab_dims(hdf_filter, comm)['Base/Zone/CoordinateX']
+  chunk = compute_chunk_dims((n,), slab_dims, 8)[0]
+  # Each slab starts and ends on a chunk boundary
+  for rank_start, rank_dn in zip(np.cumsum([0] + dn[:-1]), dn):
+    assert rank_start % chunk == 0
+    assert (rank_start + rank_dn) % chunk == 0 or rank_start + rank_dn == n
+
 @pytest_parallel.mark.parallel(2)
-def test_write_partial(comm, tmp_path):
+@pytest.mark.parametrize('collective', [False, True])
+def test_write_partial(collective, comm, tmp_path):
   if comm.rank == 0:
     yt = """
     Base CGNSBase_t [2,2]:
@@ -96,7 +226,7 @@ def test_write_partial(comm, tmp_path):
   tree = parse_yaml_cgns.to_cgns_tree(yt)
   with TU.collective_tmp_dir(comm) as tmpdir:
     filename = str(Path(tmpdir) / 'out.hdf')
-    IOH.write_partial(filename, tree, hdf_filter, comm)
+    IOH.write_partial(filename, tree, hdf_filter, comm, collective)
     comm.barrier()
 
     if comm.rank == 0:
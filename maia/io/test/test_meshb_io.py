@@ -36,7 +36,6 @@ def test_get_tree_info():
 
 def test_cgns_to_meshb(tmp_path):
 
-  # CGNS to mesh b is serial
   dist_tree = maia.factory.generate_dist_block(11, 'TETRA_4', MPI.COMM_SELF)
   zone = PT.get_all_Zone_t(dist_tree)[0]
 
@@ -46,57 +45,54 @@ def test_cgns_to_meshb(tmp_path):
   PT.new_FlowSolution('FlowSolution', loc='Vertex', fields=fields, parent=zone)
   PT.new_FlowSolution('Metric', loc='Vertex', fields={"Ones": np.ones(n_vtx)}, parent=zone)
 
-  files = {'mesh': tmp_path / 'mesh.mesh',
-           'sol' : tmp_path / 'metric.sol',
-           'fld' : tmp_path / 'field.sol'}
+  files = {'mesh': tmp_path / 'mesh.meshb',
+           'sol' : tmp_path / 'metric.solb',
+           'fld' : tmp_path / 'field.solb'}
 
-  meshb_converter.cgns_to_meshb(dist_tree, files, [PT.get_node_from_name(zone, 'Ones')], ['FlowSolution'], constraints=None)
+  meshb_converter.cgns_to_meshb(dist_tree, files, [PT.get_node_from_name(zone, 'Ones')], ['FlowSolution'],
+                                constraints=None, comm=MPI.COMM_SELF)
 
-  # Check .mesh
-  with open(files['mesh']) as f:
-    lines = f.readlines()
+  # Check .meshb
+  def read_count(section):
+    with open(files['mesh'], 'rb') as f:
+      meshb_converter._seek_gmf_keyword(f, section)
+      return int(np.fromfile(f, np.int32, 1)[0]), f.tell()
 
-  assert int(lines[lines.index('Vertices\n')+1]) == 1331
-  assert int(lines[lines.index('Edges\n')+1]) == 0
-  assert int(lines[lines.index('Triangles\n')+1]) == 1200
-  assert int(lines[lines.index('Tetrahedra\n')+1]) == 5000
-  assert lines[-1] == "End\n"
+  assert read_count('Vertices')[0] == 1331
+  assert read_count('Edges')[0] == 0
+  assert read_count('Triangles')[0] == 1200
+  assert read_count('Tetrahedra')[0] == 5000
 
-  st_triangles = lines.index('Triangles\n')
-  bc_tag = [int(l.split()[-1]) for l in lines[st_triangles+2:st_triangles+2+1200]]
-  u_tag, counts = np.unique(bc_tag, return_counts=True)
+  n_tri, pos = read_count('Triangles')
+  triangles = np.fromfile(files['mesh'], np.int32, 4*n_tri, offset=pos).reshape(n_tri, 4)
+  u_tag, counts = np.unique(triangles[:,3], return_counts=True)
   assert (u_tag == [1,2,3,4,5,6]).all()
   assert (counts == 200).all()
 
-  # Check .sol
-  with open(files['fld']) as f:
-    lines = f.readlines()
-  assert int(lines[lines.index('SolAtVertices\n')+1]) == 1331
-  assert     lines[lines.index('SolAtVertices\n')+2]  == "2 1 1 \n"
-
-  with open(files['sol']) as f:
-    lines = f.readlines()
-  assert int(lines[lines.index('SolAtVertices\n')+1]) == 1331
-  assert     lines[lines.index('SolAtVertices\n')+2]  == "1 1 \n"
+  # Check .solb
+  fields = meshb_converter._read_solb(files['fld'], [0, 1331, 1331])
+  assert fields.shape == (1331, 2)
+  assert (fields[:,1] == np.arange(1331)).all()
+  metric = meshb_converter._read_solb(files['sol'], [0, 1331, 1331])
+  assert (metric == 1.).all()
 
 
 @pytest_parallel.mark.parallel(2)
 def test_meshb_to_cgns(comm):
-  # Prepare test : write files in serial
+  # Prepare test : write files from a distributed tree
   tmp_dir = TU.create_collective_tmp_dir(comm)
-  files = {'mesh': tmp_dir / 'mesh.mesh',
-           'fld' : tmp_dir / 'field.sol'}
+  files = {'mesh': tmp_dir / 'mesh.meshb',
+           'fld' : tmp_dir / 'field.solb'}
 
-  if comm.Get_rank() == 0:
-    dist_tree = maia.factory.generate_dist_block(11, 'TETRA_4', MPI.COMM_SELF)
-    zone = PT.get_all_Zone_t(dist_tree)[0]
-    
-    vtx_distri = PT.maia.getDistribution(zone, 'Vertex')[1]
-    n_vtx = vtx_distri[1] - vtx_distri[0]
-    fields = {"Zeros": np.zeros(n_vtx), "Range": np.arange(n_vtx, dtype=float)}
-    PT.new_FlowSolution('FlowSolution', loc='Vertex', fields=fields, parent=zone)
-    
-    meshb_converter.cgns_to_meshb(dist_tree, files, [], ['FlowSolution'], constraints=None)
+  dist_tree = maia.factory.generate_dist_block(11, 'TETRA_4', comm)
+  zone = PT.get_all_Zone_t(dist_tree)[0]
+
+  vtx_distri = PT.maia.getDistribution(zone, 'Vertex')[1]
+  fields = {"Zeros": np.zeros(vtx_distri[1] - vtx_distri[0]),
+            "Range": np.arange(vtx_distri[0], vtx_distri[1], dtype=float)}
+  PT.new_FlowSolution('FlowSolution', loc='Vertex', fields=fields, parent=zone)
+
+  meshb_converter.cgns_to_meshb(dist_tree, files, [], ['FlowSolution'], constraints=None, comm=comm)
 
   tree_info = {
                'bc_names': { 
@@ -120,3 +116,20 @@ def test_meshb_to_cgns(comm):
   # TODO BCs are poorly distributed
   bc = PT.get_node_from_name(zone, 'bc3')
   assert PT.maia.getDistribution(bc, 'Index')[1][2] == 200
+
+@pytest_parallel.mark.parallel(2)
+def test_write_read_solb(comm):
+  tmp_dir = TU.create_collective_tmp_dir(comm)
+  filename = tmp_dir / 'field.solb'
+  # Write with a distribution, and read with an other one
+  distri = [0, 3, 5] if comm.Get_rank() == 0 else [3, 5, 5]
+  values = np.arange(1, 11).reshape(5, 2) / 2.
+  fields = [values[distri[0]:distri[1], 0], values[distri[0]:distri[1], 1]]
+  meshb_converter._write_solb(filename, fields, [1, 1], 5, comm)
+
+  with open(filename, 'rb') as f:
+    assert meshb_converter._seek_gmf_keyword(f, 'SolAtVertices') == (3, 3)
+    assert (np.fromfile(f, np.int32, 4) == [5, 2, 1, 1]).all()
+
+  distri = [0, 2, 5] if comm.Get_rank() == 0 else [2, 5, 5]
+  assert np.array_equal(meshb_converter._read_solb(filename, distri), values[distri[0]:distri[1]])
@@ -102,3 +102,26 @@ def test_read_part_tree_redispatch(mpi_tmpdir, redispatch, comm):
     else:
       assert len(PT.get_all_Zone_t(tree)) == 1
       assert 'written for 2 procs' in err_printer.msg
+
+@pytest_parallel.mark.parallel(3)
+def test_read_part_tree_redispatch_balanced(mpi_tmpdir, comm):
+  dtree = maia.factory.generate_dist_block(6, 'Poly', comm)
+  tree  = maia.factory.partition_dist_tree(dtree, comm)
+  n_cell = PT.Zone.n_cell(PT.get_all_Zone_t(tree)[0])
+  all_n_cell = comm.allgather(n_cell)
+
+  filename = Path(mpi_tmpdir) / 'out.hdf'
+  PIO.save_part_tree(tree, str(filename), comm, single_file=True)
+  comm.barrier()
+
+  sub_comm = comm.Split(int(comm.Get_rank() < 2))
+  if comm.Get_rank() < 2:
+    tree = PIO.read_part_tree(str(filename), sub_comm, redispatch=True)
+    zones = PT.get_all_Zone_t(tree)
+    n_zones = sub_comm.allgather(len(zones))
+    assert sum(n_zones) == 3 and min(n_zones) == 1
+    # Data should have been loaded, and cells are balanced
+    assert all([PT.get_node_from_name(zone, 'CoordinateX')[1].size > 0 for zone in zones])
+    n_cell_read = sub_comm.allgather(sum([PT.Zone.n_cell(zone) for zone in zones]))
+    assert sum(n_cell_read) == sum(all_n_cell)
+  sub_comm.Free()
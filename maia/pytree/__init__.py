@@ -5,4 +5,11 @@ from .node import *
 from .compare       import *
 from .path_utils    import *
 
-import maia.pytree.utils as utils
\ No newline at end of file
+import maia.pytree.utils as utils
+
+def __getattr__(name):
+  # Legacy walkers functions are generated at first access, see walk/generate.py
+  try:
+    return getattr(walk, name)
+  except AttributeError:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
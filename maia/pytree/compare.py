@@ -10,7 +10,6 @@ from maia.pytree.typing import *
 
 import maia.pytree as PT
 from maia.pytree.graph.cgns import step, zip_depth_first_search
-from maia.pytree.compare_arrays import equal_array_comparison
 
 
 class CGNSNodeFromPredicateNotFoundError(Exception):
@@ -222,7 +221,7 @@ class diff_tree_visitor:
 DiffReport = Tuple[bool,str,str]
 CompFunction = Callable[[List[Tuple[CGNSTree,CGNSTree]]], DiffReport]
 
-def diff_tree(t1:CGNSTree, t2:CGNSTree, strict_value_type = True, comp:CompFunction = equal_array_comparison()) -> DiffReport:
+def diff_tree(t1:CGNSTree, t2:CGNSTree, strict_value_type = True, comp:CompFunction = None) -> DiffReport:
   """
   Report the differences between two trees.
 
@@ -233,10 +232,14 @@ def diff_tree(t1:CGNSTree, t2:CGNSTree, strict_value_type = True, comp:CompFunct
     comp: comparison function to check the value of nodes. Particularly useful to compare floating point fields
   
   Possible comparison funtions :
-    `maia.pytree.compare_arrays.equal_array_comparison()`: compare exactly
+    `maia.pytree.compare_arrays.equal_array_comparison()`: compare exactly (default)
     `maia.pytree.compare_arrays.field_comparison(tol, comm)`: compare scalar fields with a relative tolerance
     `maia.pytree.compare_arrays.tensor_field_comparison(tol, comm)`: compare tensor fields with a relative tolerance
   """
+  if comp is None:
+    # Imported here since comparison functions require MPI
+    from maia.pytree.compare_arrays import equal_array_comparison
+    comp = equal_array_comparison()
   v = diff_tree_visitor(strict_value_type, comp)
   zip_depth_first_search([t1,t2], v, depth='all')
   return v.is_ok, v.err_report, v.warn_report
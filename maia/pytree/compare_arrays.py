@@ -1,6 +1,8 @@
 import numpy as np
 from mpi4py import MPI
 import maia.pytree as PT
+from maia.pytree.graph.algo import step
+from maia.pytree.graph.cgns import zip_depth_first_search
 
 
 def equal_array_report(x, ref, comm):
@@ -206,3 +208,162 @@ def tensor_field_comparison(tol, comm):
         path = path[:-1]
       return path
   return impl()
+
+
+# Distributed diff
+# ----------------
+# Local statistics computed for each compared array. First columns are summed over
+# the ranks, last columns are maximized
+_SUM_STATS = ['n_values', 'n_diff', 'size_mismatch', 'sq_diff', 'sq_ref']
+_MAX_STATS = ['max_diff', 'max_ref']
+_N_STATS   = len(_SUM_STATS) + len(_MAX_STATS)
+
+def _local_diff_stats(x, ref):
+  stats = np.zeros(_N_STATS)
+  x   = np.asarray(x).ravel()
+  ref = np.asarray(ref).ravel()
+  stats[0] = ref.size
+  if x.size != ref.size:
+    stats[1] = max(x.size, ref.size)
+    stats[2] = 1
+  elif x.dtype.kind == 'f':
+    diff = np.abs(x.astype(np.float64) - ref)
+    stats[1] = np.count_nonzero(diff)
+    stats[3] = sq_norm(diff)
+    stats[4] = sq_norm(ref.astype(np.float64))
+    if ref.size > 0:
+      stats[5] = diff.max()
+      stats[6] = np.abs(ref).max()
+  else:
+    stats[1] = np.count_nonzero(x != ref)
+  return stats
+
+def _sum_max_op(in_mem, inout_mem, datatype):
+  stats_in    = np.frombuffer(in_mem,    dtype=np.float64).reshape(-1, _N_STATS)
+  stats_inout = np.frombuffer(inout_mem, dtype=np.float64).reshape(-1, _N_STATS)
+  n_sum = len(_SUM_STATS)
+  stats_inout[:,:n_sum] += stats_in[:,:n_sum]
+  np.maximum(stats_inout[:,n_sum:], stats_in[:,n_sum:], out=stats_inout[:,n_sum:])
+
+def _reduce_diff_stats(local_stats, comm):
+  """ Reduce the statistics of all the arrays with a single collective call """
+  local_stats  = np.ascontiguousarray(local_stats, dtype=np.float64).reshape(-1, _N_STATS)
+  global_stats = np.empty_like(local_stats)
+  n_arrays = local_stats.shape[0]
+  stats_type = MPI.DOUBLE.Create_contiguous(_N_STATS).Commit()
+  sum_max = MPI.Op.Create(_sum_max_op, commute=True)
+  try:
+    comm.Allreduce([local_stats, n_arrays, stats_type], [global_stats, n_arrays, stats_type], op=sum_max)
+  finally:
+    sum_max.Free()
+    stats_type.Free()
+  return global_stats
+
+def _diff_norms(stats):
+  with np.errstate(divide='ignore', invalid='ignore'):
+    return {'max_abs' : stats[5],
+            'max_rel' : stats[5] / stats[6],
+            'l2'      : np.sqrt(stats[3]),
+            'rel_l2'  : np.sqrt(stats[3] / stats[4])}
+
+class _dist_diff_visitor:
+  def __init__(self, strict_value_type, tol, comm, max_diffs, batch_size):
+    self.strict_value_type = strict_value_type
+    self.tol = tol
+    self.comm = comm
+    self.max_diffs = max_diffs
+    self.batch_size = batch_size
+    self.err_report = ''
+    self.warn_report = ''
+    self.n_diffs = 0
+    self.norms = {}
+    self._pending = [] # (path, is_float, local stats) of the arrays to reduce
+
+  def _record_value(self, nodes_stack):
+    n0, n1 = nodes_stack[-1]
+    path = PT.compare._zip_path(nodes_stack[:-1]) + PT.get_name(n0)
+    x   = PT.get_value(n0, raw=True)
+    ref = PT.get_value(n1, raw=True)
+    if x is not None:
+      is_float = np.asarray(ref).dtype.kind == 'f'
+      self._pending.append((path, is_float, _local_diff_stats(x, ref)))
+    return True, '', ''
+
+  def _limit_reached(self):
+    return self.max_diffs is not None and self.n_diffs >= self.max_diffs
+
+  def flush(self):
+    """ Reduce the pending statistics and update the reports """
+    if len(self._pending) == 0:
+      return
+    global_stats = _reduce_diff_stats([stats for _, _, stats in self._pending], self.comm)
+    for (path, is_float, _), stats in zip(self._pending, global_stats):
+      if is_float:
+        self.norms[path] = _diff_norms(stats)
+      if stats[1] == 0 or self._limit_reached():
+        continue
+      if stats[2] > 0:
+        self.err_report += f'{path} -- Values differ: array sizes differ\n'
+        self.n_diffs += 1
+      elif is_float:
+        norms = self.norms[path]
+        msg = f"{int(stats[1])} values are different, max abs diff: {norms['max_abs']:.3e}, " \
+              f"max rel diff: {norms['max_rel']:.3e}, L2 diff: {norms['l2']:.3e}, rel L2 error: {norms['rel_l2']:.3e}"
+        if norms['rel_l2'] <= self.tol:
+          self.warn_report += f'{path} -- Values differ: {msg}\n'
+        else:
+          self.err_report += f'{path} -- Values differ: {msg}\n'
+          self.n_diffs += 1
+      else:
+        self.err_report += f'{path} -- Values differ: {int(stats[1])} values are different\n'
+        self.n_diffs += 1
+    self._pending = []
+
+  def pre(self, nodes_stack):
+    next_step, _, err_report, _ = PT.compare.diff_nodes(nodes_stack, self.strict_value_type, self._record_value)
+    if err_report != '' and not self._limit_reached():
+      self.err_report += err_report
+      self.n_diffs += 1
+    if len(self._pending) >= self.batch_size:
+      self.flush()
+    if self._limit_reached():
+      return step.out
+    return next_step
+
+def diff_dist_tree(t1, t2, comm, tol=0., strict_value_type=True, max_diffs=None, batch_size=None):
+  """ Report the differences between two distributed trees.
+
+  Both trees must have the same distribution, which is the case when they are
+  loaded with :func:`~maia.io.file_to_dist_tree` on the same communicator.
+  Each rank compares its own slabs of data, and the results for all the arrays
+  are gathered using a single collective reduction (instead of one per array).
+  In addition, the following norms are computed for each floating point array:
+  max abs diff, max rel diff (max abs diff divided by the max abs value of the reference),
+  L2 norm of the difference and relative L2 error.
+
+  Floating point arrays whose relative L2 error is lower than ``tol`` are reported
+  as warnings; other differences are reported as errors.
+
+  Args:
+    t1 (CGNSTree): first distributed tree
+    t2 (CGNSTree): second distributed tree, used as reference for the relative norms
+    comm (MPIComm): MPI communicator
+    tol (float, optional): relative tolerance for floating point arrays. Defaults to 0.
+    strict_value_type (bool, optional): Behavior when the nodes have compatible but
+      different types (I4/I8 or R4/R8)
+    max_diffs (int, optional): if provided, stop the comparison once this number
+      of differences has been found. Defaults to None (no limit).
+    batch_size (int, optional): number of arrays compared between two reductions.
+      Defaults to None, meaning a single reduction if ``max_diffs`` is None, and
+      batches of 1024 arrays otherwise.
+  Returns:
+    Tuple (bool, str, str, dict): is_ok, error report, warning report, and the dictionnary
+    of the norms of the differences for each floating point array (keys are the paths of the
+    arrays, values are dictionnaries with keys ``max_abs``, ``max_rel``, ``l2`` and ``rel_l2``)
+  """
+  if batch_size is None:
+    batch_size = np.inf if max_diffs is None else 1024
+  v = _dist_diff_visitor(strict_value_type, tol, comm, max_diffs, batch_size)
+  zip_depth_first_search([t1,t2], v, depth='all')
+  v.flush()
+  return v.n_diffs == 0, v.err_report, v.warn_report, v.norms
@@ -1,5 +1,12 @@
+import importlib
+
 from .           import conventions as conv
-from .           import pdm_elts
 from .           import metrics
 from .maia_nodes import *
 from .tree       import *
+
+def __getattr__(name):
+  # pdm_elts requires ParaDiGM, so it is only imported when used
+  if name == 'pdm_elts':
+    return importlib.import_module(f'{__name__}.pdm_elts')
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,6 @@
 import sys
+import numpy as np
 from maia.pytree.typing import *
-import maia.pytree as PT
 
 def _is_distributed(node, parent):
   if node[3] == 'IndexArray_t':
@@ -13,6 +13,45 @@ def _is_distributed(node, parent):
   if node[0] in ['PointList', 'PointListDonor']:
     return True
 
+def _memory_category(node, parent):
+  """ Return the category in which the value of node is accounted """
+  if parent is not None and parent[0] == ':CGNS#GlobalNumbering':
+    return 'GlobalNumbering'
+  if node[3] == 'IndexArray_t':
+    return node[0] # PointList, PointListDonor, ...
+  if node[3] == 'DataArray_t' and parent is not None and parent[3] != 'UserDefinedData_t':
+    return parent[3]
+  return node[3]
+
+def _meta_nbytes(node):
+  return sys.getsizeof(node) + sys.getsizeof(node[0]) + sys.getsizeof(node[2]) + sys.getsizeof(node[3])
+
+def _owner(array):
+  """ Return the array owning the memory of a numpy array (array itself if it is not a view) """
+  while isinstance(array.base, np.ndarray):
+    array = array.base
+  return array
+
+def _iter_owned_values(tree):
+  """ Yield the (node, parent, nbytes) tuples for each node of the tree, nbytes being the size
+  of the memory buffer of the node value. Buffers shared by several nodes (views of a same array)
+  are counted once, for the first node encountered. Values which are not numpy arrays
+  (eg. lazy arrays) are only asked for their nbytes, so that their data are not loaded """
+  seen = set()
+  stack = [(tree, None)]
+  while stack:
+    node, parent = stack.pop()
+    nbytes = 0
+    if isinstance(node[1], np.ndarray):
+      owner = _owner(node[1])
+      if id(owner) not in seen:
+        seen.add(id(owner))
+        nbytes = owner.nbytes
+    elif node[1] is not None:
+      nbytes = node[1].nbytes
+    yield node, parent, nbytes
+    stack.extend((child, node) for child in reversed(node[2]))
+
 def dtree_nbytes(tree:CGNSTree) -> Tuple[int,int,int]:
   """Compute the approximate size (in bytes) of a distributed tree.
 
@@ -20,23 +59,54 @@ def dtree_nbytes(tree:CGNSTree) -> Tuple[int,int,int]:
   - metadata size (size of names, labels and pytree structure ~= everything but node values)
   - global data size (size of undistributed data; distribution arrays [start,end,tot] also counted here)
   - distributed data size (local size of distributed arrays)
+
+  Memory buffers shared by several nodes are counted once.
   """
-  class size_recorder:
-    def __init__(self):
-      self.meta_size = 0
-      self.glob_size = 0
-      self.dist_size = 0
+  meta_size = 0
+  glob_size = 0
+  dist_size = 0
+  for node, parent, nbytes in _iter_owned_values(tree):
+    meta_size += _meta_nbytes(node)
+    if parent is not None and _is_distributed(node, parent):
+      dist_size += nbytes
+    else:
+      glob_size += nbytes
+
+  return (meta_size, glob_size, dist_size)
 
-    def pre(self, parent, node):
-      self.meta_size += sys.getsizeof(node) + sys.getsizeof(node[0]) + sys.getsizeof(node[2]) + sys.getsizeof(node[3])
-      if node[1] is not None:
-        if _is_distributed(node, parent):
-          self.dist_size += node[1].nbytes
-        else:
-          self.glob_size += node[1].nbytes
+def nbytes_per_category(tree:CGNSTree) -> Dict[str,int]:
+  """Compute the size (in bytes) of the data of a tree, by category.
 
-  v = size_recorder()
-  PT.graph.cgns.depth_first_search(tree, v, depth='parent')
+  The category of a value is the label of its parent node for DataArray_t nodes
+  (eg. ``Elements_t``, ``FlowSolution_t``), the name of the node for IndexArray_t nodes
+  (eg. ``PointList``), ``GlobalNumbering`` for the global numbering arrays, and the
+  label of the node otherwise. Size of names, labels and pytree structure is
+  reported in the ``Metadata`` category.
+  Memory buffers shared by several nodes are counted once.
 
-  return (v.meta_size, v.glob_size, v.dist_size)
+  Works on distributed trees as well as on partitioned trees.
+  """
+  sizes = {'Metadata' : 0}
+  for node, parent, nbytes in _iter_owned_values(tree):
+    sizes['Metadata'] += _meta_nbytes(node)
+    if nbytes > 0:
+      category = _memory_category(node, parent)
+      sizes[category] = sizes.get(category, 0) + nbytes
+  return sizes
 
+def memory_report(tree:CGNSTree, comm) -> Dict[str,Tuple[int,int,int]]:
+  """Compute the memory used by a distributed or partitioned tree over the ranks of comm.
+
+  For each category of :func:`nbytes_per_category`, and for the ``Total`` size, the
+  returned dictionnary provides a 3-tuple (min, max, sum) of the sizes (in bytes) over the ranks.
+  This function must be called by all the ranks of comm.
+  """
+  sizes = nbytes_per_category(tree)
+  sizes['Total'] = sum(sizes.values())
+  all_sizes = comm.allgather(sizes)
+  categories = sorted(set().union(*all_sizes), key=lambda c: (c in ['Metadata', 'Total'], c))
+  report = {}
+  for category in categories:
+    rank_sizes = [rank_size.get(category, 0) for rank_size in all_sizes]
+    report[category] = (min(rank_sizes), max(rank_sizes), sum(rank_sizes))
+  return report
@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 
 import maia.pytree as PT
+import pytest_parallel
 
 from maia.pytree.maia import metrics
 
@@ -12,3 +13,48 @@ def test_dtree_nbytes():
   assert 800 <= sizes[0] and sizes[0] <= 1400 # Architecture dependant
   assert sizes[1] == 12
   assert sizes[2] == 800
+
+def test_dtree_nbytes_shared():
+  zone = PT.new_Zone('Zone', type='Unstructured')
+  coords = np.ones(300, dtype=float)
+  PT.new_GridCoordinates(fields={'cx':coords[0:100], 'cy':coords[100:200], 'cz':coords[200:300]}, parent=zone)
+  PT.new_FlowSolution('FS', fields={'cx':coords}, parent=zone)
+  sizes = metrics.dtree_nbytes(zone)
+  assert sizes[1] == 12
+  assert sizes[2] == 2400 # Shared buffer is counted once
+
+def test_dtree_nbytes_not_ndarray():
+  class LazyArray: # Mimics an array whose data are read at first access
+    nbytes = 800
+    def __getattr__(self, name):
+      raise RuntimeError("Data should not be accessed")
+  zone = PT.new_Zone('Zone', type='Unstructured')
+  coords = PT.new_GridCoordinates(parent=zone)
+  PT.new_DataArray('cx', np.ones(100, dtype=float), parent=coords)
+  PT.get_child_from_name(coords, 'cx')[1] = LazyArray()
+  assert metrics.dtree_nbytes(zone)[2] == 800
+
+def test_nbytes_per_category():
+  zone = PT.new_Zone('Zone', type='Unstructured')
+  PT.new_GridCoordinates(fields={'cx':np.ones(100, dtype=float)}, parent=zone)
+  PT.new_NGonElements(erange=[1,10], ec=np.ones(40, np.int32), eso=np.arange(0,41,4, dtype=np.int32), parent=zone)
+  bc = PT.new_BC('BC', point_list=np.ones((1,10), np.int32), parent=PT.new_ZoneBC(parent=zone))
+  PT.maia.newGlobalNumbering({'Index' : np.ones(10, np.int64)}, parent=bc)
+  sizes = metrics.nbytes_per_category(zone)
+  assert sizes['GridCoordinates_t'] == 800
+  assert sizes['Elements_t'] == 212 # ElementType + ElementConnectivity + ElementStartOffset
+  assert sizes['PointList'] == 40
+  assert sizes['GlobalNumbering'] == 80
+  assert sizes['Metadata'] > 0
+
+@pytest_parallel.mark.parallel(2)
+def test_memory_report(comm):
+  zone = PT.new_Zone('Zone', type='Unstructured')
+  PT.new_GridCoordinates(fields={'cx':np.ones(100*(comm.Get_rank()+1), dtype=float)}, parent=zone)
+  if comm.Get_rank() == 1:
+    PT.new_FlowSolution('FS', fields={'rho':np.ones(10, dtype=float)}, parent=zone)
+  report = metrics.memory_report(zone, comm)
+  assert list(report.keys()) == ['FlowSolution_t', 'GridCoordinates_t', 'ZoneType_t', 'Metadata', 'Total']
+  assert report['GridCoordinates_t'] == (800, 1600, 2400)
+  assert report['FlowSolution_t'] == (0, 80, 80)
+  assert report['ZoneType_t'] == (12, 12, 24)
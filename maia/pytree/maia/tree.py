@@ -3,13 +3,12 @@ import numpy as np
 from maia.pytree.typing import *
 import maia.pytree      as PT
 
-from maia.transfer import protocols as EP
-
-from maia.utils          import np_utils, py_utils
-from maia.utils.parallel import algo as par_algo
+# Parallel dependencies (maia.utils, maia.transfer) are imported in the functions
+# to keep maia.pytree importable without MPI
 
 # Note : these two will probably go elsewhere in maia or directly in PDM
 def _encode(strings):
+  from maia.utils import np_utils
   bstrings = [s.encode() for s in strings]
   stride = np.array([len(bs) for bs in bstrings], np.int32)
 
@@ -22,6 +21,7 @@ def _encode(strings):
   return stride, buff
 
 def _decode(stride, buff):
+  from maia.utils import np_utils
   stride_idx = np_utils.sizes_to_indices(stride)
   return [bytes(buff[stride_idx[i]:stride_idx[i+1]]).decode() for i in range(stride.size)]
 
@@ -35,6 +35,9 @@ def rename_zones(part_tree:CGNSTree, old_to_new_path:Dict[str,str], comm):
   New names must be a list of size nb. zones in the parttree, giving the
   new path of each zone (note that the base name is not allowed to change)
   """
+  from maia.transfer       import protocols as EP
+  from maia.utils          import py_utils
+  from maia.utils.parallel import algo as par_algo
 
   zones_path_ini = list(old_to_new_path.keys())
   new_names = list(old_to_new_path.values())
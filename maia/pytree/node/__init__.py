@@ -3,3 +3,4 @@ from .create        import *
 from .presets       import *
 from .print         import *
 from .name_utils    import *
+from .npz           import *
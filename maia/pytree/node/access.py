@@ -27,6 +27,9 @@ def _convert_value(value):
   """
   Convert a Python input to a compliant pyCGNS value
   """
+  # Fast path : numpy arrays, which are the most frequent input, skip the type dispatch
+  if type(value) is np.ndarray:
+    return value if value.flags.f_contiguous else np.asfortranarray(value)
   result = None
   # value is None : immediate return
   if value is None:
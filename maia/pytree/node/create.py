@@ -1,6 +1,9 @@
+import warnings
+
 from maia.pytree.typing import *
 from maia.pytree import walk
 from .           import access as NA
+from .           import check
 
 UNSET = Ellipsis
 
@@ -82,6 +85,59 @@ def new_child(parent:CGNSTree, name:str, label:str='UserDefined_t', value:Any=No
   """
   return new_node(name, label, value, children, parent)
 
+def new_children(parent:CGNSTree, names:List[str], label:str='UserDefined_t', values:List[Any]=None) -> List[CGNSTree]:
+  """ Create several CGNS nodes as children of an other node
+
+  This is a bulk version of :func:`new_child` for sibling nodes sharing the same label,
+  which avoids the per node checks: the label is checked once, and the uniqueness of the
+  names is checked for all the nodes at once. Values which are numpy arrays of a CGNS
+  datatype are used without conversion; other values are converted as in :func:`set_value`.
+
+  Args:
+    parent (CGNSTree): Node to which created nodes are attached
+    names (List[str]): Names of the created nodes
+    label (str): Label of the created nodes
+    values (List[Any], optional): Values of the created nodes, in the same order
+      than ``names``. Defaults to None (nodes have no value).
+  Returns:
+    List[CGNSTree]: Created nodes
+  Raises:
+    ValueError: If label or one of the names is not valid
+    RuntimeError: If a name is duplicated or already used by a child of ``parent``
+  Example:
+    >>> fs = PT.new_node('FlowSolution', label='FlowSolution_t')
+    >>> nodes = PT.new_children(fs, ['Density', 'Pressure'], 'DataArray_t',
+    ...                         [np.ones(3), np.zeros(3)])
+    >>> PT.print_tree(fs)
+    FlowSolution FlowSolution_t 
+    ├───Density DataArray_t R8 [1. 1. 1.]
+    └───Pressure DataArray_t R8 [0. 0. 0.]
+  """
+  names = list(names)
+  if values is None:
+    values = [None] * len(names)
+  elif len(values) != len(names):
+    raise ValueError("Can not create children: names and values must have the same size")
+
+  if not check.is_valid_label(label, only_sids=False):
+    raise ValueError("Unvalid label for node")
+  if not check.is_valid_label(label, only_sids=True):
+    warnings.warn("Setting a CGNS node label with a non sids label", RuntimeWarning, stacklevel=2)
+  if not all(check.is_valid_name(name, check_len=False) for name in names):
+    raise ValueError("Unvalid name for node")
+  if not all(check.is_valid_name(name, check_len=True) for name in names):
+    warnings.warn("Setting a CGNS node name with a string longer than 32 char", RuntimeWarning, stacklevel=2)
+
+  used_names = set(NA.get_names(NA.get_children(parent)))
+  for name in names:
+    if name in used_names:
+      raise RuntimeError(f'Can not add child {name} to node {NA.get_name(parent)}: a node with the same name already exists')
+    used_names.add(name)
+
+  nodes = [[name, NA._convert_value(value), [], label] for name, value in zip(names, values)]
+  NA.get_children(parent).extend(nodes)
+  return nodes
+
 def update_child(parent:CGNSTree, name:str, label:str=UNSET, value:Any=UNSET, children:List[CGNSTree]=UNSET) -> CGNSTree:
   """
   update_child(parent, name, label=UNSET, value=UNSET, children=UNSET)
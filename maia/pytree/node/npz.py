@@ -0,0 +1,69 @@
+import numpy as np
+
+from maia.pytree.typing import *
+
+def to_npz(tree:CGNSTree, file, compressed:bool=False) -> None:
+  """
+  Write a CGNSTree in a binary ``.npz`` archive.
+
+  The names, the labels and the topology of the nodes are stored in three arrays,
+  and each node value is stored as a raw numpy array, keeping its dtype and memory order:
+  reading back the archive with :func:`from_npz` gives a tree identical to the input tree.
+  This format is much faster to load than the YAML format, which makes it suitable
+  for snapshot trees or to transfer trees between processes.
+
+  Args:
+    tree       (CGNSTree) : Node to be written (with its children)
+    file       (str or file) : Path of the archive, or file-like object opened in binary mode
+    compressed (bool)     : If True, compress the archive. Defaults to False.
+  Example:
+    >>> import io
+    >>> zone = PT.new_Zone('Zone', size=[[8,1,0]], type='Unstructured')
+    >>> f = io.BytesIO()
+    >>> PT.to_npz(zone, f)
+    >>> _ = f.seek(0)
+    >>> PT.is_same_tree(PT.from_npz(f), zone)
+    True
+  """
+  names, labels, parents, values = [], [], [], {}
+  stack = [(tree, -1)]
+  # Nodes are numbered in preorder, so a parent always comes before its children
+  while stack:
+    node, parent = stack.pop()
+    i_node = len(names)
+    names.append(node[0])
+    labels.append(node[3])
+    parents.append(parent)
+    if node[1] is not None:
+      values[f'v{i_node}'] = node[1]
+    for child in reversed(node[2]):
+      stack.append((child, i_node))
+
+  save = np.savez_compressed if compressed else np.savez
+  save(file, names=np.array(names, dtype=str), labels=np.array(labels, dtype=str),
+             parents=np.array(parents, dtype=np.int64), **values)
+
+def from_npz(file) -> CGNSTree:
+  """
+  Read a CGNSTree from a binary ``.npz`` archive created by :func:`to_npz`.
+
+  Args:
+    file (str or file) : Path of the archive, or file-like object opened in binary mode
+  Returns:
+    CGNSTree: Node read from the archive
+  Example:
+    >>> PT.to_npz(PT.new_CGNSTree(), 'tree.npz')
+    >>> PT.get_name(PT.from_npz('tree.npz'))
+    'CGNSTree'
+  """
+  with np.load(file, allow_pickle=False) as data:
+    keys = set(data.files)
+    nodes = []
+    for i_node, (name, label, parent) in enumerate(zip(data['names'], data['labels'], data['parents'])):
+      value_key = f'v{i_node}'
+      value = data[value_key] if value_key in keys else None
+      node = [str(name), value, [], str(label)]
+      if parent >= 0:
+        nodes[parent][2].append(node)
+      nodes.append(node)
+  return nodes[0]
@@ -4,7 +4,7 @@ from maia.pytree.typing import *
 from maia.pytree.cgns_keywords import cgns_to_dtype
 
 from maia.pytree.node import access as NA
-from maia.pytree.node import new_node
+from maia.pytree.node import new_node, new_children
 
 
 def _check_parent_label(node, parent, allowed_list):
@@ -638,8 +638,7 @@ def new_GridCoordinates(name:str='GridCoordinates', *, fields:Dict[str,ArrayLike
   """
   gc = new_node(name, 'GridCoordinates_t', parent=parent)
   _check_parent_label(gc, parent, ['Zone_t'])
-  for field_name, field_val in fields.items():
-    new_DataArray(field_name, field_val, parent=gc)
+  new_children(gc, fields.keys(), 'DataArray_t', list(fields.values()))
   return gc
 
 def new_FlowSolution(name:str = 'FlowSolution',
@@ -669,8 +668,7 @@ def new_FlowSolution(name:str = 'FlowSolution',
   _check_parent_label(sol, parent, ['Zone_t'])
   if loc is not None:
     new_GridLocation(loc, sol)
-  for field_name, field_val in fields.items():
-    new_DataArray(field_name, field_val, parent=sol)
+  new_children(sol, fields.keys(), 'DataArray_t', list(fields.values()))
   return sol
 
 def new_ZoneSubRegion(name:str = 'ZoneSubRegion',
@@ -735,6 +733,5 @@ def new_ZoneSubRegion(name:str = 'ZoneSubRegion',
   if gc_name is not None:
     assert point_list is None and point_range is None and bc_name is None
     new_node('GridConnectivityRegionName', 'Descriptor_t', gc_name, parent=zsr)
-  for field_name, field_val in fields.items():
-    new_DataArray(field_name, field_val, parent=zsr)
+  new_children(zsr, fields.keys(), 'DataArray_t', list(fields.values()))
   return zsr
@@ -35,6 +35,15 @@ def test_convert_value():
   np_array = np.array([[1,2,3], [4,5,6]], order='C')
   converted = NA._convert_value(np_array)
   assert (converted == np_array).all() and converted.flags.f_contiguous == True
+  np_array = np.array([1,2,3], np.int16) # Not a CGNS datatype
+  assert NA._convert_value(np_array) is np_array
+  # Arrays of CGNS datatypes are returned unchanged, by the fast path as well as
+  # by the generic path (used for subclasses of ndarray)
+  for dtype in [np.int32, np.int64, np.float32, np.float64, np.dtype('S1')]:
+    np_array = np.zeros((3,2), dtype, order='F')
+    assert NA._convert_value(np_array) is np_array
+    np_subarray = np_array.view(np.memmap)
+    assert NA._convert_value(np_subarray) is np_subarray
 
   # Iterables
   converted = NA._convert_value(["Spaaaaaam", "eggs"])
@@ -44,6 +44,33 @@ def test_new_child():
   with pytest.raises(Exception):
     child = create.new_child(node, 'Transform', 'Transform_t', [3,2,1])
 
+def test_new_children():
+  node = create.new_node('FlowSolution', 'FlowSolution_t')
+  create.new_child(node, 'GridLocation', 'GridLocation_t', 'CellCenter')
+  data = [np.ones(3), np.array([[1,2],[3,4]], order='C'), [1.,2.]]
+  children = create.new_children(node, ['Density', 'Index', 'Pressure'], 'DataArray_t', data)
+  assert NA.get_names(NA.get_children(node)) == ['GridLocation', 'Density', 'Index', 'Pressure']
+  assert NA.get_children(node)[1:] == children
+  assert NA.get_value(children[0]) is data[0]
+  assert NA.get_value(children[1]).flags.f_contiguous
+  assert NA.get_value(children[2]).dtype == np.float32
+  assert all(NA.get_label(child) == 'DataArray_t' for child in children)
+
+  children = create.new_children(node, ['A', 'B'], 'UserDefinedData_t')
+  assert NA.get_value(children[0]) is None and NA.get_value(children[1]) is None
+
+  with pytest.raises(RuntimeError):
+    create.new_children(node, ['Density'], 'DataArray_t', [np.zeros(3)])
+  with pytest.raises(RuntimeError):
+    create.new_children(node, ['C', 'C'], 'DataArray_t', [np.zeros(3), np.zeros(3)])
+  with pytest.raises(ValueError):
+    create.new_children(node, ['D', 'E'], 'DataArray_t', [np.zeros(3)])
+  with pytest.raises(ValueError):
+    create.new_children(node, ['F/G'], 'DataArray_t')
+  assert len(NA.get_children(node)) == 6
+  with pytest.warns(RuntimeWarning):
+    create.new_children(node, ['H'], 'NotSIDS_t')
+
 def test_update_child():
   node = create.new_node('match', 'GridConnectivity1to1_t', "OtherZone")
   child = create.update_child(node, 'Transform', 'Transform_t', [1,2,3])
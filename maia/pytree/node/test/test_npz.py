@@ -0,0 +1,51 @@
+import io
+import numpy as np
+from pathlib import Path
+
+import maia.pytree as PT
+from maia.pytree.yaml import parse_yaml_cgns, parse_cgns_yaml
+
+from maia.pytree.node import npz
+
+yt = """
+Base CGNSBase_t [3,3]:
+  Zone Zone_t I8 [[4,1,0]]:
+    ZoneType ZoneType_t "Unstructured":
+    GridCoordinates GridCoordinates_t:
+      CoordinateX DataArray_t R8 [0., 1., 0., 0.]:
+      CoordinateY DataArray_t R4 [0., 0., 1., 0.]:
+    Tetra Elements_t I4 [10,0]:
+      ElementRange IndexRange_t I4 [1,1]:
+      ElementConnectivity DataArray_t I8 [1,2,3,4]:
+    ZoneBC ZoneBC_t:
+  Family Family_t:
+"""
+
+def test_to_from_npz(tmp_path):
+  tree = parse_yaml_cgns.to_cgns_tree(yt)
+  npz.to_npz(tree, tmp_path / 'tree.npz')
+  read_tree = npz.from_npz(tmp_path / 'tree.npz')
+
+  assert PT.is_same_tree(read_tree, tree)
+  for node, read_node in zip(PT.iter_nodes_from_predicate(tree, lambda n: True, explore='deep'),
+                             PT.iter_nodes_from_predicate(read_tree, lambda n: True, explore='deep')):
+    assert PT.get_name(read_node) == PT.get_name(node)
+    if PT.get_value(node) is None:
+      assert PT.get_value(read_node) is None
+    else:
+      assert read_node[1].dtype == node[1].dtype
+      assert read_node[1].flags.f_contiguous
+  # Round trip with yaml
+  assert parse_cgns_yaml.to_yaml(read_tree) == parse_cgns_yaml.to_yaml(tree)
+
+def test_to_from_npz_buffer():
+  zone = PT.get_node_from_label(parse_yaml_cgns.to_cgns_tree(yt), 'Zone_t')
+  PT.new_DataArray('Array2D', np.arange(6, dtype=np.int32).reshape((2,3), order='F'), parent=zone)
+  for compressed in [False, True]:
+    f = io.BytesIO()
+    npz.to_npz(zone, f, compressed)
+    f.seek(0)
+    read_zone = npz.from_npz(f)
+    assert PT.is_same_tree(read_zone, zone)
+    assert np.array_equal(PT.get_node_from_name(read_zone, 'Array2D')[1], np.arange(6).reshape((2,3), order='F'))
+    assert PT.get_node_from_name(read_zone, 'Array2D')[1].flags.f_contiguous
@@ -1,5 +1,8 @@
 import numpy as np
 import itertools
+import functools
+import contextvars
+from contextlib import contextmanager
 
 from maia.pytree.typing import *
 
@@ -24,6 +27,64 @@ class PeriodicValues(NamedTuple):
       return self._asdict()
 
 
+# Scoped cache for the inspection functions (see cache_inspectors). Each thread
+# has its own context, so the cache is not shared with other threads
+_inspectors_cache = contextvars.ContextVar('inspectors_cache', default=None)
+
+@contextmanager
+def cache_inspectors():
+  """ Context manager enabling the memoisation of the node inspection functions.
+
+  Within this context, the result of the most expensive inspection functions
+  of Zone and Subset (those scanning the Elements_t nodes or the children of the
+  zone, such as NGonNode, n_face or get_ordered_elements) is stored the first time they are called on a given node (keyed by node identity),
+  and reused for the next calls. The cache is cleared when the
+  outermost context exits. The cache is only used by the current thread.
+
+  Warning:
+    The inspected nodes must not be modified within the context, otherwise
+    outdated values could be returned.
+
+  Example:
+    >>> zone = PT.new_Zone(type='Unstructured', size=[[11,10,0]])
+    >>> with PT.cache_inspectors():
+    ...   for i in range(100):
+    ...     n_cell = PT.Zone.n_cell(zone) # Computed only once
+  """
+  is_outermost = _inspectors_cache.get() is None
+  if is_outermost:
+    token = _inspectors_cache.set({})
+  try:
+    yield
+  finally:
+    if is_outermost:
+      _inspectors_cache.reset(token)
+
+def _cached_inspector(copy=None):
+  """ Decorator storing the results of the function in the active inspectors cache, if any.
+  Node arguments are identified by their id, and kept in the cache entry to prevent
+  the reuse of this id. If provided, copy is applied to the cached result before
+  returning it, to protect the cache from in place modifications by the caller. """
+  def _decorator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+      cache = _inspectors_cache.get()
+      if cache is None or kwargs:
+        return func(*args, **kwargs)
+      key = (func, *[id(arg) if isinstance(arg, list) else arg for arg in args])
+      try:
+        entry = cache.get(key)
+      except TypeError: # Unhashable argument
+        return func(*args, **kwargs)
+      if entry is None or any(a is not b for a, b in zip(entry[0], args)):
+        entry = (args, func(*args))
+        cache[key] = entry
+      return entry[1] if copy is None else copy(entry[1])
+    return wrapper
+  return _decorator
+
+_copy_nested_list = lambda l: [list(sub_l) for sub_l in l]
+
 # --------------------------------------------------------------------------
 @for_all_methods(check_is_label("CGNSTree_t"))
 class Tree:
@@ -219,6 +280,7 @@ class Zone:
     return n_face
 
   @staticmethod
+  @_cached_inspector()
   def NGonNode(zone_node:CGNSTree) -> CGNSTree:
     """Return the Element_t node of kind ``NGON_n`` of a Zone_t node
     
@@ -234,6 +296,7 @@ class Zone:
     return utils.expects_one(ngons, ("NGon node", f"zone {N.get_name(zone_node)}"))
 
   @staticmethod
+  @_cached_inspector()
   def NFaceNode(zone_node:CGNSTree) -> CGNSTree:
     """Return the Element_t node of kind ``NFACE_n`` of a Zone_t node
     
@@ -249,6 +312,7 @@ class Zone:
     return utils.expects_one(nfaces, ("NFace node", f"zone {N.get_name(zone_node)}"))
 
   @staticmethod
+  @_cached_inspector()
   def VertexBoundarySize(zone_node:CGNSTree) -> Union[int, np.ndarray]:
     """
     Return the number of boundary vertices per direction of a Zone_t node
@@ -316,6 +380,7 @@ class Zone:
     return np.prod(Zone.CellSize(zone_node))
 
   @staticmethod
+  @_cached_inspector()
   def n_face(zone_node:CGNSTree) -> int:
     """
     Return the total number of faces of a Zone_t node
@@ -351,6 +416,7 @@ class Zone:
     return np.prod(Zone.VertexBoundarySize(zone_node))
 
   @staticmethod
+  @_cached_inspector()
   def has_ngon_elements(zone_node: CGNSTree) -> bool:
     """ Return True if some Element_t node of kind ``NGON_n`` exists in the Zone_t node
 
@@ -368,6 +434,7 @@ class Zone:
     return W.get_child_from_predicate(zone_node, predicate) is not None
 
   @staticmethod
+  @_cached_inspector()
   def has_nface_elements(zone_node:CGNSTree) -> bool:
     """ Return True if some Element_t node of kind ``NFACE_n`` exists in the Zone_t node
 
@@ -427,6 +494,7 @@ class Zone:
     return face_vtx_idx, face_vtx, ngon_pe
 
   @staticmethod
+  @_cached_inspector(copy=list)
   def get_ordered_elements(zone_node:CGNSTree) -> List[CGNSTree]:
     """ Return the Elements under a Zone_t node, sorted according to their ElementRange
     
@@ -445,6 +513,7 @@ class Zone:
                   key = lambda item : Element.Range(item)[0])
 
   @staticmethod
+  @_cached_inspector(copy=_copy_nested_list)
   def get_ordered_elements_per_dim(zone_node:CGNSTree) -> List[List[CGNSTree]]:
     """Return the Elements under a Zone_t node, gathered according to their dimension
 
@@ -466,6 +535,7 @@ class Zone:
     return utils.bucket_split(Zone.get_ordered_elements(zone_node), lambda e: Element.Dimension(e), size=4)
 
   @staticmethod
+  @_cached_inspector(copy=_copy_nested_list)
   def get_elt_range_per_dim(zone_node:CGNSTree) -> List[List[int]]:
     """ Return the min & max element number of each dimension found in a Zone_t node
 
@@ -500,6 +570,7 @@ class Zone:
     return range_by_dim
 
   @staticmethod
+  @_cached_inspector()
   def elt_ordering_by_dim(zone_node:CGNSTree):
     """Return a flag indicating if elements belonging to a Zone_t node are sorted
     
@@ -528,6 +599,7 @@ class Zone:
     return status
 
   @staticmethod
+  @_cached_inspector()
   def CellDimension(zone_node:CGNSTree) -> int:
     """ Return the CellDimension of a Zone_t node
 
@@ -872,6 +944,7 @@ class Subset:
         raise ValueError("Subset does not seems to have a structured PointRange")
 
   @staticmethod
+  @_cached_inspector()
   def ZSRExtent(zsr_node:CGNSTree, zone_node:CGNSTree) -> str:
     """
     Return the path of the node to which the ZoneSubRegion node maps
@@ -1,4 +1,5 @@
 import pytest
+import threading
 import numpy              as np
 
 from maia.pytree      import node as N
@@ -389,4 +390,42 @@ Zone Zone_t:
   with pytest.raises(ValueError):
     SIDS.Subset.ZSRExtent(W.get_node_from_name(zone, 'OrphelanZSR'), zone)
   with pytest.raises(PT.CGNSLabelNotEqualError):
-    SIDS.Subset.ZSRExtent(W.get_node_from_name(zone, 'WrongZSR'), zone)
\ No newline at end of file
+    SIDS.Subset.ZSRExtent(W.get_node_from_name(zone, 'WrongZSR'), zone)
+
+def test_cache_inspectors():
+  import maia.pytree as PT
+  zone = N.new_Zone('Zone', size=[[100, 36, 0]], type='Unstructured')
+  N.new_Elements('ElemA', type='HEXA_8', erange=[11, 53], parent=zone)
+  N.new_Elements('ElemB', type='HEXA_8', erange=[1, 10],  parent=zone)
+  bc = N.new_BC('BC', loc='FaceCenter', point_list=[[1,2,3,4]])
+
+  with SIDS.cache_inspectors():
+    assert SIDS.Zone.VertexBoundarySize(zone) == 0
+    elts = SIDS.Zone.get_ordered_elements(zone)
+    assert [N.get_name(elt) for elt in elts] == ['ElemB', 'ElemA']
+    elts.pop() # Returned list is a copy
+    assert len(SIDS.Zone.get_ordered_elements(zone)) == 2
+    # Nodes should not be modified in context : previous values are returned
+    N.set_value(zone, [[100, 50, 7]])
+    N.set_value(W.get_child_from_name(bc, 'PointList'), [[1,2]])
+    assert SIDS.Zone.VertexBoundarySize(zone) == 0
+    # Trivial inspectors are not cached
+    assert SIDS.Zone.n_cell(zone) == 50
+    assert SIDS.Subset.n_elem(bc) == 2
+    with SIDS.cache_inspectors(): # Nested context share the same cache
+      assert SIDS.Zone.VertexBoundarySize(zone) == 0
+    assert SIDS.Zone.VertexBoundarySize(zone) == 0
+    # Other nodes are not affected
+    assert SIDS.Zone.VertexBoundarySize(N.new_Zone('Zone', size=[[10, 3, 3]], type='Unstructured')) == 3
+    # Label is still checked
+    with pytest.raises(PT.CGNSLabelNotEqualError):
+      SIDS.Zone.VertexBoundarySize(bc)
+    # Cache is not shared with other threads
+    results = []
+    thread = threading.Thread(target=lambda: results.append(SIDS.Zone.VertexBoundarySize(zone)))
+    thread.start()
+    thread.join()
+    assert results == [7]
+
+  # Cache is cleared at exit
+  assert SIDS.Zone.VertexBoundarySize(zone) == 7
@@ -6,7 +6,7 @@ from mpi4py import MPI
 
 import maia.pytree as PT
 from maia.pytree.yaml   import parse_yaml_cgns
-from maia.pytree.compare_arrays import close_in_relative_norm, equal_array_report
+from maia.pytree.compare_arrays import close_in_relative_norm, equal_array_report, diff_dist_tree
 import pytest_parallel
 
 def test_close_in_relative_norm():
@@ -144,3 +144,55 @@ def test_equal_array_report(comm):
   else:
     assert is_same == False
     assert report == ''
+
+@pytest_parallel.mark.parallel(2)
+def test_diff_dist_tree(comm):
+  def dist_tree(cx, pl):
+    yt = f"""
+    Base CGNSBase_t I4 [3,3]:
+      Zone Zone_t I4 [[8,1,0]]:
+        GridCoordinates GridCoordinates_t:
+          CoordinateX DataArray_t R8 {cx}:
+        ZoneBC ZoneBC_t:
+          BC BC_t "FamilySpecified":
+            PointList IndexArray_t I4 [{pl}]:
+    """
+    return parse_yaml_cgns.to_cgns_tree(yt)
+
+  if comm.Get_rank() == 0:
+    ref = dist_tree([0., 1., 2., 3.], [1, 2])
+    t_ok  = dist_tree([0., 1., 2., 3.], [1, 2])
+    t_tol = dist_tree([0., 1., 2., 3.], [1, 2])
+    t_err = dist_tree([0., 1., 2., 3.], [1, 2])
+  else:
+    ref = dist_tree([4., 5., 6., 7.], [3])
+    t_ok  = dist_tree([4., 5., 6., 7.], [3])
+    t_tol = dist_tree([4., 5., 6., 7.+1e-12], [3])
+    t_err = dist_tree([4., 5., 6., 9.], [4])
+
+  is_ok, err_report, warn_report, norms = diff_dist_tree(t_ok, ref, comm)
+  assert is_ok and err_report == '' and warn_report == ''
+  assert norms['/CGNSTree/Base/Zone/GridCoordinates/CoordinateX']['max_abs'] == 0.
+
+  is_ok, err_report, warn_report, norms = diff_dist_tree(t_tol, ref, comm, tol=1e-10)
+  assert is_ok and err_report == ''
+  assert warn_report.startswith('/CGNSTree/Base/Zone/GridCoordinates/CoordinateX -- Values differ: 1 values are different')
+
+  is_ok, err_report, warn_report, norms = diff_dist_tree(t_err, ref, comm, tol=1e-10)
+  assert not is_ok
+  assert err_report.splitlines() == [
+    '/CGNSTree/Base/Zone/GridCoordinates/CoordinateX -- Values differ: 1 values are different, max abs diff: 2.000e+00, '
+    'max rel diff: 2.857e-01, L2 diff: 2.000e+00, rel L2 error: 1.690e-01',
+    '/CGNSTree/Base/Zone/ZoneBC/BC/PointList -- Values differ: 1 values are different']
+  cx_norms = norms['/CGNSTree/Base/Zone/GridCoordinates/CoordinateX']
+  assert cx_norms['max_abs'] == 2. and cx_norms['max_rel'] == pytest.approx(2./7.)
+  assert cx_norms['l2'] == 2. and cx_norms['rel_l2'] == pytest.approx(2./np.sqrt(140.))
+
+  # Comparison stops after the first difference
+  is_ok, err_report, _, _ = diff_dist_tree(t_err, ref, comm, tol=1e-10, max_diffs=1)
+  assert not is_ok and len(err_report.splitlines()) == 1
+
+  # Structural differences
+  PT.rm_nodes_from_name(t_err, 'BC')
+  is_ok, err_report, _, _ = diff_dist_tree(t_err, ref, comm)
+  assert not is_ok and '> /CGNSTree/Base/Zone/ZoneBC/BC\n' in err_report
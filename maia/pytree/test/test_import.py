@@ -0,0 +1,27 @@
+import os
+import sys
+import subprocess
+
+def test_import_pytree_only():
+  # maia.pytree should be usable without loading MPI, ParaDiGM or maia algorithms
+  code = "import sys; import maia.pytree as PT; import maia.pytree.maia as MT; PT.getNodesFromName1; " \
+         "print(sorted(m for m in ['mpi4py.MPI', 'Pypdm.Pypdm', 'h5py', 'maia.algo', 'maia.factory'] if m in sys.modules))"
+  env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+  output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+  assert output.strip() == '[]'
+
+def test_import_io_light():
+  # maia.io should not load the partitioning algorithms nor ParaDiGM
+  code = "import sys; import maia.io; " \
+         "print(sorted(m for m in ['Pypdm.Pypdm', 'maia.algo', 'maia.algo.part', 'maia.factory', 'maia.transfer'] if m in sys.modules))"
+  env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+  output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+  assert output.strip() == '[]'
+
+def test_excepthook_installed():
+  # The MPI excepthook is installed by maia itself, without loading MPI
+  code = "import sys; import maia.pytree; import maia; " \
+         "print(sys.excepthook is maia._mpi_excepthook, 'mpi4py.MPI' in sys.modules)"
+  env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+  output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+  assert output.strip() == 'True False'
@@ -5,3 +5,11 @@ from .nodes_walker import *
 from .node_walkers import *
 from .nodes_walkers import *
 from .walkers_api import *
+from .node_index import *
+
+def __getattr__(name):
+  # Legacy functions are generated at first access, see generate.py
+  try:
+    return getattr(generate, name)
+  except AttributeError:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
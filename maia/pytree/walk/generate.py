@@ -72,7 +72,7 @@ for rm_function in [rm_nodes_from_predicate, rm_children_from_predicate, keep_ch
   generated = generate_functions(rm_function, maxdepth=0, child=False)
   _update_module_attributes(generated)
 
-def get_node_from_path(root:CGNSTree, path:str) -> Optional[CGNSTree]:
+def get_node_from_path(root:CGNSTree, path:str, index=None) -> Optional[CGNSTree]:
   """ Return the node in input tree matching given path, or None
 
   A path is a str containing a full list of names, separated by ``'/'``, leading
@@ -82,6 +82,8 @@ def get_node_from_path(root:CGNSTree, path:str) -> Optional[CGNSTree]:
   Args:
       root (CGNSTree): Tree is which the search is performed
       path (str): path of the node to select
+      index (NodeIndex, optional): Index used to find the children of the
+        nodes along the path (see :class:`NodeIndex`)
   Returns:
     CGNSTree or None: Node found
   Example:
@@ -96,6 +98,8 @@ def get_node_from_path(root:CGNSTree, path:str) -> Optional[CGNSTree]:
     >>> PT.get_node_from_path(zone, 'ZoneBC/BC/PointRange')
     # Return None
   """
+  if index is not None:
+    return index.get_node_from_path(root, path)
   if path == '':
     return root
   names = path.split('/')
@@ -107,8 +111,8 @@ def get_node_from_path(root:CGNSTree, path:str) -> Optional[CGNSTree]:
       return
   return node
 
-def request_node_from_path(root:CGNSTree, path:str, default:CGNSTree=None) -> CGNSTree:
-  node = get_node_from_path(root, path)
+def request_node_from_path(root:CGNSTree, path:str, default:CGNSTree=None, index=None) -> CGNSTree:
+  node = get_node_from_path(root, path, index)
   if node is not None:
     return node
   if default:
@@ -236,29 +240,43 @@ def iter_all_subsets(root:CGNSTree, filter_loc:Optional[List[str]]=None) -> Iter
 
 
 # Specialization of legacy functions
-
-#Generation for Node(s)Walker(s) based funcs
-base_functions = [
-    WAPI.requestNodeFromPredicate,
-    WAPI.getNodeFromPredicate,
-    WAPI.getNodesFromPredicate,
-    WAPI.iterNodesFromPredicate,
-    ]
-
-for base_function in base_functions:
-  #Todo : raise DeprecationWarning
-  easypredicates = {
-    'Name' : (match_name,  ('name',)),
-    'Value': (match_value, ('value',)),
-    'Label': (match_label, ('label',)),
-    'Type' : (match_label, ('label',)),
-    'NameAndType'  : (match_name_label,  ('name', 'label',)),
-    'NameAndLabel' : (match_name_label,  ('name', 'label',)),
-  }
-  generated = generate_functions(base_function, maxdepth=3, child=True, easypredicates=easypredicates)
-  _update_module_attributes(generated)
-for base_function in [WAPI.getNodesFromPredicates, WAPI.iterNodesFromPredicates]:
-  generated = generate_functions(base_function, easypredicates={}, maxdepth=3, child=True)
-  _update_module_attributes(generated)
+# These functions are only generated at first access (see __getattr__) to reduce import time
+
+_legacy_functions = None
+
+def _generate_legacy_functions():
+  legacy_functions = {}
+  #Generation for Node(s)Walker(s) based funcs
+  base_functions = [
+      WAPI.requestNodeFromPredicate,
+      WAPI.getNodeFromPredicate,
+      WAPI.getNodesFromPredicate,
+      WAPI.iterNodesFromPredicate,
+      ]
+
+  for base_function in base_functions:
+    #Todo : raise DeprecationWarning
+    easypredicates = {
+      'Name' : (match_name,  ('name',)),
+      'Value': (match_value, ('value',)),
+      'Label': (match_label, ('label',)),
+      'Type' : (match_label, ('label',)),
+      'NameAndType'  : (match_name_label,  ('name', 'label',)),
+      'NameAndLabel' : (match_name_label,  ('name', 'label',)),
+    }
+    legacy_functions.update(generate_functions(base_function, maxdepth=3, child=True, easypredicates=easypredicates))
+  for base_function in [WAPI.getNodesFromPredicates, WAPI.iterNodesFromPredicates]:
+    legacy_functions.update(generate_functions(base_function, easypredicates={}, maxdepth=3, child=True))
+  return legacy_functions
+
+def __getattr__(name):
+  global _legacy_functions
+  if _legacy_functions is None and not name.startswith('_'):
+    _legacy_functions = _generate_legacy_functions()
+    _update_module_attributes(_legacy_functions)
+  try:
+    return _legacy_functions[name]
+  except (KeyError, TypeError):
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
 
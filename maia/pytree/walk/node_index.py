@@ -0,0 +1,119 @@
+from functools import partial
+
+from maia.pytree.typing import *
+
+import maia.pytree.cgns_keywords as CGK
+
+from .predicate import match_name, match_str_label, match_cgk_label, match_label, _is_literal
+
+# Keys to access TreeNode values
+__NAME__     = 0
+__VALUE__    = 1
+__CHILDREN__ = 2
+__LABEL__    = 3
+
+def _index_key(predicate):
+  """ Return the (kind, value) key of the index to use to answer the given predicate,
+  or None if the predicate is not a literal name or label query """
+  if not isinstance(predicate, partial) or predicate.args:
+    return None
+  kwargs = predicate.keywords
+  if predicate.func is match_name and _is_literal(kwargs.get('name')):
+    return ('name', kwargs['name'])
+  if predicate.func in [match_str_label, match_cgk_label, match_label]:
+    label = kwargs.get('label')
+    if isinstance(label, CGK.Label):
+      return ('label', label.name)
+    if _is_literal(label):
+      return ('label', label)
+  return None
+
+class NodeIndex:
+  """ Index of the children of the nodes of a CGNSTree, by name and by label.
+
+  The first query on a parent node registers its children in two dictionnaries
+  (by name and by label), so that next queries on this parent node have a constant
+  cost instead of a linear scan of the children list.
+
+  A change in the number of children of an indexed node is detected, but
+  other modifications of the tree (renaming a node, replacing a child, ...)
+  must be notified using :meth:`update` or :meth:`invalidate`.
+
+  An index can be passed to :func:`get_node_from_path` and to the ``get_child(ren)``
+  and ``iter_children`` search functions using the ``index`` keyword argument. The index is only used
+  for queries on a literal name or label (without wildcards); other queries
+  fall back to the standard search.
+
+  Example:
+    >>> zone = PT.new_Zone('Zone')
+    >>> zbc  = PT.new_ZoneBC(parent=zone)
+    >>> for i in range(20000):
+    ...   PT.new_BC(f'BC{i}', parent=zbc)
+    >>> index = PT.NodeIndex()
+    >>> bc = PT.get_node_from_path(zone, 'ZoneBC/BC19999', index=index)
+    >>> bcs = PT.get_children_from_label(zbc, 'BC_t', index=index)
+  """
+  def __init__(self):
+    self._entries = {}
+
+  def _entry(self, parent):
+    children = parent[__CHILDREN__]
+    entry = self._entries.get(id(parent))
+    # Parent is kept in entry to prevent the reuse of its id
+    if entry is None or entry[0] is not parent or entry[1] != len(children):
+      by_name, by_label = {}, {}
+      for child in children:
+        by_name.setdefault(child[__NAME__], child)
+        by_label.setdefault(child[__LABEL__], []).append(child)
+      entry = (parent, len(children), by_name, by_label)
+      self._entries[id(parent)] = entry
+    return entry
+
+  def query(self, parent:CGNSTree, predicate) -> Optional[List[CGNSTree]]:
+    """ Return the list of children of parent matching the predicate, or None if
+    the predicate is not a literal name or label query """
+    key = _index_key(predicate)
+    if key is None:
+      return None
+    _, _, by_name, by_label = self._entry(parent)
+    if key[0] == 'name':
+      child = by_name.get(key[1])
+      return [] if child is None else [child]
+    return by_label.get(key[1], [])
+
+  def get_child_from_name(self, parent:CGNSTree, name:str) -> Optional[CGNSTree]:
+    """ Return the child of parent having the given name, or None """
+    return self._entry(parent)[2].get(name)
+
+  def get_children_from_label(self, parent:CGNSTree, label:str) -> List[CGNSTree]:
+    """ Return the list of the children of parent having the given label """
+    return list(self._entry(parent)[3].get(label, []))
+
+  def get_child_from_label(self, parent:CGNSTree, label:str) -> Optional[CGNSTree]:
+    """ Return the first child of parent having the given label, or None """
+    children = self._entry(parent)[3].get(label)
+    return children[0] if children else None
+
+  def get_node_from_path(self, root:CGNSTree, path:str) -> Optional[CGNSTree]:
+    """ Return the node matching the given path starting from root (see
+    :func:`get_node_from_path`), or None """
+    if path == '':
+      return root
+    node = root
+    for name in path.split('/'):
+      node = self._entry(node)[2].get(name)
+      if node is None:
+        return None
+    return node
+
+  def update(self, parent:CGNSTree):
+    """ Register again the children of the parent node """
+    self.invalidate(parent)
+    self._entry(parent)
+
+  def invalidate(self, parent:Optional[CGNSTree]=None):
+    """ Remove the parent node from the index, or clear the whole index if parent is None """
+    if parent is None:
+      self._entries.clear()
+    else:
+      self._entries.pop(id(parent), None)
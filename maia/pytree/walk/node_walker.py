@@ -2,6 +2,7 @@ from typing import List, Optional, Union, Callable
 import numpy as np
 
 from ._node_parsers import NodeParser, RangeLevelNodeParser
+from .predicate     import compile_predicate
 
 TreeNode = List[Union[str, Optional[np.ndarray], List["TreeNode"]]]
 
@@ -105,4 +106,4 @@ class NodeWalker:
     else:
       self._parser = RangeLevelNodeParser(depth=self.depth, sort=self.sort)
     func = getattr(self._parser, self.search)
-    return func(self._root, self._predicate)
+    return func(self._root, compile_predicate(self._predicate))
@@ -2,6 +2,7 @@ from typing import List, Optional, NoReturn, Union, Tuple, Callable, Any
 import numpy as np
 
 from .node_walker import NodeWalker
+from .predicate   import compile_predicate
 
 TreeNode = List[Union[str, Optional[np.ndarray], List["TreeNode"]]]
 
@@ -71,7 +72,7 @@ class NodeWalkers:
       lkwargs = {}
       for k,v in kwargs.items():
         if k == 'predicate':
-          predicates.append(v)
+          predicates.append(compile_predicate(v))
         else:
           lkwargs[k] = v
       for_each.append(lkwargs)
@@ -84,4 +85,5 @@ class NodeWalkers:
       predicates, for_each = self._deconv_kwargs()
       return get_node_from_predicates_for_each__(self.root, predicates, for_each)
     else:
-      return get_node_from_predicates__(self.root, self.predicates, **self.kwargs)
+      predicates = [compile_predicate(p) for p in self.predicates]
+      return get_node_from_predicates__(self.root, predicates, **self.kwargs)
@@ -6,6 +6,7 @@ from ._node_parsers import NodesIterator
 from ._node_parsers import ShallowNodesIterator
 from ._node_parsers import RangeLevelNodesIterator
 from ._node_parsers import ShallowRangeLevelNodesIterator
+from .predicate     import compile_predicate
 
 TreeNode = List[Union[str, Optional[np.ndarray], List["TreeNode"]]]
 
@@ -162,7 +163,7 @@ class NodesWalker:
     # Generate iterator
     self._parser = self._get_parser()
     walker   = getattr(self._parser, self.search)
-    iterator = walker(self._root, self._predicate)
+    iterator = walker(self._root, compile_predicate(self._predicate))
     if self.caching:
       if not bool(self._cache):
         self._cache = list(iterator)
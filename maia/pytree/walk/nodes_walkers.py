@@ -3,6 +3,7 @@ import numpy as np
 import copy
 
 from .nodes_walker import NodesWalker
+from .predicate    import compile_predicate
 
 TreeNode = List[Union[str, Optional[np.ndarray], List["TreeNode"]]]
 
@@ -121,7 +122,7 @@ class NodesWalkers:
       lkwargs = {}
       for k,v in kwargs.items():
         if k == 'predicate':
-          predicates.append(v)
+          predicates.append(compile_predicate(v))
         else:
           lkwargs[k] = v
       for_each.append(lkwargs)
@@ -129,6 +130,9 @@ class NodesWalkers:
       raise ValueError(f"Missing predicate.")
     return predicates, for_each
 
+  def _compiled_predicates(self):
+    return [compile_predicate(p) for p in self.predicates]
+
   def __call__(self):
     if self.ancestors:
       return self._parse_with_parents()
@@ -153,10 +157,10 @@ class NodesWalkers:
         if not bool(self._cache):
           kwargs = copy.deepcopy(self.kwargs)
           kwargs['caching'] = False
-          self._cache = list(iter_nodes_from_predicates_with_parents__(self.root, self.predicates, **kwargs))
+          self._cache = list(iter_nodes_from_predicates_with_parents__(self.root, self._compiled_predicates(), **kwargs))
         return self._cache
       else:
-        return iter_nodes_from_predicates_with_parents__(self.root, self.predicates, **self.kwargs)
+        return iter_nodes_from_predicates_with_parents__(self.root, self._compiled_predicates(), **self.kwargs)
 
   def _parse(self):
     if any([isinstance(kwargs, dict) for kwargs in self.predicates]):
@@ -176,10 +180,10 @@ class NodesWalkers:
         if not bool(self._cache):
           kwargs = copy.deepcopy(self.kwargs)
           kwargs['caching'] = False
-          self._cache = list(iter_nodes_from_predicates__(self.root, self.predicates, **kwargs))
+          self._cache = list(iter_nodes_from_predicates__(self.root, self._compiled_predicates(), **kwargs))
         return self._cache
       else:
-        return iter_nodes_from_predicates__(self.root, self.predicates, **self.kwargs)
+        return iter_nodes_from_predicates__(self.root, self._compiled_predicates(), **self.kwargs)
 
   def apply(self, f, *args, **kwargs):
     for n in self.__call__():
@@ -1,5 +1,6 @@
+import re
 import fnmatch
-from functools import partial
+from functools import partial, lru_cache
 import numpy as np
 
 from maia.pytree.typing import *
@@ -13,14 +14,27 @@ __VALUE__    = 1
 __CHILDREN__ = 2
 __LABEL__    = 3
 
+def _is_literal(pattern):
+  return isinstance(pattern, str) and not any(c in pattern for c in '*?[')
+
+@lru_cache(maxsize=1024)
+def _str_matcher(pattern:str):
+  """ Return a function checking if a string matches the (fnmatch like) pattern.
+  Literal patterns are compared using string equality, others are compiled once
+  into a regular expression """
+  if _is_literal(pattern):
+    return lambda s: s == pattern
+  regex_match = re.compile(fnmatch.translate(pattern)).match
+  return lambda s: regex_match(s) is not None
+
 def match_name(n:CGNSTree, name: str) -> bool:
-  return fnmatch.fnmatch(n[__NAME__], name)
+  return _str_matcher(name)(n[__NAME__])
 
 def match_value(n:CGNSTree, value) -> bool:
   return np.array_equal(n[__VALUE__], N.access._convert_value(value))
 
 def match_str_label(n:CGNSTree, label:str) -> bool:
-  return fnmatch.fnmatch(n[__LABEL__], label)
+  return _str_matcher(label)(n[__LABEL__])
 
 def match_cgk_label(n:CGNSTree, label) -> bool:
   return n[__LABEL__] == label.name
@@ -40,6 +54,36 @@ def match_value_label(n:CGNSTree, value, label:str):
 def match_name_value_label(n:CGNSTree, name: str, value:str, label):
   return match_name(n, name) and match_value(n, value) and match_label(n, label)
 
+def _label_matcher(label):
+  if isinstance(label, CGK.Label):
+    label = label.name
+  return _str_matcher(label)
+
+def compile_predicate(predicate):
+  """
+  Return a predicate equivalent to the given one, but faster to evaluate.
+  Predicates built from the match_* functions with name and/or label arguments
+  are converted once into direct string comparisons (or precompiled regular
+  expressions if the pattern includes wildcards); other predicates are returned unchanged.
+  """
+  if not isinstance(predicate, partial) or predicate.args:
+    return predicate
+  func, kwargs = predicate.func, predicate.keywords
+  try:
+    if func is match_name and kwargs.keys() == {'name'}:
+      name_match = _str_matcher(kwargs['name'])
+      return lambda n: name_match(n[__NAME__])
+    if func in [match_str_label, match_cgk_label, match_label] and kwargs.keys() == {'label'}:
+      label_match = _label_matcher(kwargs['label'])
+      return lambda n: label_match(n[__LABEL__])
+    if func is match_name_label and kwargs.keys() == {'name', 'label'}:
+      name_match  = _str_matcher(kwargs['name'])
+      label_match = _label_matcher(kwargs['label'])
+      return lambda n: name_match(n[__NAME__]) and label_match(n[__LABEL__])
+  except TypeError: # Unhashable or non string pattern : keep the original predicate
+    pass
+  return predicate
+
 def belongs_to_family(n:CGNSTree, target_family:str, allow_additional=False):
   """
   Return True if the node n has a FamilyName_t child whose value is target_family.
@@ -0,0 +1,60 @@
+import pytest
+
+import maia.pytree as PT
+from maia.pytree.yaml   import parse_yaml_cgns
+
+from maia.pytree.walk.node_index import NodeIndex
+
+yt = """
+Zone Zone_t:
+  ZoneBC ZoneBC_t:
+    bc1 BC_t:
+      FamilyName FamilyName_t 'BC1':
+      Index_i IndexArray_t:
+    bc2 BC_t:
+      FamilyName FamilyName_t 'BC2':
+      Index_ii IndexArray_t:
+  FamilyName FamilyName_t 'ROW1':
+"""
+
+def test_node_index():
+  tree = parse_yaml_cgns.to_node(yt)
+  zbc = PT.get_child_from_name(tree, 'ZoneBC')
+  index = NodeIndex()
+
+  assert index.get_child_from_name(zbc, 'bc2') is PT.get_child_from_name(zbc, 'bc2')
+  assert index.get_child_from_name(zbc, 'bc3') is None
+  assert index.get_children_from_label(zbc, 'BC_t') == PT.get_children_from_label(zbc, 'BC_t')
+  assert index.get_child_from_label(tree, 'FamilyName_t') is PT.get_child_from_label(tree, 'FamilyName_t')
+  assert index.get_node_from_path(tree, 'ZoneBC/bc1/Index_i') is PT.get_node_from_path(tree, 'ZoneBC/bc1/Index_i')
+  assert index.get_node_from_path(tree, 'ZoneBC/bc3/Index_i') is None
+  assert index.get_node_from_path(tree, '') is tree
+
+  # Added children are detected
+  bc3 = PT.new_BC('bc3', parent=zbc)
+  assert index.get_child_from_name(zbc, 'bc3') is bc3
+  # Renaming must be notified
+  PT.set_name(bc3, 'bc4')
+  assert index.get_child_from_name(zbc, 'bc4') is None
+  index.update(zbc)
+  assert index.get_child_from_name(zbc, 'bc4') is bc3
+  PT.set_name(bc3, 'bc5')
+  index.invalidate()
+  assert index.get_child_from_name(zbc, 'bc5') is bc3
+
+def test_walkers_with_index():
+  tree = parse_yaml_cgns.to_node(yt)
+  zbc = PT.get_child_from_name(tree, 'ZoneBC')
+  index = NodeIndex()
+
+  assert PT.get_node_from_path(tree, 'ZoneBC/bc2', index=index) is PT.get_node_from_path(tree, 'ZoneBC/bc2')
+  assert PT.get_child_from_name(zbc, 'bc1', index=index) is PT.get_child_from_name(zbc, 'bc1')
+  assert PT.get_child_from_name(zbc, 'bc3', index=index) is None
+  assert PT.get_children_from_label(zbc, 'BC_t', index=index) == PT.get_children_from_label(zbc, 'BC_t')
+  assert list(PT.iter_children_from_label(zbc, 'BC_t', index=index)) == PT.get_children_from_label(zbc, 'BC_t')
+  assert PT.get_children_from_predicates(tree, 'ZoneBC_t/BC_t/FamilyName_t', index=index) == \
+         PT.get_children_from_predicates(tree, 'ZoneBC_t/BC_t/FamilyName_t')
+  assert PT.get_child_from_predicates(tree, 'ZoneBC/bc2', index=index) is PT.get_node_from_path(tree, 'ZoneBC/bc2')
+  # Queries which can not use the index fallback to the standard search
+  assert PT.get_children_from_name(zbc, 'bc*', index=index) == PT.get_children_from_label(zbc, 'BC_t')
+  assert PT.get_nodes_from_label(tree, 'BC_t', index=index) == PT.get_children_from_label(zbc, 'BC_t')
@@ -39,6 +39,25 @@ def test_matches():
   node = ['FamilyName', np.array([b'F', b'A', b'M', b'I', b'L', b'Y']), [], 'FamilyName_t']
   assert P.match_value(node, 'FAMILY')
 
+def test_compile_predicate():
+  from functools import partial
+  nface = ['NFace', np.array([23, 0], np.int32), [], 'Elements_t']
+  zone  = ['Zone', None, [], 'Zone_t']
+
+  predicates = [partial(P.match_name, name='NFace'), partial(P.match_name, name='NF?c[a-e]'),
+                partial(P.match_str_label, label='Elem*'), partial(P.match_cgk_label, label=CGL.Elements_t),
+                partial(P.match_label, label='Elements_t'), partial(P.match_name_label, name='N*', label=CGL.Elements_t)]
+  for predicate in predicates:
+    compiled = P.compile_predicate(predicate)
+    assert not isinstance(compiled, partial)
+    assert compiled(nface) and not compiled(zone)
+
+  # Other predicates are not modified
+  predicate = partial(P.match_value, value=np.array([23,0]))
+  assert P.compile_predicate(predicate) is predicate
+  predicate = lambda n: n[0] == 'NFace'
+  assert P.compile_predicate(predicate) is predicate
+
 def test_belongs_to_family():
   yt = """
 ZoneBC ZoneBC_t:
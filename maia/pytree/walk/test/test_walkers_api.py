@@ -127,3 +127,22 @@ def test_iter_nodes_from_predicates():
   for result_iter, result_get in zip(results_iter, results_get):
     assert result_iter == result_get
 
+
+def test_get_children_from_queries():
+  tree = parse_yaml_cgns.to_node(yt)
+
+  queries = {'bcs'     : 'ZoneBC_t/BC_t',
+             'families': ['ZoneBC_t', 'BC_t', 'FamilyName_t'],
+             'family'  : 'FamilyName_t',
+             'bc2'     : ['ZoneBC', lambda n: PT.get_name(n) == 'bc2'],
+             'none'    : 'ZoneGridConnectivity_t/GridConnectivity_t'}
+  nodes = PT.get_children_from_queries(tree, queries)
+  assert list(nodes.keys()) == list(queries.keys())
+  for key, query in queries.items():
+    assert nodes[key] == PT.get_children_from_predicates(tree, query)
+  assert [PT.get_value(n) for n in nodes['families']] == ['BC1', 'BC2']
+  assert nodes['none'] == []
+
+  nodes = PT.get_children_from_queries(tree, queries, ancestors=True)
+  assert [(PT.get_name(zbc), PT.get_name(bc)) for zbc, bc in nodes['bcs']] == [('ZoneBC', 'bc1'), ('ZoneBC', 'bc2')]
+  assert nodes['family'] == [(PT.get_child_from_name(tree, 'FamilyName'),)]
@@ -4,10 +4,40 @@ from .node_walker   import NodeWalker
 from .nodes_walker  import NodesWalker
 from .node_walkers  import NodeWalkers
 from .nodes_walkers import NodesWalkers
-from .predicate     import auto_predicate, auto_predicates
+from .predicate     import auto_predicate, auto_predicates, compile_predicate
 
 from maia.pytree.compare import CGNSNodeFromPredicateNotFoundError
 
+def _is_children_query(kwargs):
+  depth = kwargs.get('depth')
+  return isinstance(depth, (list, tuple)) and list(depth) == [1,1] and 'sort' not in kwargs
+
+def _query_index(root, predicate, kwargs):
+  """ Pop the index from kwargs and use it to find the children of root matching
+  the predicate. Return None if there is no index or if it can not answer the query """
+  index = kwargs.pop('index', None)
+  if index is None or not _is_children_query(kwargs):
+    return None
+  return index.query(root, predicate)
+
+def _query_index_chain(root, predicates, kwargs):
+  """ Same than _query_index for a chain of predicates """
+  index = kwargs.pop('index', None)
+  if index is None or not _is_children_query(kwargs) or kwargs.get('ancestors', False):
+    return None
+  nodes = [root]
+  for predicate in predicates:
+    if isinstance(predicate, dict):
+      return None
+    next_nodes = []
+    for node in nodes:
+      children = index.query(node, predicate)
+      if children is None:
+        return None
+      next_nodes.extend(children)
+    nodes = next_nodes
+  return nodes
+
 # ---------------------------------------------------------------------------- #
 # API for NodeWalker
 # ---------------------------------------------------------------------------- #
@@ -22,6 +52,8 @@ def get_node_from_predicate(root:CGNSTree, predicate, **kwargs) -> Optional[CGNS
     Defaults to ``(0,None)``.
   - ``search`` (str): use a Depth-First-Search (``'dfs'``) or
     Breath-First-Search (``'bfs'``) algorithm. Defaults to ``'dfs'``.
+  - ``index`` (NodeIndex): if provided, children queries (``depth=[1,1]``) on a literal
+    name or label are answered using this index (see :class:`NodeIndex`).
   
   Args:
     root (CGNSTree): Tree is which the search is performed
@@ -38,6 +70,9 @@ def get_node_from_predicate(root:CGNSTree, predicate, **kwargs) -> Optional[CGNS
     - :func:`get_child_from_name|label|value|name_and_label` (embedded predicate + depth=[1,1])
   """
   _predicate = auto_predicate(predicate)
+  children = _query_index(root, _predicate, kwargs)
+  if children is not None:
+    return children[0] if children else None
   walker = NodeWalker(root, _predicate, **kwargs)
   return walker()
 
@@ -63,6 +98,7 @@ def get_nodes_from_predicate(root:CGNSTree, predicate, **kwargs) -> List[CGNSTre
   - ``search`` (str): see :func:`get_node_from_predicate`
   - ``explore`` (str): Explore the whole tree (``'deep'``) or stop exploring the current branch
     once predicate is satisfied (``'shallow'``). Defaults to ``'shallow'``.
+  - ``index`` (NodeIndex): see :func:`get_node_from_predicate`
 
   Args:
       root (CGNSTree): Tree is which the search is performed
@@ -79,6 +115,9 @@ def get_nodes_from_predicate(root:CGNSTree, predicate, **kwargs) -> List[CGNSTre
     - :func:`get_children_from_name|label|value|name_and_label` (embedded predicate + depth=[1,1])
   """
   _predicate = auto_predicate(predicate)
+  children = _query_index(root, _predicate, kwargs)
+  if children is not None:
+    return list(children)
   caching = kwargs.get('caching')
   if caching is not None and caching is False:
     print(f"Warning: get_nodes_from_predicate forces caching to True.")
@@ -97,6 +136,9 @@ def iter_nodes_from_predicate(root:CGNSTree, predicate, **kwargs) -> Iterator[CG
     - :func:`iter_children_from_name|label|value|name_and_label` (embedded predicate + depth=[1,1])
   """
   _predicate = auto_predicate(predicate)
+  children = _query_index(root, _predicate, kwargs)
+  if children is not None:
+    return iter(children)
   caching = kwargs.get('caching')
   if caching is not None and caching is True:
     print(f"Warning: iter_nodes_from_predicate forces caching to False.")
@@ -132,6 +174,9 @@ def get_node_from_predicates(root:CGNSTree, predicates, **kwargs) -> Optional[CG
     - :func:`get_child_from_names|labels|values|name_and_labels` (embedded predicate + depth=[1,1])
   """
   _predicates = auto_predicates(predicates)
+  nodes = _query_index_chain(root, _predicates, kwargs)
+  if nodes is not None:
+    return nodes[0] if nodes else None
   walker = NodeWalkers(root, _predicates, **kwargs)
   return walker()
 
@@ -149,6 +194,9 @@ def iter_nodes_from_predicates(root:CGNSTree, predicates, **kwargs) -> Iterator[
     - :func:`iter_children_from_names|labels|values|name_and_labels` (embedded predicate + depth=[1,1])
   """
   _predicates = auto_predicates(predicates)
+  nodes = _query_index_chain(root, _predicates, kwargs)
+  if nodes is not None:
+    return iter(nodes)
 
   caching = kwargs.get('caching')
   if caching is not None and caching is True:
@@ -185,6 +233,9 @@ def get_nodes_from_predicates(root:CGNSTree, predicates, **kwargs) -> List[CGNST
     - :func:`get_children_from_names|labels|values|name_and_labels` (embedded predicate + depth=[1,1])
   """
   _predicates = auto_predicates(predicates)
+  nodes = _query_index_chain(root, _predicates, kwargs)
+  if nodes is not None:
+    return nodes
 
   caching = kwargs.get('caching')
   if caching is not None and caching is False:
@@ -194,6 +245,53 @@ def get_nodes_from_predicates(root:CGNSTree, predicates, **kwargs) -> List[CGNST
   walker = NodesWalkers(root, _predicates, **kwargs)
   return walker()
 
+# ---------------------------------------------------------------------------- #
+# API for multiple queries
+# ---------------------------------------------------------------------------- #
+def _walk_queries(parent, states, results, ancestors):
+  for child in parent[2]:
+    child_states = []
+    for key, predicates, level, parents in states:
+      if predicates[level](child):
+        if level == len(predicates) - 1:
+          results[key].append((*parents, child) if ancestors else child)
+        else:
+          child_states.append((key, predicates, level+1, (*parents, child)))
+    if child_states:
+      _walk_queries(child, child_states, results, ancestors)
+
+def get_children_from_queries(root:CGNSTree, queries:Dict[str, Any], ancestors=False) -> Dict[str, List[CGNSTree]]:
+  """ Return, for each one of the named queries, the list of nodes matching it.
+
+  Each query is a chain of predicates, applied on successive levels of children
+  as in :func:`get_children_from_predicates`. All the queries are answered
+  in a single traversal of the tree, which is faster than calling
+  :func:`get_children_from_predicates` for each query.
+
+  Args:
+      root (CGNSTree): Tree is which the search is performed
+      queries (dict): named queries. Each value is a chain of predicates, given as
+        a list of predicates or a '/' separated string (see :func:`get_nodes_from_predicates`)
+      ancestors (bool): If ``True``, return the tuples of nodes matching each
+        level of the chain instead of the terminal nodes. Defaults to ``False``.
+  Returns:
+    dict: for each query name, the list of nodes found (in depth-first order)
+
+  Example:
+    >>> nodes = PT.get_children_from_queries(zone, {'bcs' : 'ZoneBC_t/BC_t',
+    ...                                             'sols': 'FlowSolution_t'})
+    >>> for bc in nodes['bcs']: ...
+  """
+  results = {key : [] for key in queries}
+  states = []
+  for key, predicates in queries.items():
+    _predicates = auto_predicates(predicates)
+    if any(isinstance(p, dict) for p in _predicates):
+      raise TypeError("get_children_from_queries does not support per predicate kwargs.")
+    states.append((key, [compile_predicate(p) for p in _predicates], 0, ()))
+  _walk_queries(root, states, results, ancestors)
+  return results
+
 # Aliases for legacy code -- using default argument deep instead of shallow for search
 
 def getNodeFromPredicate(root, predicate, *args, **kwargs):
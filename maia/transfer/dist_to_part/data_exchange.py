@@ -28,10 +28,9 @@ def dist_coords_to_part_coords(dist_zone, part_zones, comm):
 
   for ipart, part_zone in enumerate(part_zones):
     part_gc = PT.new_node('GridCoordinates', 'GridCoordinates_t', parent=part_zone)
-    for data_name, data in part_data.items():
-      #F is mandatory to keep shared reference. Normally no copy is done
-      shaped_data = data[ipart].reshape(PT.Zone.VertexSize(part_zone), order='F')
-      PT.new_DataArray(data_name, shaped_data, parent=part_gc)
+    #F is mandatory to keep shared reference. Normally no copy is done
+    shaped_data = [data[ipart].reshape(PT.Zone.VertexSize(part_zone), order='F') for data in part_data.values()]
+    PT.new_children(part_gc, part_data.keys(), 'DataArray_t', shaped_data)
 
 def dist_coords_to_part_coords_m(dist_zones, part_zones_per_dom, comm):
   """
@@ -69,9 +68,8 @@ def dist_coords_to_part_coords_m(dist_zones, part_zones_per_dom, comm):
   for part_zones in part_zones_per_dom: 
     for part_zone in part_zones:
       part_gc = PT.new_node('GridCoordinates', 'GridCoordinates_t', parent=part_zone)
-      for data_name, data in part_data.items():
-        shaped_data = data[i_part].reshape(PT.Zone.VertexSize(part_zone), order='F')
-        PT.new_DataArray(data_name, shaped_data, parent=part_gc)
+      shaped_data = [data[i_part].reshape(PT.Zone.VertexSize(part_zone), order='F') for data in part_data.values()]
+      PT.new_children(part_gc, part_data.keys(), 'DataArray_t', shaped_data)
       i_part += 1
 
 
@@ -113,10 +111,9 @@ def _dist_to_part_sollike(dist_zone, part_zones, mask_tree, comm):
           p_sol = PT.new_child(part_zone, PT.get_name(d_sol), PT.get_label(d_sol))
           PT.new_GridLocation(location, parent=p_sol)
           shape = PT.Zone.VertexSize(part_zone) if location == 'Vertex' else PT.Zone.CellSize(part_zone)
-        for data_name, data in part_data.items():
-          #F is mandatory to keep shared reference. Normally no copy is done
-          shaped_data = data[ipart].reshape(shape, order='F')
-          PT.new_DataArray(data_name, shaped_data, parent=p_sol)
+        #F is mandatory to keep shared reference. Normally no copy is done
+        shaped_data = [data[ipart].reshape(shape, order='F') for data in part_data.values()]
+        PT.new_children(p_sol, part_data.keys(), 'DataArray_t', shaped_data)
 
 def dist_sol_to_part_sol(dist_zone, part_zones, comm, include=[], exclude=[]):
   """
@@ -134,20 +131,19 @@ def dist_discdata_to_part_discdata(dist_zone, part_zones, comm, include=[], excl
   mask_tree = te_utils.create_mask_tree(dist_zone, ['DiscreteData_t', 'DataArray_t'], include, exclude)
   _dist_to_part_sollike(dist_zone, part_zones, mask_tree, comm)
 
-def dist_dataset_to_part_dataset(dist_zone, part_zones, comm, include=[], exclude=[]):
+def _dist_to_part_dataset(dist_zone, part_zones, mask_zbcs, comm):
   """
-  Transfert all the data included in BCDataSet_t/BCData_t nodes from a distributed
-  zone to the partitioned zones
+  Shared code for BCDataSet_t : mask_zbcs is a list of mask trees, one per ZoneBC_t
   """
-  for d_zbc in PT.iter_children_from_label(dist_zone, "ZoneBC_t"):
-    labels = ['BC_t', 'BCDataSet_t', 'BCData_t', 'DataArray_t']
-    mask_tree = te_utils.create_mask_tree(d_zbc, labels, include, exclude)
-    for mask_bc in PT.get_children(mask_tree):
-      bc_path = PT.get_name(d_zbc) + '/' + PT.get_name(mask_bc)
-      d_bc = PT.get_node_from_path(dist_zone, bc_path) #True BC
+  # Zones can have a lot of BCs : use an index to find them by path
+  index = PT.NodeIndex()
+  for mask_zbc in mask_zbcs:
+    for mask_bc in PT.get_children(mask_zbc):
+      bc_path = PT.get_name(mask_zbc) + '/' + PT.get_name(mask_bc)
+      d_bc = PT.get_node_from_path(dist_zone, bc_path, index=index) #True BC
       for mask_dataset in PT.get_children(mask_bc):
         ds_path = bc_path + '/' + PT.get_name(mask_dataset)
-        d_dataset = PT.get_node_from_path(dist_zone, ds_path) #True DataSet
+        d_dataset = PT.get_node_from_path(dist_zone, ds_path, index=index) #True DataSet
         #If dataset has its own PointList, we must override bc distribution and lngn
         if MT.getDistribution(d_dataset) is not None:
           distribution = te_utils.get_cgns_distribution(d_dataset, 'Index')
@@ -168,7 +164,7 @@ def dist_dataset_to_part_dataset(dist_zone, part_zones, comm, include=[], exclud
 
         #Put part data in tree
         for ipart, part_zone in enumerate(part_zones):
-          part_bc = PT.get_node_from_path(part_zone, bc_path)
+          part_bc = PT.get_node_from_path(part_zone, bc_path, index=index)
           # Skip void bcs
           if lngn_list[ipart].size > 0:
             # Create dataset if no existing
@@ -179,12 +175,20 @@ def dist_dataset_to_part_dataset(dist_zone, part_zones, comm, include=[], exclud
               p_container = PT.update_child(part_ds, container_name, 'BCData_t')
               PT.new_DataArray(field_name, data[ipart], parent=p_container)
 
-def dist_subregion_to_part_subregion(dist_zone, part_zones, comm, include=[], exclude=[]):
+def dist_dataset_to_part_dataset(dist_zone, part_zones, comm, include=[], exclude=[]):
   """
-  Transfert all the data included in ZoneSubRegion_t nodes from a distributed
+  Transfert all the data included in BCDataSet_t/BCData_t nodes from a distributed
   zone to the partitioned zones
   """
-  mask_tree = te_utils.create_mask_tree(dist_zone, ['ZoneSubRegion_t', 'DataArray_t'], include, exclude)
+  labels = ['BC_t', 'BCDataSet_t', 'BCData_t', 'DataArray_t']
+  mask_zbcs = [te_utils.create_mask_tree(d_zbc, labels, include, exclude) \
+      for d_zbc in PT.iter_children_from_label(dist_zone, "ZoneBC_t")]
+  _dist_to_part_dataset(dist_zone, part_zones, mask_zbcs, comm)
+
+def _dist_to_part_subregion(dist_zone, part_zones, mask_tree, comm):
+  """
+  Shared code for ZoneSubRegion_t
+  """
   for mask_zsr in PT.get_children(mask_tree):
     d_zsr = PT.get_child_from_name(dist_zone, PT.get_name(mask_zsr)) #True ZSR
     # Search matching region
@@ -222,8 +226,7 @@ def dist_subregion_to_part_subregion(dist_zone, part_zones, comm, include=[], ex
                                and PT.get_child_from_name(n, 'GridConnectivityRegionName') is not None \
                                and PT.get_value(PT.get_child_from_name(n, 'GridConnectivityRegionName')) == PT.get_name(node)
           p_zsr = PT.get_node_from_predicate(part_zone, good_zsr)
-          for field_name, data in part_data.items():
-            PT.new_DataArray(field_name, data[i_pseudo_part], parent=p_zsr)
+          PT.new_children(p_zsr, part_data.keys(), 'DataArray_t', [data[i_pseudo_part] for data in part_data.values()])
           i_pseudo_part += 1
     else:
       for ipart, part_zone in enumerate(part_zones):
@@ -231,5 +234,12 @@ def dist_subregion_to_part_subregion(dist_zone, part_zones, comm, include=[], ex
         if lngn_list[ipart].size > 0:
           # Create ZSR if not existing (eg was defined by bc/gc)
           p_zsr = PT.update_child(part_zone, PT.get_name(d_zsr), PT.get_label(d_zsr), PT.get_value(d_zsr))
-          for field_name, data in part_data.items():
-            PT.new_DataArray(field_name, data[ipart], parent=p_zsr)
+          PT.new_children(p_zsr, part_data.keys(), 'DataArray_t', [data[ipart] for data in part_data.values()])
+
+def dist_subregion_to_part_subregion(dist_zone, part_zones, comm, include=[], exclude=[]):
+  """
+  Transfert all the data included in ZoneSubRegion_t nodes from a distributed
+  zone to the partitioned zones
+  """
+  mask_tree = te_utils.create_mask_tree(dist_zone, ['ZoneSubRegion_t', 'DataArray_t'], include, exclude)
+  _dist_to_part_subregion(dist_zone, part_zones, mask_tree, comm)
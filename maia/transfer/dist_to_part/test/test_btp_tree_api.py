@@ -0,0 +1,39 @@
+import maia.pytree      as PT
+
+import maia.transfer.utils as te_utils
+import maia.transfer.dist_to_part.tree_api as BTP
+from   maia.pytree.yaml   import parse_yaml_cgns
+
+def test_all_fields_masks():
+  zone = parse_yaml_cgns.to_node("""
+  Zone Zone_t:
+    FS1 FlowSolution_t:
+      GridLocation GridLocation_t "CellCenter":
+      Density DataArray_t:
+      MomentumX DataArray_t:
+    DD DiscreteData_t:
+      Flag DataArray_t:
+    ZSR ZoneSubRegion_t:
+      BCRegionName Descriptor_t "bc1":
+      Pressure DataArray_t:
+    ZoneBC ZoneBC_t:
+      bc1 BC_t:
+        DS BCDataSet_t:
+          DirichletData BCData_t:
+            Temperature DataArray_t:
+      bc2 BC_t:
+    FS2 FlowSolution_t:
+      Density DataArray_t:
+  """)
+  masks = BTP._all_fields_masks(zone, ['FlowSolution_t', 'ZoneSubRegion_t', 'BCDataSet_t'])
+  assert 'DiscreteData_t' not in masks
+  # Masks are the same than the ones created from the labels, without filter
+  for label in ['FlowSolution_t', 'ZoneSubRegion_t']:
+    expected = te_utils.create_mask_tree(zone, [label, 'DataArray_t'], [], [])
+    assert PT.predicates_to_paths(masks[label], '*/*') == PT.predicates_to_paths(expected, '*/*')
+  assert len(masks['BCDataSet_t']) == 1
+  expected = te_utils.create_mask_tree(PT.get_child_from_name(zone, 'ZoneBC'), \
+      ['BC_t', 'BCDataSet_t', 'BCData_t', 'DataArray_t'], [], [])
+  assert PT.get_name(masks['BCDataSet_t'][0]) == 'ZoneBC'
+  assert PT.predicates_to_paths(masks['BCDataSet_t'][0], '*/*/*/*') == PT.predicates_to_paths(expected, '*/*/*/*') \
+      == ['bc1/DS/DirichletData/Temperature']
@@ -15,6 +15,36 @@ FUNCS = [data_exchange.dist_sol_to_part_sol,
          data_exchange.dist_subregion_to_part_subregion,
          data_exchange.dist_dataset_to_part_dataset]
 
+# Queries of all the data fields of each label, retrieved in a single walk of the zone
+# when no filter is applied, and corresponding funcs taking the mask trees
+QUERIES = ['FlowSolution_t/DataArray_t',
+           'DiscreteData_t/DataArray_t',
+           'ZoneSubRegion_t/DataArray_t',
+           'ZoneBC_t/BC_t/BCDataSet_t/BCData_t/DataArray_t']
+MASK_FUNCS = [data_exchange._dist_to_part_sollike,
+              data_exchange._dist_to_part_sollike,
+              data_exchange._dist_to_part_subregion,
+              data_exchange._dist_to_part_dataset]
+
+def _all_fields_masks(dist_zone, labels):
+  """
+  Return, for each label of labels, the mask tree of all the data fields of dist_zone
+  (as expected by the funcs of MASK_FUNCS), computed in a single walk of the zone.
+  """
+  queries = {label : query for label, query in zip(LABELS, QUERIES) if label in labels}
+  found = PT.get_children_from_queries(dist_zone, queries, ancestors=True)
+  masks = dict()
+  for label, nodes_list in found.items():
+    paths = ['/'.join([PT.get_name(node) for node in nodes]) for nodes in nodes_list]
+    if label == 'BCDataSet_t':
+      # One mask per ZoneBC_t node, rooted at the ZoneBC_t level
+      zbc_names = [PT.get_name(zbc) for zbc in PT.iter_children_from_label(dist_zone, 'ZoneBC_t')]
+      masks[label] = [PT.paths_to_tree([PT.path_tail(path, 1) for path in paths if PT.path_head(path, 1) == zbc_name], zbc_name) \
+          for zbc_name in zbc_names]
+    else:
+      masks[label] = PT.paths_to_tree(paths, PT.get_name(dist_zone))
+  return masks
+
 def _dist_zone_to_part_zones(dist_zone, part_zones, comm, filter_dict):
   """
   Low level API to transfert data fields from the distributed zone to the partitioned zones.
@@ -25,9 +55,12 @@ def _dist_zone_to_part_zones(dist_zone, part_zones, comm, filter_dict):
   If paths == [], all data will be transfered if flag == 'E' (= exclude nothing), and not data
   will be transfered if flag == 'I' (=include nothing)
   """
-  for label, func in zip(LABELS, FUNCS):
+  masks = _all_fields_masks(dist_zone, [label for label in LABELS if filter_dict[label] == ('E', [])])
+  for label, func, mask_func in zip(LABELS, FUNCS, MASK_FUNCS):
     tag, paths = filter_dict[label]
-    if tag == 'I' and paths != []:
+    if label in masks:
+      mask_func(dist_zone, part_zones, masks[label], comm)
+    elif tag == 'I' and paths != []:
       func(dist_zone, part_zones, comm, include=paths)
     elif tag == 'E':
       func(dist_zone, part_zones, comm, exclude=paths)
@@ -74,8 +107,9 @@ def dist_tree_to_part_tree_only_labels(dist_tree, part_tree, labels, comm):
   """
   assert isinstance(labels, list)
   include_dict = {label : ['*'] for label in labels}
+  parts_per_block = TE.utils.get_partitioned_zones_per_block(part_tree)
   for d_base, d_zone in PT.get_children_from_labels(dist_tree, ['CGNSBase_t', 'Zone_t'], ancestors=True):
-    p_zones = TE.utils.get_partitioned_zones(part_tree, PT.get_name(d_base) + '/' + PT.get_name(d_zone))
+    p_zones = parts_per_block.get(PT.get_name(d_base) + '/' + PT.get_name(d_zone), [])
     dist_zone_to_part_zones_only(d_zone, p_zones, comm, include_dict)
 
 def dist_tree_to_part_tree_all(dist_tree, part_tree, comm):
@@ -5,7 +5,7 @@ from maia.utils    import par_utils
 from maia.transfer import utils     as te_utils,\
                           protocols as EP
 
-from maia.factory.dist_from_part import discover_nodes_from_matching
+import maia.factory.dist_from_part as DFP
 from .                           import index_exchange as IPTB
 
 def _lngn_to_distri(lngn_list, comm):
@@ -24,8 +24,8 @@ def _discover_wrapper(dist_zone, part_zones, pl_path, data_path, comm):
                           PT.get_child_from_name(n, 'GridConnectivityRegionName') is not None
     ini_zsr_nodes_names = [PT.get_name(n) for n in PT.get_nodes_from_predicate(dist_zone, is_gc_zsr)]
 
-  discover_nodes_from_matching(dist_zone, part_zones, pl_path,   comm, child_list=['GridLocation_t', 'Descriptor_t'])
-  discover_nodes_from_matching(dist_zone, part_zones, data_path, comm)
+  DFP.discover_nodes_from_matching(dist_zone, part_zones, pl_path,   comm, child_list=['GridLocation_t', 'Descriptor_t'])
+  DFP.discover_nodes_from_matching(dist_zone, part_zones, data_path, comm)
   for nodes in PT.iter_children_from_predicates(dist_zone, pl_path, ancestors=True):
     node_path   = '/'.join([PT.get_name(node) for node in nodes])
     if PT.get_node_from_path(nodes[-1], 'PointRange') is None and \
@@ -143,7 +143,7 @@ def part_sol_to_dist_sol(dist_zone, part_zones, comm, include=[], exclude=[], re
   for dist_sol in PT.iter_children_from_label(dist_zone, 'FlowSolution_t'):
     PT.rm_children_from_predicate(dist_sol, lambda n : PT.get_label(n) == 'DataArray_t' and n[1] is None)
   # Update ZoneIterativeData/FlowSolutionPointers
-  discover_nodes_from_matching(dist_zone, part_zones, "ZoneIterativeData_t", comm,
+  DFP.discover_nodes_from_matching(dist_zone, part_zones, "ZoneIterativeData_t", comm,
                                child_list=['FlowSolutionPointers'])
 
 def part_discdata_to_dist_discdata(dist_zone, part_zones, comm, include=[], exclude=[], reduce_func=None):
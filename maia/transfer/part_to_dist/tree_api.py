@@ -2,7 +2,7 @@ import maia.pytree as PT
 
 import maia.transfer as TE
 from . import data_exchange
-from maia.factory.dist_from_part import _recover_base_iterative_data
+import maia.factory.dist_from_part as DFP
 
 __all__ = ['part_zones_to_dist_zone_only',
            'part_zones_to_dist_zone_all',
@@ -57,15 +57,16 @@ def part_tree_to_dist_tree_only_labels(dist_tree, part_tree, labels, comm):
   """
   assert isinstance(labels, list)
   include_dict = {label : ['*'] for label in labels}
+  parts_per_block = TE.utils.get_partitioned_zones_per_block(part_tree)
   for d_base, d_zone in PT.get_children_from_labels(dist_tree, ['CGNSBase_t', 'Zone_t'], ancestors=True):
-    p_zones = TE.utils.get_partitioned_zones(part_tree, PT.get_name(d_base) + '/' + PT.get_name(d_zone))
+    p_zones = parts_per_block.get(PT.get_name(d_base) + '/' + PT.get_name(d_zone), [])
     part_zones_to_dist_zone_only(d_zone, p_zones, comm, include_dict)
 
 def part_tree_to_dist_tree_all(dist_tree, part_tree, comm):
   """ Transfer all the data fields from a partitioned tree
   to the corresponding distributed tree.
   """
-  _recover_base_iterative_data(dist_tree, part_tree, comm)
+  DFP._recover_base_iterative_data(dist_tree, part_tree, comm)
   part_tree_to_dist_tree_only_labels(dist_tree, part_tree, LABELS, comm)
  
 #Possible improvement : dist_tree_to_part_tree only and all API with global paths
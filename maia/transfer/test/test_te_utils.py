@@ -32,6 +32,11 @@ BaseB CGNSBase_t:
   assert PT.get_names(utils.get_partitioned_zones(part_tree, 'BaseA/Zone3')) == []
   assert PT.get_names(utils.get_partitioned_zones(part_tree, 'BaseB/Zone3')) == ['Zone3.P0.N0']
 
+  parts_per_block = utils.get_partitioned_zones_per_block(part_tree)
+  assert list(parts_per_block.keys()) == ['BaseA/Zone1', 'BaseA/Zone2.With.dot', 'BaseB/Zone3']
+  for block_path, part_zones in parts_per_block.items():
+    assert part_zones == utils.get_partitioned_zones(part_tree, block_path)
+
 def test_get_cgns_distribution():
   yt = """
 Zone Zone_t:
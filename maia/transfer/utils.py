@@ -19,6 +19,21 @@ def get_partitioned_zones(part_tree, dist_zone_path):
   else:
     return []
 
+def get_partitioned_zones_per_block(part_tree):
+  """
+  Return a dictionnary associating the path of each distributed zone
+  to the list of the partitioned zones created from it found in part_tree.
+  Zones are read once, so this should be prefered to repeated calls to
+  get_partitioned_zones when looping over all the distributed zones.
+  """
+  parts_per_block = dict()
+  for part_base in PT.get_children_from_label(part_tree, 'CGNSBase_t'):
+    base_name = PT.get_name(part_base)
+    for part in PT.iter_all_Zone_t(part_base):
+      block_path = base_name + '/' + MT.conv.get_part_prefix(PT.get_name(part))
+      parts_per_block.setdefault(block_path, []).append(part)
+  return parts_per_block
+
 def get_cgns_distribution(dist_node, name):
   """
   Return the (partial) distribution array of a distributed zone from
@@ -1,19 +1,10 @@
 import sys
-from mpi4py import MPI
 
-sys_excepthook = sys.excepthook
-def mpi_excepthook(type, value, traceback):
+import maia
 
-  rank = MPI.COMM_WORLD.Get_rank()
-  err_mssg = f"Your application aborted because of an uncaught exception on rank {rank}:\n\n"
-
-  sys.stderr.write(err_mssg)
-  sys_excepthook(type, value, traceback)
-  sys.stderr.write('\n')
-  sys.stdout.flush()
-  sys.stderr.flush()
-
-  MPI.COMM_WORLD.Abort(1)
+# The hook is installed when maia is imported (see maia/__init__.py)
+sys_excepthook = maia._sys_excepthook
+mpi_excepthook = maia._mpi_excepthook
 
 def enable_mpi_excepthook():
   sys.excepthook = mpi_excepthook
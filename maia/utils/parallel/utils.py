@@ -4,11 +4,11 @@ import numpy as np
 import maia.pytree as PT
 
 from maia.utils import py_utils
-from maia       import npy_pdm_gnum_dtype
 
 def gathering_distribution(i_rank, n_elt, comm):
   """
   """
+  from maia import npy_pdm_gnum_dtype # Loading ParaDiGM is deferred until needed
   if   comm.Get_rank()  < i_rank: distrib = np.array([0    , 0    , n_elt ], dtype=npy_pdm_gnum_dtype)
   elif comm.Get_rank() == i_rank: distrib = np.array([0    , n_elt, n_elt ], dtype=npy_pdm_gnum_dtype)
   else                          : distrib = np.array([n_elt, n_elt, n_elt ], dtype=npy_pdm_gnum_dtype)
@@ -17,6 +17,7 @@ def gathering_distribution(i_rank, n_elt, comm):
 def uniform_distribution(n_elt, comm):
   """
   """
+  from maia import npy_pdm_gnum_dtype # Loading ParaDiGM is deferred until needed
   u_dist = py_utils.uniform_distribution_at(n_elt, comm.Get_rank(), comm.Get_size())
   proc_indices = np.empty(3, dtype=npy_pdm_gnum_dtype)
   proc_indices[0] = u_dist[0]
@@ -27,6 +28,7 @@ def uniform_distribution(n_elt, comm):
 def dn_to_distribution(dn_elt, comm):
   """
   """
+  from maia import npy_pdm_gnum_dtype # Loading ParaDiGM is deferred until needed
   distri_full = gather_and_shift(dn_elt, comm, npy_pdm_gnum_dtype)
   distri      = full_to_partial_distribution(distri_full, comm)
   return distri